@@ -5,11 +5,17 @@ from pathlib import Path
 import random
 from PIL import Image
 import os
+from engine.battle_state import ObjectSnapshot, snapshot_object
+from characters.prototypes import get_font
+from engine.timing_wheel import Timer, turn_wheel
 
 if TYPE_CHECKING:
     from characters.base_character import Character
 
-@dataclass
+# Ability icons loaded outside of the stage asset cache, by icon path
+_icon_cache = {}
+
+@dataclass(slots=True)
 class AbilityEffect:
     type: str  # "damage", "heal", "buff", "debuff", "damage_reduction", "heal_over_time", "increase_cooldowns"
     value: int
@@ -28,6 +34,9 @@ class Ability:
     TOOLTIP_HEAL_COLOR = (96, 255, 96)
     TOOLTIP_SHADOW_COLOR = (0, 0, 0, 60)  # Semi-transparent black for shadows
     
+    # Cooldown timer on the turn wheel, see current_cooldown
+    _cooldown_timer: Optional[Timer] = None
+    
     def __init__(self, 
                  name: str,
                  description: str,
@@ -53,7 +62,9 @@ class Ability:
         ability_name = os.path.splitext(os.path.basename(icon_path))[0]
         self.icon = GameEngine.get_cached_image(icon_path, (50, 50), ability_name)
         
-        # If not in cache, load it directly
+        # If not in cache, load it directly (once per icon path)
+        if self.icon is None:
+            self.icon = _icon_cache.get(icon_path)
         if self.icon is None:
             # Load ability icon with high quality scaling
             pil_image = Image.open(str(Path(icon_path)))
@@ -64,13 +75,14 @@ class Ability:
             image_data = pil_image.tobytes()
             self.icon = pygame.image.fromstring(image_data, pil_image.size, 'RGBA')
             self.icon = self.icon.convert_alpha()  # Convert for faster blitting
+            _icon_cache[icon_path] = self.icon
         
         self.position = (0, 0)  # Will be set by the game engine
         
-        # Tooltip fonts with better sizes
-        self.tooltip_font = pygame.font.Font(None, 26)  # Slightly larger for better readability
-        self.tooltip_title_font = pygame.font.Font(None, 32)  # Larger title
-        self.tooltip_detail_font = pygame.font.Font(None, 24)  # Smaller for details
+        # Tooltip fonts with better sizes, shared between abilities
+        self.tooltip_font = get_font(26)  # Slightly larger for better readability
+        self.tooltip_title_font = get_font(32)  # Larger title
+        self.tooltip_detail_font = get_font(24)  # Smaller for details
     
     def handle_mouse_motion(self, mouse_pos: tuple[int, int]):
         ability_rect = pygame.Rect(self.position, self.icon.get_size())
@@ -305,8 +317,23 @@ class Ability:
         self.current_cooldown = self.cooldown
         return True
     
+    @property
+    def current_cooldown(self) -> int:
+        """Turns until the ability is ready, counted down by the turn wheel."""
+        return turn_wheel.remaining(self._cooldown_timer)
+    
+    @current_cooldown.setter
+    def current_cooldown(self, turns: int):
+        if self._cooldown_timer is not None:
+            self._cooldown_timer.cancel()
+        self._cooldown_timer = turn_wheel.schedule(turns, self.on_cooldown_ready) if turns > 0 else None
+    
+    def on_cooldown_ready(self):
+        """Called on the turn the cooldown runs out."""
+        pass
+    
     def update(self):
-        """Update ability state. Cooldowns are handled by the game engine."""
+        """Update ability state. Cooldowns are counted down by the turn wheel."""
         pass
     
     def draw(self, screen: pygame.Surface):
@@ -375,6 +402,8 @@ class Ability:
 
 @dataclass
 class StatusEffect:
+    __slots__ = ("type", "value", "duration", "icon", "heal_per_turn")
+    
     def __init__(self, type: str, value: int, duration: int, icon: pygame.Surface = None, heal_per_turn: int = 0):
         self.type = type
         self.value = value
@@ -384,4 +413,10 @@ class StatusEffect:
     
     def update(self) -> bool:
         self.duration -= 1
-        return self.duration > 0 
\ No newline at end of file
+        return self.duration > 0
+
+    def snapshot(self) -> ObjectSnapshot:
+        return snapshot_object(self)
+
+    def restore(self, snapshot: ObjectSnapshot):
+        snapshot.restore() 
\ No newline at end of file
@@ -1,6 +1,9 @@
 import pygame
+from engine.battle_state import ObjectSnapshot, snapshot_object
 
 class StatusEffect:
+    __slots__ = ("type", "value", "duration", "icon", "name", "description")
+    
     def __init__(self, type: str, value: float, duration: int, icon: pygame.Surface):
         self.type = type
         self.value = value
@@ -14,6 +17,14 @@ class StatusEffect:
         self.duration -= 1
         return self.duration > 0
     
+    def snapshot(self) -> ObjectSnapshot:
+        """Take an immutable snapshot of the effect's duration and values"""
+        return snapshot_object(self)
+    
+    def restore(self, snapshot: ObjectSnapshot):
+        """Restore the effect from a snapshot taken with snapshot()"""
+        snapshot.restore()
+    
     def get_tooltip_title(self) -> str:
         """Return the title to show in the buff tooltip"""
         return self.name
@@ -1,4 +1,5 @@
 from characters.base_character import Character, Stats
+from characters import image_filters
 from abilities.base_ability import Ability, AbilityEffect
 from characters.shadowfin_boss import Piranha
 from pathlib import Path
@@ -258,8 +259,7 @@ def create_atlantean_christie():
                         # Store original image and create stunned version (visual feedback)
                         self.original_image = target.image
                         # Apply a slight gray tint to show stunned state
-                        self.stunned_image = target.image.copy()
-                        self.stunned_image.fill((150, 150, 150), special_flags=pygame.BLEND_MULT)
+                        self.stunned_image = image_filters.apply(target.original_image, "tint", color=(150, 150, 150))
                         target.image = self.stunned_image
                         
                         # Store original ability use functions and draw methods
@@ -1,109 +1,18 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
+from typing import List, Tuple, Optional, TYPE_CHECKING
 import pygame
-from pathlib import Path
 import math
 import random
 from PIL import Image
+from characters.prototypes import load_character_image, get_font
+from characters.floating_text import FloatingTextPool
+from characters import image_filters
+from engine.battle_state import CharacterSnapshot, ObjectSnapshot, snapshot_character, snapshot_object
 
 if TYPE_CHECKING:
     from abilities.base_ability import Ability
 
-@dataclass
-class DamageText:
-    # Class-level caches
-    _text_cache = {}
-    _shadow_cache = {}
-    _scaled_cache = {}
-    _max_cache_size = 50  # Maximum number of cached entries per cache
-    _max_active_texts = 8  # Maximum number of active floating texts per character
-    _scale_precision = 2  # Round scale to 2 decimal places to reduce unique cache entries
-    
-    value: int
-    position: Tuple[float, float]
-    velocity: float = -3.0  # Faster upward movement
-    lifetime: int = 45  # Shorter, snappier duration
-    alpha: int = 255
-    scale: float = 1.0  # For bounce effect
-    color: Tuple[int, int, int] = (255, 80, 80)  # Default to damage color
-    _rendered_text: Optional[pygame.Surface] = None
-    _rendered_shadow: Optional[pygame.Surface] = None
-    _scaled_text: Optional[pygame.Surface] = None
-    _scaled_shadow: Optional[pygame.Surface] = None
-    _last_scale: float = 1.0
-    
-    @classmethod
-    def _clean_cache(cls, cache_dict):
-        """Remove oldest entries if cache is too large."""
-        while len(cache_dict) > cls._max_cache_size:
-            cache_dict.pop(next(iter(cache_dict)))
-    
-    def render_text(self, font: pygame.font.Font):
-        """Pre-render the text surface and shadow for reuse."""
-        key = (str(self.value), self.color)
-        
-        # Try to get from cache first
-        if key in DamageText._text_cache:
-            self._rendered_text = DamageText._text_cache[key]
-            self._rendered_shadow = DamageText._shadow_cache[key]
-            return
-        
-        # Create new surfaces if not in cache
-        self._rendered_text = font.render(str(self.value), True, self.color)
-        self._rendered_shadow = font.render(str(self.value), True, (0, 0, 0))
-        
-        # Add to cache
-        DamageText._text_cache[key] = self._rendered_text
-        DamageText._shadow_cache[key] = self._rendered_shadow
-        
-        # Clean cache if needed
-        self._clean_cache(DamageText._text_cache)
-        self._clean_cache(DamageText._shadow_cache)
-    
-    def get_scaled_surfaces(self, scale_func) -> Tuple[pygame.Surface, pygame.Surface]:
-        """Get or create scaled surfaces."""
-        if self._rendered_text is None:
-            return None, None
-            
-        # Round scale to reduce unique cache entries
-        rounded_scale = round(self.scale, self._scale_precision)
-        
-        # Create cache key
-        key = (id(self._rendered_text), rounded_scale)
-        
-        # Check if we have cached scaled surfaces
-        if key in DamageText._scaled_cache and abs(self._last_scale - rounded_scale) <= 0.01:
-            return DamageText._scaled_cache[key]
-        
-        # Create new scaled surfaces
-        scaled_text = scale_func(
-            self._rendered_text,
-            (int(self._rendered_text.get_width() * rounded_scale),
-             int(self._rendered_text.get_height() * rounded_scale))
-        )
-        scaled_shadow = scale_func(
-            self._rendered_shadow,
-            (int(self._rendered_shadow.get_width() * rounded_scale),
-             int(self._rendered_shadow.get_height() * rounded_scale))
-        )
-        
-        # Cache the new surfaces
-        DamageText._scaled_cache[key] = (scaled_text, scaled_shadow)
-        self._last_scale = rounded_scale
-        
-        # Clean cache if needed
-        self._clean_cache(DamageText._scaled_cache)
-        
-        return scaled_text, scaled_shadow
-    
-    def cleanup(self):
-        """Clean up surfaces when text is removed."""
-        self._rendered_text = None
-        self._rendered_shadow = None
-        self._scaled_text = None
-        self._scaled_shadow = None
-
-@dataclass
+@dataclass(slots=True)
 class Stats:
     max_hp: int
     current_hp: int
@@ -115,6 +24,8 @@ class Stats:
 
 @dataclass
 class StatusEffect:
+    __slots__ = ("type", "value", "duration", "icon", "heal_per_turn")
+    
     def __init__(self, type: str, value: int, duration: int, icon: Optional[pygame.Surface] = None):
         self.type = type
         self.value = value
@@ -126,6 +37,12 @@ class StatusEffect:
         self.duration -= 1
         return self.duration > 0
 
+    def snapshot(self) -> ObjectSnapshot:
+        return snapshot_object(self)
+
+    def restore(self, snapshot: ObjectSnapshot):
+        snapshot.restore()
+
 class Character:
     # Colors
     HEALTH_BG_COLOR = (40, 44, 52)
@@ -137,12 +54,18 @@ class Character:
     ABILITY_BORDER_COLOR = (80, 84, 96)
     DAMAGE_COLOR = (255, 80, 80)
     HEAL_COLOR = (80, 255, 120)
+    MAX_FLOATING_TEXTS = 8  # Maximum number of active floating texts per character
+    GLOW_SIZE = 8  # Selection glow around the character image
+    EFFECT_ICON_SIZE = 48  # Buff and debuff icons
+    DEBUFF_ROW_OFFSET = EFFECT_ICON_SIZE + 24  # Debuffs go below buffs and their durations
     
     # Class-level caches
-    _flash_surface_cache = {}
     _bar_cache = {}  # Cache for HP/mana bars
     _icon_cache = {}  # Cache for buff/debuff icons
     _font_cache = {}  # Cache for rendered text
+    _ability_icon_cache = {}  # (id(icon), size) -> (icon, scaled icon), keeps the source alive so ids stay unique
+    _glow_cache = {}  # Selection glow per image size
+    _overlay_cache = {}  # Cooldown overlay per icon size
     
     def __init__(self, name: str, stats: Stats, image_path: str):
         self.name = name
@@ -150,21 +73,14 @@ class Character:
         self.abilities: List[Ability] = []
         self.buffs: List[StatusEffect] = []
         self.debuffs = []
-        self.floating_texts: List[DamageText] = []
+        self.floating_texts = FloatingTextPool(self.MAX_FLOATING_TEXTS)
         self.inventory = None  # Will be set later
         self.loot_processed = False  # Initialize loot_processed flag
+        self._last_snapshot: Optional[CharacterSnapshot] = None
         
-        # Load and scale character image using PIL for high quality resizing
-        pil_image = Image.open(str(Path(image_path)))
-        pil_image = pil_image.convert('RGBA')  # Ensure RGBA mode for transparency
-        pil_image = pil_image.resize((240, 333), Image.Resampling.LANCZOS)  # High quality resize
-        
-        # Convert PIL image to Pygame surface
-        image_data = pil_image.tobytes()
-        pygame_image = pygame.image.fromstring(image_data, pil_image.size, 'RGBA')
-        
-        self.image = pygame_image
-        self.original_image = self.image.copy()
+        # Scaled image is shared by all characters using it, only read from original_image
+        self.original_image = load_character_image(image_path)
+        self.image = self.original_image.copy()
         
         # Position will be set by the game engine
         self.position = (0, 0)
@@ -182,22 +98,24 @@ class Character:
         # Pre-render bar backgrounds
         self._create_bar_backgrounds()
         
-        # Load fonts
-        self.damage_font = pygame.font.Font(None, 36)
-        self.hp_font = pygame.font.Font(None, 24)
+        # Shared fonts
+        self.hp_font = get_font(24)
         
-        # Cache keys for optimization
-        self._last_hp_text = None
-        self._last_mana_text = None
+        # Status widgets, rebuilt only when what they show changes
+        self._status_bars = None
+        self._status_bars_key = None
+        self._effect_strip = None
+        self._effect_strip_key = None
         
         # Damage flash effect
         self.flash_duration = 10  # Shorter, snappier flash
         self.flash_timer = 0
         self.is_flashing = False
-        
-        # Floating text batch
-        self.floating_text_batch: Dict[int, List[DamageText]] = {}  # Group texts by frame
-        self.current_frame = 0
+        # Pulsing red frames indexed by flash_timer, shared by every character with this image
+        self.flash_frames = image_filters.flash_frames(
+            self.original_image,
+            tuple(int((math.sin(t * 0.8) * 0.5 + 0.5) * 255) for t in range(self.flash_duration))
+        )
     
     def _create_bar_backgrounds(self):
         """Create cached bar backgrounds."""
@@ -256,6 +174,127 @@ class Character:
                 Character._icon_cache.pop(next(iter(Character._icon_cache)))
         return Character._icon_cache[key]
     
+    def _get_selection_glow(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Get the cached selection highlight for an image size, glow layers and border."""
+        if size not in Character._glow_cache:
+            width, height = size
+            glow = pygame.Surface((width + self.GLOW_SIZE * 2, height + self.GLOW_SIZE * 2), pygame.SRCALPHA)
+            # Draw multiple layers of decreasing size for a smooth glow effect
+            for i in range(4):
+                alpha = 40 - i * 10  # Decrease alpha for outer layers
+                layer_rect = glow.get_rect().inflate(-i * 2, -i * 2)
+                layer = pygame.Surface(layer_rect.size, pygame.SRCALPHA)
+                pygame.draw.rect(layer, (255, 255, 100, alpha), layer.get_rect(), border_radius=10)
+                glow.blit(layer, layer_rect)
+            
+            # Draw a thin bright border
+            border_rect = pygame.Rect(self.GLOW_SIZE - 2, self.GLOW_SIZE - 2, width + 4, height + 4)
+            pygame.draw.rect(glow, (255, 255, 100), border_rect, width=2, border_radius=8)
+            Character._glow_cache[size] = glow
+        return Character._glow_cache[size]
+    
+    def _get_cooldown_overlay(self, size: int) -> pygame.Surface:
+        """Get the cached dark overlay of abilities on cooldown."""
+        if size not in Character._overlay_cache:
+            overlay = pygame.Surface((size, size), pygame.SRCALPHA)
+            overlay.fill((20, 20, 20, 200))
+            Character._overlay_cache[size] = overlay
+        return Character._overlay_cache[size]
+    
+    def _get_status_bars(self) -> pygame.Surface:
+        """Get the HP and mana bars with their text, rebuilt only when HP or mana change."""
+        has_mana = hasattr(self.stats, 'max_mana') and self.stats.max_mana > 0
+        key = (self.stats.current_hp, self.stats.max_hp,
+               self.stats.current_mana if has_mana else None, self.stats.max_mana if has_mana else None)
+        if key == self._status_bars_key:
+            return self._status_bars
+        
+        hp_ratio = min(self.stats.current_hp / self.stats.max_hp, 1.5)
+        hp_fill_width = max(0, int(self.HP_BAR_WIDTH * hp_ratio))
+        height = self.HP_BAR_HEIGHT + 4
+        if has_mana:
+            height += self.MANA_BAR_HEIGHT + 5
+        # Overheal draws past the end of the bar
+        bars = pygame.Surface((max(self.HP_BAR_WIDTH, hp_fill_width, self.MANA_BAR_WIDTH) + 4, height), pygame.SRCALPHA)
+        
+        # HP bar background
+        bars.blit(Character._bar_cache[("hp_bg", self.HP_BAR_WIDTH, self.HP_BAR_HEIGHT)], (0, 0))
+        
+        # HP bar fill, color based on percentage
+        if hp_ratio > 1:  # Overheal
+            bar_color = (100, 255, 100)  # Bright green
+        else:
+            r = min(255, int(255 * (1 - hp_ratio) * 2))
+            g = min(255, int(255 * hp_ratio * 2))
+            bar_color = (r, g, 50)
+        pygame.draw.rect(bars, bar_color, pygame.Rect(2, 2, hp_fill_width, self.HP_BAR_HEIGHT), border_radius=4)
+        
+        # HP text
+        hp_surface = self._get_text_surface(f"{self.stats.current_hp}/{self.stats.max_hp}", (255, 255, 255))
+        bars.blit(hp_surface, (2 + (self.HP_BAR_WIDTH - hp_surface.get_width()) // 2,
+                               2 + (self.HP_BAR_HEIGHT - hp_surface.get_height()) // 2))
+        
+        if has_mana:
+            mana_ratio = self.stats.current_mana / self.stats.max_mana
+            mana_y = self.HP_BAR_HEIGHT + 5
+            
+            # Mana bar background and fill
+            bars.blit(Character._bar_cache[("mana_bg", self.MANA_BAR_WIDTH, self.MANA_BAR_HEIGHT)], (0, mana_y))
+            pygame.draw.rect(bars, self.MANA_COLOR,
+                             pygame.Rect(2, mana_y + 2, max(0, int(self.MANA_BAR_WIDTH * mana_ratio)), self.MANA_BAR_HEIGHT),
+                             border_radius=4)
+            
+            # Mana text
+            mana_surface = self._get_text_surface(f"{self.stats.current_mana}/{self.stats.max_mana}", (255, 255, 255))
+            bars.blit(mana_surface, (2 + (self.MANA_BAR_WIDTH - mana_surface.get_width()) // 2,
+                                     mana_y + 2 + (self.MANA_BAR_HEIGHT - mana_surface.get_height()) // 2))
+        
+        self._status_bars = bars
+        self._status_bars_key = key
+        return bars
+    
+    def _get_effect_strip(self) -> pygame.Surface:
+        """Get the buff and debuff icons with durations, rebuilt only when an icon or duration changes."""
+        # Icons are part of the key so they stay alive and can't be mistaken for new ones
+        key = (tuple((buff.icon, getattr(buff, 'duration', None)) for buff in self.buffs),
+               tuple((debuff.icon, getattr(debuff, 'duration', None)) for debuff in self.debuffs))
+        if key == self._effect_strip_key:
+            return self._effect_strip
+        
+        columns = max(len(self.buffs), len(self.debuffs), 1)
+        strip = pygame.Surface((columns * (self.EFFECT_ICON_SIZE + 4),
+                                self.DEBUFF_ROW_OFFSET + self.EFFECT_ICON_SIZE + 4 + self.hp_font.get_linesize()),
+                               pygame.SRCALPHA)
+        for row_y, effects in ((0, self.buffs), (self.DEBUFF_ROW_OFFSET, self.debuffs)):
+            for i, effect in enumerate(effects):
+                if not effect.icon:
+                    continue
+                icon_x = i * (self.EFFECT_ICON_SIZE + 4)  # 4 pixels spacing
+                strip.blit(self._get_scaled_icon(effect.icon, self.EFFECT_ICON_SIZE), (icon_x, row_y))
+                
+                # Draw duration
+                text_surface = self._get_text_surface(str(effect.duration), (255, 255, 255))
+                strip.blit(text_surface, (icon_x + (self.EFFECT_ICON_SIZE - text_surface.get_width()) // 2,
+                                          row_y + self.EFFECT_ICON_SIZE + 4))
+        
+        self._effect_strip = strip
+        self._effect_strip_key = key
+        return strip
+    
+    def own_image(self) -> pygame.Surface:
+        """Get self.image for changing in place, copying it first if it's a shared surface."""
+        if self.image is self.original_image or any(self.image is frame for frame in self.flash_frames):
+            self.image = self.image.copy()
+        return self.image
+    
+    def show_floating_text(self, value, color: Tuple[int, int, int], force: bool = False,
+                           position: Optional[Tuple[float, float]] = None) -> bool:
+        """Float a value up from the character, centered on it unless a position is given."""
+        if position is None:
+            position = (self.position[0] + self.image.get_width() // 2,
+                        self.position[1] + self.image.get_height() // 2)
+        return self.floating_texts.spawn(value, position, color, force)
+    
     @staticmethod
     def high_quality_scale(surface: pygame.Surface, size: tuple) -> pygame.Surface:
         """Scale a Pygame surface using high quality PIL resizing."""
@@ -271,7 +310,12 @@ class Character:
         
     def add_ability(self, ability):
         if len(self.abilities) < 4:
-            ability.icon = pygame.transform.scale(ability.icon, (self.ABILITY_ICON_SIZE, self.ABILITY_ICON_SIZE))
+            # Scaled icons are shared by every instance of the ability
+            key = (id(ability.icon), self.ABILITY_ICON_SIZE)
+            if key not in Character._ability_icon_cache:
+                Character._ability_icon_cache[key] = (ability.icon, pygame.transform.scale(
+                    ability.icon, (self.ABILITY_ICON_SIZE, self.ABILITY_ICON_SIZE)))
+            ability.icon = Character._ability_icon_cache[key][1]
             self.abilities.append(ability)
     
     def is_alive(self) -> bool:
@@ -295,25 +339,8 @@ class Character:
         
         self.stats.current_hp -= final_damage
         
-        # Create damage text only if we don't have too many active texts
-        total_active_texts = len(self.floating_texts)
-        for batch in self.floating_text_batch.values():
-            total_active_texts += len(batch)
-        
-        if total_active_texts < DamageText._max_active_texts:
-            # Create damage text
-            damage_text = DamageText(
-                value=final_damage,
-                position=(self.position[0] + self.image.get_width() // 2,
-                         self.position[1] + self.image.get_height() // 2),
-                color=self.DAMAGE_COLOR
-            )
-            damage_text.render_text(self.damage_font)  # Pre-render the text
-            
-            # Add to current frame's batch
-            if self.current_frame not in self.floating_text_batch:
-                self.floating_text_batch[self.current_frame] = []
-            self.floating_text_batch[self.current_frame].append(damage_text)
+        # Dropped if too many texts are already on screen
+        self.show_floating_text(final_damage, self.DAMAGE_COLOR)
         
         # Start damage flash effect
         self.flash_timer = self.flash_duration
@@ -325,7 +352,7 @@ class Character:
             print(f"Loot processed flag: {self.loot_processed}")
             
             # Make the character invisible
-            self.image.set_alpha(0)
+            self.own_image().set_alpha(0)
             # Log death message
             from engine.game_engine import GameEngine
             if GameEngine.instance:
@@ -372,19 +399,8 @@ class Character:
         heal_amount = min(amount, effective_max_hp - self.stats.current_hp)
         self.stats.current_hp += heal_amount
         
-        # Create heal text
-        heal_text = DamageText(
-            value=heal_amount,
-            position=(self.position[0] + self.image.get_width() // 2,
-                     self.position[1] + self.image.get_height() // 2),
-            color=self.HEAL_COLOR
-        )
-        heal_text.render_text(self.damage_font)  # Pre-render the text
-        
-        # Add to current frame's batch
-        if self.current_frame not in self.floating_text_batch:
-            self.floating_text_batch[self.current_frame] = []
-        self.floating_text_batch[self.current_frame].append(heal_text)
+        # Heal text replaces the oldest text if too many are on screen
+        self.show_floating_text(heal_amount, self.HEAL_COLOR, force=True)
         
         return heal_amount
     
@@ -432,69 +448,14 @@ class Character:
         # Update damage flash with pulsing effect
         if self.flash_timer > 0:
             self.flash_timer -= 1
-            flash_intensity = int((math.sin(self.flash_timer * 0.8) * 0.5 + 0.5) * 255)
-            
-            # Get or create flash surface from cache
-            size_key = (self.image.get_width(), self.image.get_height())
-            if size_key not in Character._flash_surface_cache:
-                Character._flash_surface_cache[size_key] = pygame.Surface(size_key).convert_alpha()
-            
-            flash_surface = Character._flash_surface_cache[size_key]
-            flash_surface.fill((255, 0, 0, flash_intensity))
-            
-            if not hasattr(self, 'flash_image'):
-                self.flash_image = self.original_image.copy()
-            else:
-                self.flash_image.blit(self.original_image, (0, 0))
-            
-            self.flash_image.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            self.image = self.flash_image
+            self.image = self.flash_frames[self.flash_timer]
             
             if self.flash_timer == 0:
                 self.is_flashing = False
                 self.image = self.original_image.copy()
         
         # Update floating damage texts with bounce effect
-        self.current_frame += 1
-        
-        # Add any batched texts from 3 frames ago to the active texts
-        if self.current_frame - 3 in self.floating_text_batch:
-            self.floating_texts.extend(self.floating_text_batch[self.current_frame - 3])
-            del self.floating_text_batch[self.current_frame - 3]
-        
-        # Update active texts
-        new_texts = []
-        for text in self.floating_texts:
-            text.position = (text.position[0], text.position[1] + text.velocity)
-            text.lifetime -= 1
-            
-            if text.lifetime <= 0:
-                text.cleanup()  # Clean up surfaces when text expires
-                continue
-            
-            # Bounce effect
-            progress = 1 - (text.lifetime / 45)  # Normalized time
-            text.scale = 1 + math.sin(progress * math.pi) * 0.3  # Scale varies from 1.0 to 1.3
-            
-            # Fade out
-            if text.lifetime < 20:
-                text.alpha = int((text.lifetime / 20) * 255)
-            
-            new_texts.append(text)
-        
-        self.floating_texts = new_texts
-        
-        # Clean up old batches
-        current_time = self.current_frame
-        old_batches = {k: v for k, v in self.floating_text_batch.items() 
-                      if current_time - k > 10}
-        # Clean up surfaces in old batches
-        for batch in old_batches.values():
-            for text in batch:
-                text.cleanup()
-        # Remove old batches
-        self.floating_text_batch = {k: v for k, v in self.floating_text_batch.items() 
-                                  if current_time - k <= 10}
+        self.floating_texts.update()
     
     def end_turn(self):
         """Update buffs and debuffs at the end of turn"""
@@ -512,6 +473,18 @@ class Character:
         self.buffs = [buff for buff in self.buffs if buff.update()]
         self.debuffs = [debuff for debuff in self.debuffs if debuff.update()]
     
+    def snapshot(self) -> CharacterSnapshot:
+        """Take an immutable snapshot, sharing unchanged parts with the previous one"""
+        self._last_snapshot = snapshot_character(self, self._last_snapshot)
+        return self._last_snapshot
+    
+    def restore(self, snapshot: CharacterSnapshot):
+        """Restore stats, cooldowns and effects from a snapshot of this character"""
+        if snapshot.character is not self:
+            raise ValueError(f"Snapshot of {snapshot.name} can't be restored onto {self.name}")
+        snapshot.restore()
+        self._last_snapshot = snapshot
+    
     def draw(self, screen: pygame.Surface):
         # Don't draw anything if the character is dead
         if not self.is_alive():
@@ -522,108 +495,18 @@ class Character:
         if (GameEngine.instance and 
             GameEngine.instance.game_state.selected_character_index < len(GameEngine.instance.stage_manager.player_characters) and
             GameEngine.instance.stage_manager.player_characters[GameEngine.instance.game_state.selected_character_index] == self):
-            # Draw a modern highlight effect around the character
-            # First draw a larger outer glow
-            glow_size = 8
-            glow_rect = pygame.Rect(self.position[0] - glow_size, self.position[1] - glow_size,
-                                  self.image.get_width() + glow_size * 2, self.image.get_height() + glow_size * 2)
-            # Draw multiple layers of decreasing size for a smooth glow effect
-            for i in range(4):
-                alpha = 40 - i * 10  # Decrease alpha for outer layers
-                current_rect = glow_rect.inflate(-i * 2, -i * 2)
-                glow_surface = pygame.Surface((current_rect.width, current_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(glow_surface, (255, 255, 100, alpha), glow_surface.get_rect(), border_radius=10)
-                screen.blit(glow_surface, current_rect)
-            
-            # Draw a thin bright border
-            border_rect = pygame.Rect(self.position[0] - 2, self.position[1] - 2,
-                                    self.image.get_width() + 4, self.image.get_height() + 4)
-            pygame.draw.rect(screen, (255, 255, 100), border_rect, width=2, border_radius=8)
+            glow = self._get_selection_glow(self.image.get_size())
+            screen.blit(glow, (self.position[0] - self.GLOW_SIZE, self.position[1] - self.GLOW_SIZE))
         
         # Draw character image
         screen.blit(self.image, self.position)
         
         # Draw floating texts
-        for text in self.floating_texts:
-            if text._rendered_text is None:
-                text.render_text(self.damage_font)
-            
-            # Get scaled surfaces (cached)
-            scaled_text, scaled_shadow = text.get_scaled_surfaces(self.high_quality_scale)
-            if scaled_text is None or scaled_shadow is None:
-                continue
-            
-            # Set alpha for fade out
-            if text.alpha != 255:  # Only set alpha if it's not fully opaque
-                scaled_text.set_alpha(text.alpha)
-                scaled_shadow.set_alpha(text.alpha)
-            
-            # Calculate positions
-            text_pos = (text.position[0] - scaled_text.get_width() // 2,
-                       text.position[1] - scaled_text.get_height() // 2)
-            shadow_pos = (text_pos[0] + 2, text_pos[1] + 2)
-            
-            # Draw shadow then text
-            screen.blit(scaled_shadow, shadow_pos)
-            screen.blit(scaled_text, text_pos)
+        self.floating_texts.draw(screen)
         
-        # Draw HP bar
-        hp_ratio = min(self.stats.current_hp / self.stats.max_hp, 1.5)
+        # Draw HP and mana bars
         hp_bar_pos = (self.position[0], self.position[1] + self.image.get_height() + 10)
-        
-        # Draw HP bar background
-        hp_bg_key = ("hp_bg", self.HP_BAR_WIDTH, self.HP_BAR_HEIGHT)
-        screen.blit(Character._bar_cache[hp_bg_key], 
-                   (hp_bar_pos[0]-2, hp_bar_pos[1]-2))
-        
-        # Draw HP bar fill
-        hp_fill_rect = pygame.Rect(hp_bar_pos[0], hp_bar_pos[1],
-                                 int(self.HP_BAR_WIDTH * hp_ratio), self.HP_BAR_HEIGHT)
-        # Calculate health bar color based on percentage
-        if hp_ratio > 1:  # Overheal
-            bar_color = (100, 255, 100)  # Bright green
-        else:
-            r = min(255, int(255 * (1 - hp_ratio) * 2))
-            g = min(255, int(255 * hp_ratio * 2))
-            bar_color = (r, g, 50)
-        pygame.draw.rect(screen, bar_color, hp_fill_rect, border_radius=4)
-        
-        # Draw HP text
-        hp_text = f"{self.stats.current_hp}/{self.stats.max_hp}"
-        if hp_text != self._last_hp_text:
-            self._last_hp_text = hp_text
-            hp_surface = self._get_text_surface(hp_text, (255, 255, 255))
-        else:
-            hp_surface = self._get_text_surface(hp_text, (255, 255, 255))
-        hp_text_pos = (hp_bar_pos[0] + (self.HP_BAR_WIDTH - hp_surface.get_width()) // 2,
-                      hp_bar_pos[1] + (self.HP_BAR_HEIGHT - hp_surface.get_height()) // 2)
-        screen.blit(hp_surface, hp_text_pos)
-        
-        # Draw mana bar if character has mana
-        if hasattr(self.stats, 'max_mana') and self.stats.max_mana > 0:
-            mana_ratio = self.stats.current_mana / self.stats.max_mana
-            mana_bar_pos = (hp_bar_pos[0], hp_bar_pos[1] + self.HP_BAR_HEIGHT + 5)
-            
-            # Draw mana bar background
-            mana_bg_key = ("mana_bg", self.MANA_BAR_WIDTH, self.MANA_BAR_HEIGHT)
-            screen.blit(Character._bar_cache[mana_bg_key], 
-                       (mana_bar_pos[0]-2, mana_bar_pos[1]-2))
-            
-            # Draw mana bar fill
-            mana_fill_rect = pygame.Rect(mana_bar_pos[0], mana_bar_pos[1],
-                                       int(self.MANA_BAR_WIDTH * mana_ratio), self.MANA_BAR_HEIGHT)
-            pygame.draw.rect(screen, self.MANA_COLOR, mana_fill_rect, border_radius=4)
-            
-            # Draw mana text
-            mana_text = f"{self.stats.current_mana}/{self.stats.max_mana}"
-            if mana_text != self._last_mana_text:
-                self._last_mana_text = mana_text
-                mana_surface = self._get_text_surface(mana_text, (255, 255, 255))
-            else:
-                mana_surface = self._get_text_surface(mana_text, (255, 255, 255))
-            mana_text_pos = (mana_bar_pos[0] + (self.MANA_BAR_WIDTH - mana_surface.get_width()) // 2,
-                           mana_bar_pos[1] + (self.MANA_BAR_HEIGHT - mana_surface.get_height()) // 2)
-            screen.blit(mana_surface, mana_text_pos)
+        screen.blit(self._get_status_bars(), (hp_bar_pos[0] - 2, hp_bar_pos[1] - 2))
         
         # Draw ability icons
         ability_y = hp_bar_pos[1] + self.HP_BAR_HEIGHT + 5
@@ -654,9 +537,7 @@ class Character:
             
             # Draw cooldown or locked overlay
             if not ability.is_available() or (is_locked and ability.name != "Spiritwalk"):
-                cooldown_surface = pygame.Surface((self.ABILITY_ICON_SIZE, self.ABILITY_ICON_SIZE), pygame.SRCALPHA)
-                cooldown_surface.fill((20, 20, 20, 200))
-                screen.blit(cooldown_surface, ability.position)
+                screen.blit(self._get_cooldown_overlay(self.ABILITY_ICON_SIZE), ability.position)
                 
                 if not ability.is_available():
                     cooldown_text = str(ability.current_cooldown)
@@ -672,89 +553,58 @@ class Character:
                     screen.blit(text_surface, text_pos)
         
         # Draw buff/debuff icons
-        BUFF_SIZE = 48  # Increased size for buff icons
-        buff_x = self.position[0]  # Start from left edge
-        buff_y = self.position[1]
-        
-        # Colors for tooltips
-        TOOLTIP_BG_COLOR = (32, 36, 44, 240)  # Dark background with slight transparency
-        TOOLTIP_BORDER_COLOR = (64, 68, 76)
-        TOOLTIP_INNER_BORDER_COLOR = (80, 84, 92)
-        TOOLTIP_TEXT_COLOR = (220, 220, 220)
-        TOOLTIP_TITLE_COLOR = (255, 255, 255)
-        TOOLTIP_SHADOW_COLOR = (0, 0, 0, 60)
-        
-        # Track mouse position for tooltips
+        buff_x, buff_y = self.position
+        strip = self._get_effect_strip()
+        screen.blit(strip, (buff_x, buff_y))
+        
+        # Draw tooltip if a buff or debuff is hovered
         mouse_pos = pygame.mouse.get_pos()
+        if not strip.get_rect(topleft=(buff_x, buff_y)).collidepoint(mouse_pos):
+            return
         
-        # Draw buffs in top-left corner
         for i, buff in enumerate(self.buffs):
-            if buff.icon:
-                scaled_icon = self._get_scaled_icon(buff.icon, BUFF_SIZE)
-                icon_x = buff_x + i * (BUFF_SIZE + 4)  # 4 pixels spacing
-                buff_rect = pygame.Rect(icon_x, buff_y, BUFF_SIZE, BUFF_SIZE)
-                screen.blit(scaled_icon, (icon_x, buff_y))
-                
-                # Draw duration
-                duration_text = str(buff.duration)
-                text_surface = self._get_text_surface(duration_text, (255, 255, 255))
-                text_pos = (icon_x + (BUFF_SIZE - text_surface.get_width()) // 2,
-                          buff_y + BUFF_SIZE + 4)
-                screen.blit(text_surface, text_pos)
+            buff_rect = pygame.Rect(buff_x + i * (self.EFFECT_ICON_SIZE + 4), buff_y,
+                                    self.EFFECT_ICON_SIZE, self.EFFECT_ICON_SIZE)
+            if buff.icon and buff_rect.collidepoint(mouse_pos):
+                # Prepare tooltip text
+                if buff.type == "damage_reduction" or buff.type == "ice_wall":
+                    title = "Ice Wall"
+                    description = f"Reduces damage taken by {buff.value}%"
+                    if hasattr(buff, 'duration'):
+                        description += f"\n{buff.duration} turns remaining"
+                elif buff.type == "heal_over_time":
+                    title = "Healing"
+                    description = f"Heals {buff.value} HP per turn"
+                elif buff.type == "defense":
+                    title = "Defense Up"
+                    description = f"Increases armor by {buff.value}"
+                elif buff.type == "stealth":
+                    title = buff.get_tooltip_title() if hasattr(buff, 'get_tooltip_title') else "Stealth"
+                    description = buff.get_tooltip_text() if hasattr(buff, 'get_tooltip_text') else "Character is stealthed"
+                elif buff.type == "custom":
+                    title = buff.get_tooltip_title() if hasattr(buff, 'get_tooltip_title') else buff.name
+                    description = buff.get_tooltip_text() if hasattr(buff, 'get_tooltip_text') else buff.description
+                else:
+                    title = "Buff"
+                    description = f"Increases stats by {buff.value}"
                 
-                # Draw tooltip if buff is hovered
-                if buff_rect.collidepoint(mouse_pos):
-                    # Prepare tooltip text
-                    if buff.type == "damage_reduction" or buff.type == "ice_wall":
-                        title = "Ice Wall"
-                        description = f"Reduces damage taken by {buff.value}%"
-                        if hasattr(buff, 'duration'):
-                            description += f"\n{buff.duration} turns remaining"
-                    elif buff.type == "heal_over_time":
-                        title = "Healing"
-                        description = f"Heals {buff.value} HP per turn"
-                    elif buff.type == "defense":
-                        title = "Defense Up"
-                        description = f"Increases armor by {buff.value}"
-                    elif buff.type == "stealth":
-                        title = buff.get_tooltip_title() if hasattr(buff, 'get_tooltip_title') else "Stealth"
-                        description = buff.get_tooltip_text() if hasattr(buff, 'get_tooltip_text') else "Character is stealthed"
-                    elif buff.type == "custom":
-                        title = buff.get_tooltip_title() if hasattr(buff, 'get_tooltip_title') else buff.name
-                        description = buff.get_tooltip_text() if hasattr(buff, 'get_tooltip_text') else buff.description
-                    else:
-                        title = "Buff"
-                        description = f"Increases stats by {buff.value}"
-                    
-                    self._draw_tooltip(screen, title, description, buff_rect)
-        
-        # Draw debuffs below buffs
-        debuff_y = buff_y + BUFF_SIZE + 24  # More spacing between buffs and debuffs
+                self._draw_tooltip(screen, title, description, buff_rect)
+        
+        # Debuffs are below buffs
+        debuff_y = buff_y + self.DEBUFF_ROW_OFFSET
         for i, debuff in enumerate(self.debuffs):
-            if debuff.icon:
-                scaled_icon = self._get_scaled_icon(debuff.icon, BUFF_SIZE)
-                icon_x = buff_x + i * (BUFF_SIZE + 4)
-                debuff_rect = pygame.Rect(icon_x, debuff_y, BUFF_SIZE, BUFF_SIZE)
-                screen.blit(scaled_icon, (icon_x, debuff_y))
-                
-                # Draw duration
-                duration_text = str(debuff.duration)
-                text_surface = self._get_text_surface(duration_text, (255, 255, 255))
-                text_pos = (icon_x + (BUFF_SIZE - text_surface.get_width()) // 2,
-                          debuff_y + BUFF_SIZE + 4)
-                screen.blit(text_surface, text_pos)
+            debuff_rect = pygame.Rect(buff_x + i * (self.EFFECT_ICON_SIZE + 4), debuff_y,
+                                      self.EFFECT_ICON_SIZE, self.EFFECT_ICON_SIZE)
+            if debuff.icon and debuff_rect.collidepoint(mouse_pos):
+                # Prepare tooltip text
+                if hasattr(debuff, 'get_tooltip_title') and hasattr(debuff, 'get_tooltip_text'):
+                    title = debuff.get_tooltip_title()
+                    description = debuff.get_tooltip_text()
+                else:
+                    title = "Debuff"
+                    description = f"Decreases stats by {abs(debuff.value)}"
                 
-                # Draw tooltip if debuff is hovered
-                if debuff_rect.collidepoint(mouse_pos):
-                    # Prepare tooltip text
-                    if hasattr(debuff, 'get_tooltip_title') and hasattr(debuff, 'get_tooltip_text'):
-                        title = debuff.get_tooltip_title()
-                        description = debuff.get_tooltip_text()
-                    else:
-                        title = "Debuff"
-                        description = f"Decreases stats by {abs(debuff.value)}"
-                    
-                    self._draw_tooltip(screen, title, description, debuff_rect)
+                self._draw_tooltip(screen, title, description, debuff_rect)
     
     def _draw_tooltip(self, screen: pygame.Surface, title: str, description: str, anchor_rect: pygame.Rect):
         """Draw a tooltip with the given title and description."""
@@ -831,12 +681,7 @@ class Character:
         self.stats.current_mana += restore_amount
         
         # Add floating mana text
-        self.floating_texts.append(DamageText(
-            value=restore_amount,
-            position=(self.position[0] + self.image.get_width() // 2,
-                     self.position[1] + self.image.get_height() // 2),
-            color=self.MANA_COLOR  # Use the mana color for the floating text
-        ))
+        self.show_floating_text(restore_amount, self.MANA_COLOR, force=True)
         
         return restore_amount 
 
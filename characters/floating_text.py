@@ -0,0 +1,191 @@
+"""Floating combat numbers drawn above characters.
+
+Each character owns a fixed-capacity FloatingTextPool. Positions, lifetimes, scales
+and alpha live in preallocated arrays indexed by slot and free slots are kept on a
+stack, so spawning and recycling a text is constant time and a burst of hits
+(multi-kicks, AoE waves) doesn't allocate anything per hit.
+
+Texts are drawn from a GlyphAtlas: every digit is rendered once per color at a few
+font sizes covering the bounce animation, so drawing a number is a handful of blits
+with no per-frame font rendering or scaling.
+"""
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pygame
+from characters.prototypes import get_font
+
+TEXT_LIFETIME = 45  # Frames a text stays on screen
+TEXT_VELOCITY = -3.0  # Pixels per frame, upwards
+FADE_FRAMES = 20  # Texts fade out during their last frames
+SPAWN_DELAY = 3  # Frames before a new text shows, so hits of one frame don't stack up at once
+BOUNCE_SCALE = 0.3  # Texts grow up to 1.3x halfway through their lifetime
+
+TEXT_FONT_SIZE = 36
+SCALE_STEPS = (1.0, 1.05, 1.1, 1.15, 1.2, 1.25, 1.3)
+SHADOW_COLOR = (0, 0, 0)
+SHADOW_OFFSET = 2
+
+class GlyphAtlas:
+    """Pre-rendered glyphs of floating texts, per color and scale step.
+
+    Digits are rendered for every scale step the first time a color is used. Other
+    characters (signs, letters of status texts) are rendered on first use.
+    """
+
+    def __init__(self, font_size: int = TEXT_FONT_SIZE, scale_steps: Tuple[float, ...] = SCALE_STEPS):
+        self.font_size = font_size
+        self.scale_steps = scale_steps
+        self._glyphs: Dict[Tuple[str, Tuple[int, int, int], int], pygame.Surface] = {}
+        self._colors = set()
+
+    def _render(self, char: str, color: Tuple[int, int, int], step: int) -> pygame.Surface:
+        font = get_font(round(self.font_size * self.scale_steps[step]))
+        glyph = font.render(char, True, color)
+        self._glyphs[(char, color, step)] = glyph
+        return glyph
+
+    def prewarm(self, color: Tuple[int, int, int]):
+        """Render every digit of a color at every scale step."""
+        if color in self._colors:
+            return
+        self._colors.add(color)
+        for step in range(len(self.scale_steps)):
+            for char in "0123456789":
+                self._render(char, color, step)
+
+    def glyph(self, char: str, color: Tuple[int, int, int], step: int) -> pygame.Surface:
+        key = (char, color, step)
+        if key in self._glyphs:
+            return self._glyphs[key]
+        return self._render(char, color, step)
+
+    def draw(self, screen: pygame.Surface, text: str, color: Tuple[int, int, int],
+             center: Tuple[int, int], step: int, alpha: int = 255):
+        """Draw text with its drop shadow centered on a point."""
+        glyphs = [self.glyph(char, color, step) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = glyphs[0].get_height() if glyphs else 0
+        x = center[0] - width // 2
+        y = center[1] - height // 2
+
+        for char, glyph in zip(text, glyphs):
+            shadow = self.glyph(char, SHADOW_COLOR, step)
+            shadow.set_alpha(alpha)
+            glyph.set_alpha(alpha)
+            screen.blit(shadow, (x + SHADOW_OFFSET, y + SHADOW_OFFSET))
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+glyph_atlas = GlyphAtlas()
+
+class FloatingTextPool:
+    """Slot-based pool of floating texts of one character.
+
+    Args:
+        capacity: Maximum number of texts on screen at once
+    """
+
+    def __init__(self, capacity: int = 8):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.int16)
+        self.delay = np.zeros(capacity, dtype=np.int16)
+        self.scale = np.ones(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.step = np.zeros(capacity, dtype=np.intp)  # Index into the atlas scale steps
+        self.alpha = np.full(capacity, 255, dtype=np.int16)
+        self._texts: List[Optional[Tuple[str, Tuple[int, int, int]]]] = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        # Scratch buffers so update() doesn't allocate
+        self._visible = np.zeros(capacity, dtype=bool)
+        self._waiting = np.zeros(capacity, dtype=bool)
+        self._progress = np.zeros(capacity, dtype=np.float32)
+        self._fade = np.zeros(capacity, dtype=np.int16)
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    def spawn(self, value: Union[int, str], position: Tuple[float, float], color: Tuple[int, int, int],
+              force: bool = False) -> bool:
+        """Show a value floating up from position.
+
+        Args:
+            force: Recycle the oldest text if the pool is full instead of dropping this one
+
+        Returns:
+            bool: False if the pool was full and the text was dropped
+        """
+        if self._free:
+            slot = self._free.pop()
+        elif force:
+            # Oldest text is the one closest to expiring
+            slot = int(np.argmin(self.lifetime + self.delay))
+        else:
+            return False
+
+        self.x[slot], self.y[slot] = position
+        self.lifetime[slot] = TEXT_LIFETIME
+        self.delay[slot] = SPAWN_DELAY
+        self.scale[slot] = 1.0
+        self.step[slot] = 0
+        self.alpha[slot] = 255
+        self.active[slot] = True
+        self._texts[slot] = (str(value), color)
+        glyph_atlas.prewarm(color)
+        return True
+
+    def _recycle(self, slot: int):
+        self.active[slot] = False
+        self._texts[slot] = None
+        self._free.append(slot)
+
+    def clear(self):
+        """Remove every text."""
+        for slot in np.flatnonzero(self.active):
+            self._recycle(int(slot))
+
+    def update(self):
+        """Advance every text by one frame."""
+        if len(self._free) == self.capacity:
+            return
+        visible, waiting, progress = self._visible, self._waiting, self._progress
+
+        np.greater(self.delay, 0, out=waiting)
+        np.logical_and(self.active, waiting, out=waiting)
+        np.logical_not(waiting, out=visible)
+        np.logical_and(self.active, visible, out=visible)
+        np.subtract(self.delay, 1, out=self.delay, where=waiting)
+
+        np.add(self.y, TEXT_VELOCITY, out=self.y, where=visible)
+        np.subtract(self.lifetime, 1, out=self.lifetime, where=visible)
+        # Reuse the waiting buffer for the texts that ran out
+        np.less_equal(self.lifetime, 0, out=waiting)
+        np.logical_and(visible, waiting, out=waiting)
+        if waiting.any():
+            for slot in np.flatnonzero(waiting):
+                self._recycle(int(slot))
+
+        # Bounce from 1.0 to 1.3 and back, fade out at the end
+        np.divide(self.lifetime, TEXT_LIFETIME, out=progress)
+        np.subtract(1, progress, out=progress)
+        np.multiply(progress, np.pi, out=progress)
+        np.sin(progress, out=progress)
+        np.multiply(progress, BOUNCE_SCALE, out=progress)
+        np.add(progress, 1, out=self.scale, where=self.active)
+        # Scale steps are evenly spaced, so the closest one is a rounding away
+        np.multiply(progress, (len(SCALE_STEPS) - 1) / BOUNCE_SCALE, out=progress)
+        np.rint(progress, out=progress)
+        np.copyto(self.step, progress, casting="unsafe", where=self.active)
+        np.multiply(self.lifetime, 255, out=self._fade)
+        np.floor_divide(self._fade, FADE_FRAMES, out=self._fade)
+        np.minimum(self._fade, 255, out=self.alpha)
+
+    def draw(self, screen: pygame.Surface):
+        """Draw the visible texts centered on their positions."""
+        if len(self._free) == self.capacity:
+            return
+        for slot in np.flatnonzero(self.active & (self.delay == 0)):
+            text, color = self._texts[slot]
+            glyph_atlas.draw(screen, text, color, (int(self.x[slot]), int(self.y[slot])),
+                             int(self.step[slot]), int(self.alpha[slot]))
@@ -0,0 +1,110 @@
+"""Vectorized status visuals for character images.
+
+Filters work on the RGB and alpha arrays of an image through `pygame.surfarray`, so
+a full portrait is processed in a few NumPy operations instead of a Python loop per
+pixel. Results are cached per (source image, filter, parameters): portraits are
+shared between characters of a type (see `characters.prototypes`), so a status
+visual is computed once per asset and applying it again is a dict lookup.
+
+Example:
+    target.image = image_filters.apply(target.original_image, "freeze")
+"""
+from typing import Callable, Dict, Tuple
+import numpy as np
+import pygame
+
+# Filters take and return int16 (w, h, 3) RGB and (w, h) alpha arrays, values may leave 0-255
+Filter = Callable[..., Tuple[np.ndarray, np.ndarray]]
+
+FILTERS: Dict[str, Filter] = {}
+
+# (id(image), filter name, params) -> (image, filtered), keeps the source alive so ids stay unique
+_filter_cache: Dict[tuple, Tuple[pygame.Surface, pygame.Surface]] = {}
+
+def register_filter(name: str):
+    """Decorator adding a filter function under a name."""
+    def decorator(func: Filter) -> Filter:
+        FILTERS[name] = func
+        return func
+    return decorator
+
+@register_filter("tint")
+def tint(rgb: np.ndarray, alpha: np.ndarray, color: Tuple[int, int, int], strength: float = 1.0):
+    """Multiply by a color, blended with the original by strength."""
+    factor = (1 - strength) + strength * np.array(color, dtype=np.float32) / 255
+    return (rgb * factor).astype(np.int16), alpha
+
+@register_filter("freeze")
+def freeze(rgb: np.ndarray, alpha: np.ndarray):
+    """Blue ice tint with a diagonal crystal pattern on visible pixels."""
+    frozen = rgb + np.array([-30, -10, 50], dtype=np.int16)
+    width, height = alpha.shape
+    crystals = (np.add.outer(np.arange(width), np.arange(height)) % 20 == 0)
+    frozen = np.clip(frozen, 0, 255)
+    frozen[crystals] += 100
+    visible = (alpha > 0)[..., None]
+    return np.where(visible, frozen, rgb), alpha
+
+@register_filter("poison")
+def poison(rgb: np.ndarray, alpha: np.ndarray, strength: float = 0.5):
+    """Sickly green tint."""
+    return tint(rgb, alpha, (140, 255, 120), strength)
+
+@register_filter("stealth")
+def stealth_fade(rgb: np.ndarray, alpha: np.ndarray, opacity: float = 0.2):
+    """Fade the image to a fraction of its opacity."""
+    return rgb, (alpha * np.float32(opacity)).astype(np.int16)
+
+@register_filter("flash")
+def damage_flash(rgb: np.ndarray, alpha: np.ndarray, intensity: int = 255):
+    """Red hit flash, same as blitting (255, 0, 0, intensity) with BLEND_RGBA_ADD."""
+    flashed = rgb.copy()
+    flashed[..., 0] = 255
+    return flashed, alpha + intensity
+
+def _to_arrays(image: pygame.Surface) -> Tuple[np.ndarray, np.ndarray]:
+    if image.get_bitsize() != 32 or not image.get_flags() & pygame.SRCALPHA:
+        converted = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        converted.blit(image, (0, 0))
+        image = converted
+    # Copy straight out of the pixel views, the source stays locked only until they're dropped
+    rgb_view = pygame.surfarray.pixels3d(image)
+    alpha_view = pygame.surfarray.pixels_alpha(image)
+    rgb, alpha = rgb_view.astype(np.int16), alpha_view.astype(np.int16)
+    del rgb_view, alpha_view
+    return rgb, alpha
+
+def _from_arrays(size: Tuple[int, int], rgb: np.ndarray, alpha: np.ndarray) -> pygame.Surface:
+    surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+    pygame.surfarray.blit_array(surface, np.clip(rgb, 0, 255).astype(np.uint8))
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[...] = np.clip(alpha, 0, 255)
+    del pixels  # Unlock the surface
+    return surface
+
+def filtered(image: pygame.Surface, name: str, **params) -> pygame.Surface:
+    """Get the shared filtered version of an image. Don't draw on it or change its alpha."""
+    key = (id(image), name, tuple(sorted(params.items())))
+    if key not in _filter_cache:
+        if name not in FILTERS:
+            raise KeyError(f"Unknown image filter {name!r}")
+        rgb, alpha = FILTERS[name](*_to_arrays(image), **params)
+        _filter_cache[key] = (image, _from_arrays(image.get_size(), rgb, alpha))
+    return _filter_cache[key][1]
+
+def flash_frames(image: pygame.Surface, intensities: Tuple[int, ...]) -> Tuple[pygame.Surface, ...]:
+    """Get the shared damage flash frames of an image, one per intensity.
+
+    The red channel is computed once for all frames, each frame only adds its
+    intensity to the alpha channel.
+    """
+    key = (id(image), "flash_frames", intensities)
+    if key not in _filter_cache:
+        flashed, alpha = damage_flash(*_to_arrays(image), intensity=0)
+        frames = tuple(_from_arrays(image.get_size(), flashed, alpha + intensity) for intensity in intensities)
+        _filter_cache[key] = (image, frames)
+    return _filter_cache[key][1]
+
+def apply(image: pygame.Surface, name: str, **params) -> pygame.Surface:
+    """Get a filtered copy of an image that the caller owns."""
+    return filtered(image, name, **params).copy()
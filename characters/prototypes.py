@@ -0,0 +1,67 @@
+"""Shared character data and a registry for spawning summons.
+
+Everything a character type has that never changes per instance (the scaled
+portrait, fonts) is built once and shared, so spawning a summon mid-turn only
+allocates its own stats, abilities and effect lists. Stages list the summons they
+can spawn and the registry builds one of each while the stage loads, which fills
+the image and icon caches before the first summon is needed.
+"""
+from pathlib import Path
+from typing import Callable, Dict, Tuple, TYPE_CHECKING
+import pygame
+from PIL import Image
+
+if TYPE_CHECKING:
+    from characters.base_character import Character
+
+CHARACTER_IMAGE_SIZE = (240, 333)
+
+_image_cache: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+_font_cache: Dict[int, pygame.font.Font] = {}
+
+def load_character_image(image_path: str, size: Tuple[int, int] = CHARACTER_IMAGE_SIZE) -> pygame.Surface:
+    """Load a character portrait with high quality scaling, once per path.
+
+    The returned surface is shared, callers must copy it before drawing on it or
+    changing its alpha.
+    """
+    key = (image_path, size)
+    if key not in _image_cache:
+        # Load and scale using PIL for high quality resizing
+        pil_image = Image.open(str(Path(image_path)))
+        pil_image = pil_image.convert('RGBA')  # Ensure RGBA mode for transparency
+        pil_image = pil_image.resize(size, Image.Resampling.LANCZOS)  # High quality resize
+        _image_cache[key] = pygame.image.fromstring(pil_image.tobytes(), pil_image.size, 'RGBA')
+    return _image_cache[key]
+
+def get_font(size: int) -> pygame.font.Font:
+    """Get the shared default font of a size."""
+    if size not in _font_cache:
+        _font_cache[size] = pygame.font.Font(None, size)
+    return _font_cache[size]
+
+class PrototypeRegistry:
+    """Named factories for characters that are spawned during battle."""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], "Character"]] = {}
+        self._warm = set()
+
+    def register(self, name: str, factory: Callable[[], "Character"]):
+        self._factories[name] = factory
+
+    def prewarm(self, *names: str):
+        """Build one instance of each type so spawning it later hits only caches."""
+        for name in names:
+            if name not in self._warm:
+                self._factories[name]()
+                self._warm.add(name)
+
+    def spawn(self, name: str) -> "Character":
+        """Create a new character of a registered type."""
+        if name not in self._factories:
+            raise KeyError(f"No character prototype registered as {name!r}")
+        self._warm.add(name)
+        return self._factories[name]()
+
+prototypes = PrototypeRegistry()
@@ -1,5 +1,6 @@
 from characters.base_character import Character, Stats
 from abilities.base_ability import Ability, AbilityEffect
+from characters.prototypes import prototypes
 from pathlib import Path
 from typing import List
 import random
@@ -31,6 +32,8 @@ class Piranha(Character):
         )
         self.add_ability(bite)
 
+prototypes.register("Piranha", Piranha)
+
 def create_shadowfin_boss():
     # Create Shadowfin boss stats
     stats = Stats(
@@ -2,6 +2,7 @@ from characters.base_character import Character, Stats, StatusEffect
 from abilities.base_ability import Ability, AbilityEffect
 from typing import List
 import pygame
+from characters import image_filters
 import types
 
 def create_subzero():
@@ -71,8 +72,6 @@ def create_subzero():
         # 10% chance to freeze
         import random
         if random.random() < 0.10:  # 10% chance
-            # Import IceCrystal for frozen image caching
-            from modifiers.talent_modifiers import IceCrystal
             
             # Create freeze effect
             class FrozenDebuff:
@@ -87,7 +86,7 @@ def create_subzero():
                     
                     # Store original image and create frozen version
                     self.original_image = targets[0].image
-                    self.frozen_image = IceCrystal.get_frozen_image(self.original_image)
+                    self.frozen_image = image_filters.apply(targets[0].original_image, "freeze")
                     targets[0].image = self.frozen_image
                     
                     # Store original ability use functions and draw methods
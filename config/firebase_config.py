@@ -1,8 +1,12 @@
 """Firebase configuration and initialization."""
+import os
 import firebase_admin
 from firebase_admin import credentials, db
 from pathlib import Path
 
+# Production database, override with FIREBASE_DATABASE_URL (e.g. for a staging project)
+DEFAULT_DATABASE_URL = 'https://project-fighters-by-fishb0nes-default-rtdb.europe-west1.firebasedatabase.app/'
+
 def initialize_firebase():
     """Initialize Firebase with service account credentials."""
     print("Initializing Firebase...")  # Debug print
@@ -23,7 +27,7 @@ def initialize_firebase():
         try:
             cred = credentials.Certificate(str(cred_path))
             firebase_admin.initialize_app(cred, {
-                'databaseURL': 'https://project-fighters-by-fishb0nes-default-rtdb.europe-west1.firebasedatabase.app/'
+                'databaseURL': os.environ.get('FIREBASE_DATABASE_URL', DEFAULT_DATABASE_URL)
             })
             print("Firebase app created successfully")  # Debug print
         except Exception as e:
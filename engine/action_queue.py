@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Callable, List, Optional
 import time
 
-@dataclass
+@dataclass(slots=True)
 class GameAction:
     """Represents a single game action with its callback and completion status."""
     callback: Callable
@@ -0,0 +1,362 @@
+"""Immutable battle snapshots and their plain-data form.
+
+Snapshots are frozen dataclasses that keep a reference to the live object they
+were taken from, so they can be restored in-process (undo) even for ad-hoc buff
+classes with closures. Unchanged parts are shared with the previous snapshot of
+the same object, which keeps a per-turn history cheap. `to_state()` turns a
+snapshot into plain data for the binary snapshot format (crash recovery).
+"""
+import importlib
+import threading
+from dataclasses import dataclass, field, fields as dataclass_fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from characters.base_character import Character
+    from engine.game_engine import GameEngine
+    from stages.base_stage import BaseStage
+
+_SCALAR_TYPES = (bool, int, float, str, type(None))
+
+# Attributes that are derived for display and rebuilt on restore
+_SKIPPED_FIELDS = {"description", "is_hovered"}
+
+def scalar_fields(obj: Any) -> Dict[str, Any]:
+    """Get the public plain-value attributes of an object.
+
+    Surfaces, callbacks and references to other game objects are skipped, which is
+    what keeps ad-hoc buff classes and stage subclasses serializable without
+    per-class code.
+    """
+    attributes = dict(getattr(obj, "__dict__", {}))
+    # Slotted classes keep their attributes outside __dict__
+    for cls in type(obj).__mro__:
+        for key in getattr(cls, "__slots__", ()):
+            if key not in attributes and hasattr(obj, key):
+                attributes[key] = getattr(obj, key)
+    return {
+        key: value for key, value in attributes.items()
+        if not key.startswith("_") and key not in _SKIPPED_FIELDS and isinstance(value, _SCALAR_TYPES)
+    }
+
+def class_path(obj: Any) -> str:
+    """Identify an object's class, including classes defined inside functions."""
+    cls = type(obj)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+@dataclass(frozen=True)
+class ObjectSnapshot:
+    """Plain attributes of a status effect or modifier."""
+    obj: Any = field(compare=False, repr=False)
+    obj_id: int
+    class_name: str
+    fields: Tuple[Tuple[str, Any], ...]
+
+    def restore(self) -> Any:
+        for key, value in self.fields:
+            setattr(self.obj, key, value)
+        return self.obj
+
+    def to_state(self) -> Dict[str, Any]:
+        state = dict(self.fields)
+        state["class"] = self.class_name
+        return state
+
+@dataclass(frozen=True)
+class AbilitySnapshot:
+    ability: Any = field(compare=False, repr=False)
+    ability_id: int
+    name: str
+    current_cooldown: int
+    is_disabled: bool
+
+    def restore(self) -> Any:
+        self.ability.current_cooldown = self.current_cooldown
+        self.ability.is_disabled = self.is_disabled
+        return self.ability
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"name": self.name, "current_cooldown": self.current_cooldown, "is_disabled": self.is_disabled}
+
+@dataclass(frozen=True)
+class CharacterSnapshot:
+    character: Any = field(compare=False, repr=False)
+    character_id: int
+    class_name: str
+    name: str
+    stats: Tuple[Tuple[str, Any], ...]
+    abilities: Tuple[AbilitySnapshot, ...]
+    buffs: Tuple[ObjectSnapshot, ...]
+    debuffs: Tuple[ObjectSnapshot, ...]
+    items: Optional[Tuple[Optional[Tuple[str, int, int]], ...]]
+    loot_processed: bool
+
+    def restore(self) -> "Character":
+        char = self.character
+        # Stats are updated in place, buffs may hold references to the Stats object
+        for key, value in self.stats:
+            setattr(char.stats, key, value)
+        char.abilities = [ability.restore() for ability in self.abilities]
+        char.buffs = [buff.restore() for buff in self.buffs]
+        char.debuffs = [debuff.restore() for debuff in self.debuffs]
+        if self.items is not None and char.inventory:
+            for item, saved in zip(char.inventory.slots, self.items):
+                if item and saved and item.name == saved[0]:
+                    item.current_cooldown = saved[2]
+        char.loot_processed = self.loot_processed
+        if char.is_alive():
+            # Dying hides the image, bring it back when undoing a death
+            char.flash_timer = 0
+            char.is_flashing = False
+            char.image = char.original_image.copy()
+        return char
+
+    def to_state(self) -> Dict[str, Any]:
+        state = {
+            "class": self.class_name,
+            "name": self.name,
+            "stats": dict(self.stats),
+            "abilities": [ability.to_state() for ability in self.abilities],
+            "buffs": [buff.to_state() for buff in self.buffs],
+            "debuffs": [debuff.to_state() for debuff in self.debuffs],
+            "loot_processed": self.loot_processed
+        }
+        if self.items is not None:
+            state["items"] = [
+                {"name": item[0], "stack_count": item[1], "current_cooldown": item[2]} if item else None
+                for item in self.items
+            ]
+        return state
+
+@dataclass(frozen=True)
+class StageSnapshot:
+    stage: Any = field(compare=False, repr=False)
+    class_name: str
+    stage_number: int
+    counters: Tuple[Tuple[str, Any], ...]
+    bosses: Tuple[CharacterSnapshot, ...]
+
+    def restore(self) -> "BaseStage":
+        stage = self.stage
+        for key, value in self.counters:
+            setattr(stage, key, value)
+        stage.bosses = [boss.restore() for boss in self.bosses]
+        return stage
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "class": self.class_name,
+            "stage_number": self.stage_number,
+            "counters": dict(self.counters)
+        }
+
+@dataclass(frozen=True)
+class BattleSnapshot:
+    turn_count: int
+    current_stage: int
+    is_player_turn: bool
+    selected_character_index: int
+    stage: Optional[StageSnapshot]
+    players: Tuple[CharacterSnapshot, ...]
+    modifiers: Tuple[ObjectSnapshot, ...]
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "turn_count": self.turn_count,
+            "current_stage": self.current_stage,
+            "is_player_turn": self.is_player_turn,
+            "selected_character_index": self.selected_character_index,
+            "stage": self.stage.to_state() if self.stage else None,
+            "players": [char.to_state() for char in self.players],
+            "bosses": [boss.to_state() for boss in self.stage.bosses] if self.stage else [],
+            "modifiers": [
+                {"class": modifier.class_name, "state": dict(modifier.fields)}
+                for modifier in self.modifiers
+            ]
+        }
+
+def _share(new: Any, previous: Any) -> Any:
+    """Reuse the previous snapshot object if nothing changed."""
+    return previous if previous is not None and previous == new else new
+
+def _share_all(new_items: List[Any], previous_items: Tuple[Any, ...], id_field: str) -> Tuple[Any, ...]:
+    previous_by_id = {getattr(item, id_field): item for item in previous_items}
+    return tuple(_share(item, previous_by_id.get(getattr(item, id_field))) for item in new_items)
+
+def snapshot_object(obj: Any, previous: Optional[ObjectSnapshot] = None) -> ObjectSnapshot:
+    """Snapshot a status effect or modifier."""
+    snapshot = ObjectSnapshot(obj, id(obj), class_path(obj), tuple(scalar_fields(obj).items()))
+    return _share(snapshot, previous)
+
+def snapshot_character(char: "Character", previous: Optional[CharacterSnapshot] = None) -> CharacterSnapshot:
+    """Snapshot a character, sharing unchanged parts with its previous snapshot."""
+    previous_buffs = previous.buffs if previous else ()
+    previous_debuffs = previous.debuffs if previous else ()
+    previous_abilities = previous.abilities if previous else ()
+    items = None
+    if char.inventory:
+        items = tuple(
+            (item.name, item.stack_count, item.current_cooldown) if item else None
+            for item in char.inventory.slots
+        )
+    snapshot = CharacterSnapshot(
+        character=char,
+        character_id=id(char),
+        class_name=class_path(char),
+        name=char.name,
+        stats=tuple((f.name, getattr(char.stats, f.name)) for f in dataclass_fields(char.stats)),
+        abilities=_share_all(
+            [AbilitySnapshot(a, id(a), a.name, a.current_cooldown, a.is_disabled) for a in char.abilities],
+            previous_abilities, "ability_id"
+        ),
+        buffs=_share_all([snapshot_object(b) for b in char.buffs], previous_buffs, "obj_id"),
+        debuffs=_share_all([snapshot_object(d) for d in char.debuffs], previous_debuffs, "obj_id"),
+        items=items,
+        loot_processed=char.loot_processed
+    )
+    return _share(snapshot, previous)
+
+def snapshot_stage(stage: "BaseStage", previous: Optional[StageSnapshot] = None) -> StageSnapshot:
+    """Snapshot a stage's counters and bosses."""
+    snapshot = StageSnapshot(
+        stage=stage,
+        class_name=class_path(stage),
+        stage_number=stage.stage_number,
+        counters=tuple(scalar_fields(stage).items()),
+        bosses=tuple(boss.snapshot() for boss in stage.bosses)
+    )
+    return _share(snapshot, previous)
+
+def snapshot_battle(engine: "GameEngine", previous: Optional[BattleSnapshot] = None) -> BattleSnapshot:
+    """Snapshot the whole battle."""
+    stage = engine.stage_manager.current_stage
+    game_state = engine.game_state
+    previous_modifiers = previous.modifiers if previous else ()
+    return BattleSnapshot(
+        turn_count=game_state.turn_count,
+        current_stage=game_state.current_stage,
+        is_player_turn=game_state.is_player_turn,
+        selected_character_index=game_state.selected_character_index,
+        stage=stage.snapshot() if stage else None,
+        players=tuple(char.snapshot() for char in engine.stage_manager.player_characters),
+        modifiers=_share_all(
+            [snapshot_object(m) for m in engine.modifier_manager.active_modifiers],
+            previous_modifiers, "obj_id"
+        )
+    )
+
+def capture_battle_state(engine: "GameEngine") -> Dict[str, Any]:
+    """Capture everything needed to suspend and resume a battle as plain data."""
+    return snapshot_battle(engine).to_state()
+
+def _load_class(path: str) -> Optional[type]:
+    """Import a module-level class from its class path, None for local classes."""
+    module_name, _, qualname = path.rpartition(".")
+    if "<locals>" in path or not module_name:
+        return None
+    try:
+        return getattr(importlib.import_module(module_name), qualname, None)
+    except ImportError:
+        return None
+
+def _apply_character_state(char: "Character", state: Dict[str, Any]):
+    for key, value in state["stats"].items():
+        setattr(char.stats, key, value)
+    for ability, saved in zip(char.abilities, state["abilities"]):
+        if ability.name == saved["name"]:
+            ability.current_cooldown = saved["current_cooldown"]
+            ability.is_disabled = saved["is_disabled"]
+    char.loot_processed = state.get("loot_processed", False)
+
+def apply_battle_state(engine: "GameEngine", state: Dict[str, Any]) -> List[str]:
+    """Apply a decoded battle state onto a freshly started stage (crash recovery).
+
+    Stats, cooldowns, stage counters and the turn are restored. Summoned bosses are
+    re-created when their class has a no-argument constructor. Buffs can't be
+    rebuilt from data (most are closures over their ability) and are dropped.
+
+    Returns:
+        List[str]: Descriptions of state that could not be restored
+    """
+    warnings = []
+    stage = engine.stage_manager.current_stage
+    if not stage or not state.get("stage") or state["stage"]["stage_number"] != stage.stage_number:
+        return ["Checkpoint belongs to a different stage"]
+
+    game_state = engine.game_state
+    game_state.turn_count = state["turn_count"]
+    game_state.is_player_turn = state["is_player_turn"]
+    game_state.selected_character_index = state["selected_character_index"]
+    for key, value in state["stage"]["counters"].items():
+        setattr(stage, key, value)
+
+    for char, saved in zip(engine.stage_manager.player_characters, state["players"]):
+        _apply_character_state(char, saved)
+
+    bosses = []
+    unmatched = list(stage.bosses)
+    for saved in state["bosses"]:
+        boss = next((b for b in unmatched if b.name == saved["name"]), None)
+        if boss is not None:
+            unmatched.remove(boss)
+        else:
+            boss_class = _load_class(saved["class"])
+            try:
+                boss = boss_class() if boss_class else None
+            except TypeError:
+                boss = None
+        if boss is None:
+            warnings.append(f"Could not re-create {saved['name']}")
+            continue
+        _apply_character_state(boss, saved)
+        bosses.append(boss)
+    stage.bosses = bosses
+
+    dropped = sum(len(c["buffs"]) + len(c["debuffs"]) for c in state["players"] + state["bosses"])
+    if dropped:
+        warnings.append(f"{dropped} buffs/debuffs were not restored")
+    return warnings
+
+class CheckpointWriter:
+    """Serializes battle snapshots to disk on a background thread.
+
+    Only the newest pending snapshot is written, so a slow disk never queues up
+    work or delays a turn.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pending: Optional[BattleSnapshot] = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="CheckpointWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: BattleSnapshot):
+        """Queue a snapshot for writing, replacing any not yet written one."""
+        with self._condition:
+            self._pending = snapshot
+            self._condition.notify()
+
+    def _run(self):
+        from services.snapshot_format import write_snapshot_file
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                snapshot, self._pending = self._pending, None
+            try:
+                write_snapshot_file(self.path, snapshot.to_state())
+            except Exception as e:
+                print(f"Error writing checkpoint: {e}")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read the last written checkpoint, None if there is none or it is unreadable."""
+        from services.snapshot_format import read_snapshot_file
+        if not self.path.exists():
+            return None
+        try:
+            return read_snapshot_file(self.path)
+        except Exception as e:
+            print(f"Error reading checkpoint: {e}")
+            return None
@@ -18,7 +18,7 @@ import math
 from abilities.base_ability import Ability
 from effects.visual_effects import VisualEffectManager
 from ui.loot_window import LootWindow
-from services.database_service import DatabaseService
+from ui.hit_index import HitIndex
 from characters.shadowfin_boss import Piranha
 from items.raid_inventory import RaidInventory
 from ui.modifier_selection import ModifierSelectionWindow
@@ -29,6 +29,14 @@ from ui.stage_selector import StageSelector
 from PIL import Image
 import os
 from engine.action_queue import ActionQueue
+from engine.input_batcher import InputBatcher
+from engine.timing_wheel import turn_wheel
+from engine.turn_pipeline import TurnPipeline
+from engine.turn_scheduler import TurnScheduler
+from engine.utility_ai import BattleView
+from engine.lookahead_planner import LookaheadPlanner
+from engine.battle_state import BattleSnapshot, CheckpointWriter, apply_battle_state, snapshot_battle
+from collections import deque
 
 # Global image cache
 _image_cache: Dict[Tuple[str, Optional[Tuple[int, int]]], pygame.Surface] = {}
@@ -57,6 +65,10 @@ class GameEngine:
     
     instance = None  # Class variable to store singleton instance
     
+    # Per-turn battle checkpoints
+    MAX_CHECKPOINTS = 20  # Turns kept in memory for undo
+    CHECKPOINT_PATH = "Raidfolder/checkpoint.bin"  # Latest turn, for crash recovery
+    
     def __init__(self, screen_width: int = 1920, screen_height: int = 1080):
         GameEngine.instance = self  # Store instance reference
         pygame.init()
@@ -68,10 +80,11 @@ class GameEngine:
         self.game_state = GameState()
         self.running = True
         
-        # Initialize database service first
-        self.db_service = DatabaseService()
+        # Drop event types we never handle and fold mouse motion per frame
+        self.input = InputBatcher()
+        self.input.install()
         
-        # Initialize raid inventory after database service
+        # Initialize raid inventory from the local store, Firebase syncs in the background
         self.raid_inventory = RaidInventory()
         print("Loading raid inventory...")  # Debug print
         
@@ -99,12 +112,15 @@ class GameEngine:
         # Create inventory (positioned above characters)
         self.inventory = Inventory(screen_width - 320, 200)  # Position at mid-right
         
-        # Populate inventory with raid items
-        self.raid_inventory.populate_ui_inventory(self.inventory)
+        # Show raid items, the inventory follows RaidInventory changes from here on
+        self.inventory.bind(self.raid_inventory)
         
         # Target hover state
         self.hovered_target = None
         
+        # Screen rects of characters and ability icons, refreshed every frame in render()
+        self.hit_index = HitIndex()
+        
         # Colors for target indicators
         self.VALID_TARGET_COLOR = (0, 255, 0, 100)  # Semi-transparent green
         self.HOVERED_TARGET_COLOR = (255, 255, 0, 150)  # Semi-transparent yellow
@@ -123,15 +139,37 @@ class GameEngine:
         # Generate unique player ID
         self.player_id = str(uuid.uuid4())  # Generate unique player ID
         
-        # Load saved game state if it exists
-        # saved_state = self.db_service.get_game_state(self.player_id)
-        # if saved_state:
-        #     self.load_game_state(saved_state)
+        # Battle checkpoints taken at the end of every player turn
+        self.checkpoints: deque = deque(maxlen=self.MAX_CHECKPOINTS)
+        self._last_snapshot: Optional[BattleSnapshot] = None
+        self.checkpoint_writer = CheckpointWriter(self.CHECKPOINT_PATH)
         
         # Add active modifiers display
         self.active_modifiers_display = ActiveModifiersDisplay(self.screen_width)
         
         self.action_queue = ActionQueue()
+        
+        # Wakes each boss once per boss phase
+        self.turn_scheduler = TurnScheduler()
+        
+        # Turn end phases, in order, each run once per turn
+        self.turn_pipeline = TurnPipeline()
+        self.turn_pipeline.register("cooldowns", turn_wheel.advance)
+        self.turn_pipeline.register("player_effects", self.end_turn_player_effects)
+        self.turn_pipeline.register("boss_effects", self.end_turn_boss_effects)
+        self.turn_pipeline.register("modifiers_turn_end", lambda: self.modifier_manager.apply_turn_end(self))
+        self.turn_pipeline.register("stage_turn_end", self.end_turn_stage)
+        self.turn_pipeline.register("modifiers_turn_start", lambda: self.modifier_manager.apply_turn_start(self))
+        self.turn_pipeline.register("sync_inventory", self.sync_inventory)
+        
+        # Hard mode lookahead, off unless enabled
+        self.boss_planner: Optional[LookaheadPlanner] = None
+        self._boss_plan = None
+    
+    @property
+    def db_service(self):
+        """DatabaseService of the background sync, None while offline."""
+        return self.raid_inventory.db_service
     
     def setup_game(self):
         """Initialize game state and stages"""
@@ -218,6 +256,10 @@ class GameEngine:
             self.stage_manager.set_player_characters([kagome])
         
         self.stage_manager.start_stage(stage_number)
+        self.checkpoints.clear()
+        self._last_snapshot = None
+        self.turn_scheduler.reset()
+        self.cancel_boss_plan()
         # Show modifier selection after stage is selected
         self.show_modifier_selection()
     
@@ -644,18 +686,13 @@ class GameEngine:
             return
             
         char = self.stage_manager.player_characters[self.game_state.selected_character_index]
-        for i, ability in enumerate(char.abilities):
-            ability_rect = pygame.Rect(ability.position, (char.ABILITY_ICON_SIZE, char.ABILITY_ICON_SIZE))
-            if ability_rect.collidepoint(pos):
-                if ability.can_use(char):
-                    self.game_state.selected_ability = i
-                    # Execute immediately if it's an auto-target ability
-                    if ability.auto_self_target:
-                        self.execute_player_turn()
-                return
-        
-        # Save game state after ability use
-        # self.save_game_state()
+        ability = self.hit_index.hit(pos)
+        if isinstance(ability, Ability) and ability in char.abilities:
+            if ability.can_use(char):
+                self.game_state.selected_ability = char.abilities.index(ability)
+                # Execute immediately if it's an auto-target ability
+                if ability.auto_self_target:
+                    self.execute_player_turn()
     
     def handle_target_click(self, pos):
         """Handle clicking on a target when an ability or item is selected"""
@@ -667,34 +704,25 @@ class GameEngine:
         if self.game_state.targeting_item:
             # Handle item targeting
             char = self.stage_manager.player_characters[self.game_state.selected_character_index]
+            target = self.character_at(pos)
             
             # Check for self-targeting
-            char_rect = pygame.Rect(char.position, char.image.get_size())
-            if char_rect.collidepoint(pos):
+            if target is char:
                 if self.inventory.use_selected_item(char):
                     self.game_state.targeting_item = False
-                    # Sync inventory after using item
-                    self.sync_inventory()
                     # Only end turn if the item is meant to end turn
                     if self.inventory.selected_item and hasattr(self.inventory.selected_item, 'ends_turn') and self.inventory.selected_item.ends_turn:
                         self.end_player_turn()
                     return
             
             # Check for boss targeting
-            if self.stage_manager.current_stage:
-                from characters.shadowfin_boss import Piranha
-                for i, boss in enumerate(self.stage_manager.current_stage.bosses):
-                    if boss.is_alive() and not isinstance(boss, Piranha) and boss.is_targetable():  # Check targetable
-                        boss_rect = pygame.Rect(boss.position, boss.image.get_size())
-                        if boss_rect.collidepoint(pos):
-                            if self.inventory.use_selected_item(boss):
-                                self.game_state.targeting_item = False
-                                # Sync inventory after using item
-                                self.sync_inventory()
-                                # Only end turn if the item is meant to end turn
-                                if self.inventory.selected_item and hasattr(self.inventory.selected_item, 'ends_turn') and self.inventory.selected_item.ends_turn:
-                                    self.end_player_turn()
-                                return
+            if self.targetable_boss_index(target) is not None:
+                if self.inventory.use_selected_item(target):
+                    self.game_state.targeting_item = False
+                    # Only end turn if the item is meant to end turn
+                    if self.inventory.selected_item and hasattr(self.inventory.selected_item, 'ends_turn') and self.inventory.selected_item.ends_turn:
+                        self.end_player_turn()
+                    return
             
             # If we got here, either the target was invalid or the item couldn't be used
             self.inventory.cancel_selection()
@@ -712,24 +740,20 @@ class GameEngine:
         if ability.auto_self_target or any(effect.type == "damage_all" for effect in ability.effects):
             return
             
+        target = self.character_at(pos)
+        
         # Check for self-targeting
-        if ability.can_self_target:
-            char_rect = pygame.Rect(char.position, char.image.get_size())
-            if char_rect.collidepoint(pos):
-                self.game_state.selected_target = None  # None indicates self-target
-                self.execute_player_turn()
-                return
+        if ability.can_self_target and target is char:
+            self.game_state.selected_target = None  # None indicates self-target
+            self.execute_player_turn()
+            return
                 
         # Check for boss targeting
-        if self.stage_manager.current_stage:
-            from characters.shadowfin_boss import Piranha
-            for i, boss in enumerate(self.stage_manager.current_stage.bosses):
-                if boss.is_alive() and not isinstance(boss, Piranha) and boss.is_targetable():  # Check targetable
-                    boss_rect = pygame.Rect(boss.position, boss.image.get_size())
-                    if boss_rect.collidepoint(pos):
-                        self.game_state.selected_target = i
-                        self.execute_player_turn()
-                        return
+        boss_index = self.targetable_boss_index(target)
+        if boss_index is not None:
+            self.game_state.selected_target = boss_index
+            self.execute_player_turn()
+            return
         
         # If clicked outside any valid target, cancel ability selection
         self.game_state.selected_ability = None
@@ -801,57 +825,109 @@ class GameEngine:
                     )
     
     def end_player_turn(self):
-        char = self.stage_manager.player_characters[self.game_state.selected_character_index]
         self.game_state.is_player_turn = False
         self.game_state.selected_ability = None
         self.game_state.selected_target = None
         self.game_state.turn_count += 1
         
-        # Update item cooldowns
-        if char.inventory:
-            for item in char.inventory.slots:
-                if item and item.current_cooldown > 0:
-                    item.current_cooldown -= 1
+        # Cooldowns, effects, modifiers and stage mechanics, see the phases registered in __init__
+        self.turn_pipeline.run()
+        
+        # Log turn end
+        self.battle_log.add_message(
+            f"Turn {self.game_state.turn_count} begins!",
+            self.battle_log.TEXT_COLOR
+        )
         
-        # Update cooldowns for all characters at end of full turn
+        self.checkpoint()
+    
+    def end_turn_player_effects(self):
+        """Update buffs and debuffs of all player characters at end of full turn."""
         for char in self.stage_manager.player_characters:
             char.end_turn()
-            # Update player ability cooldowns
-            for ability in char.abilities:
-                if ability.current_cooldown > 0:
-                    ability.current_cooldown -= 1
-            # Update item cooldowns
-            if char.inventory:
-                for item in char.inventory.slots:
-                    if item and item.current_cooldown > 0:
-                        item.current_cooldown -= 1
-        
-        # Update boss cooldowns and effects
+    
+    def end_turn_boss_effects(self):
+        """Update buffs and debuffs of all bosses at end of full turn."""
         if self.stage_manager.current_stage:
             for boss in self.stage_manager.current_stage.bosses:
                 boss.end_turn()
-                for ability in boss.abilities:
-                    if ability.current_cooldown > 0:
-                        ability.current_cooldown -= 1
-        
-        # Apply modifier effects
-        self.modifier_manager.apply_turn_end(self)
-        
-        # Notify stage of turn end
+    
+    def end_turn_stage(self):
+        """Run the stage's turn mechanics (spawns, waves). Modifiers run in their own phases."""
         if self.stage_manager.current_stage:
             self.stage_manager.current_stage.on_turn_end()
+    
+    def snapshot(self) -> BattleSnapshot:
+        """Take an immutable snapshot of the battle, sharing unchanged parts with the last one"""
+        self._last_snapshot = snapshot_battle(self, self._last_snapshot)
+        return self._last_snapshot
+    
+    def restore(self, snapshot: BattleSnapshot):
+        """Restore the battle to a snapshot taken during this stage"""
+        stage = self.stage_manager.current_stage
+        if snapshot.stage is None or snapshot.stage.stage is not stage:
+            raise ValueError("Snapshot belongs to a different stage")
+        
+        # Drop boss actions that were queued after the snapshot
+        self.action_queue.clear()
+        self.turn_scheduler.reset()
+        self.cancel_boss_plan()
+        
+        self.game_state.turn_count = snapshot.turn_count
+        self.game_state.is_player_turn = snapshot.is_player_turn
+        self.game_state.selected_character_index = snapshot.selected_character_index
+        self.game_state.selected_ability = None
+        self.game_state.selected_target = None
+        self.game_state.targeting_item = False
         
-        # Apply modifier effects at turn start
-        self.modifier_manager.apply_turn_start(self)
-        
-        # Sync inventory after modifiers are applied
-        self.sync_inventory()
-        
-        # Log turn end
+        stage.restore(snapshot.stage)
+        for char, char_snapshot in zip(self.stage_manager.player_characters, snapshot.players):
+            char.restore(char_snapshot)
+        self.modifier_manager.active_modifiers = [modifier.restore() for modifier in snapshot.modifiers]
+        self.hovered_target = None
+        self._last_snapshot = snapshot
+    
+    def checkpoint(self):
+        """Remember the current turn for undo and write it to disk in the background"""
+        snapshot = self.snapshot()
+        self.checkpoints.append(snapshot)
+        self.checkpoint_writer.submit(snapshot)
+    
+    def undo_last_turn(self) -> bool:
+        """Go back to the checkpoint before the last turn.
+        
+        Raid inventory changes (used consumables, loot) are not undone.
+        
+        Returns:
+            bool: True if a checkpoint was restored
+        """
+        if len(self.checkpoints) > 1:
+            self.checkpoints.pop()
+        if not self.checkpoints:
+            return False
+        self.restore(self.checkpoints[-1])
         self.battle_log.add_message(
-            f"Turn {self.game_state.turn_count} begins!",
+            f"Rewound to turn {self.game_state.turn_count}",
             self.battle_log.TEXT_COLOR
         )
+        return True
+    
+    def resume_from_checkpoint(self) -> List[str]:
+        """Apply the checkpoint written to disk (e.g. before a crash) to the current stage.
+        
+        Returns:
+            List[str]: What could not be restored, or why nothing was
+        """
+        state = self.checkpoint_writer.load()
+        if state is None:
+            return ["No checkpoint found"]
+        self.action_queue.clear()
+        self.turn_scheduler.reset()
+        self.cancel_boss_plan()
+        warnings = apply_battle_state(self, state)
+        self.checkpoints.clear()
+        self._last_snapshot = None
+        return warnings
     
     def execute_player_turn(self):
         if (self.game_state.selected_ability is None or 
@@ -877,84 +953,154 @@ class GameEngine:
         if ability.use(char, targets):
             self.log_ability_use(char, ability, targets)
             self.end_player_turn()
-        
-        # Save game state after each turn
-        # self.save_game_state()
     
     def execute_boss_turn(self):
+        """Wake the next boss of the boss phase and queue its action"""
         if not self.stage_manager.current_stage:
             return
         
+        if self._boss_plan is not None:
+            # Hard mode: wait until the lookahead finished or ran out of time
+            if not self._boss_plan.done():
+                return
+            plan, self._boss_plan = self._boss_plan, None
+            action = plan.result() or self.choose_boss_action(plan.boss, plan.view)
+            if action:
+                self.queue_boss_ability(plan.boss, *action)
+            return
+        
         bosses = self.stage_manager.current_stage.bosses
-        if not hasattr(self, '_current_boss_index'):
-            self._current_boss_index = 0
-        
-        if self._current_boss_index < len(bosses):
-            boss = bosses[self._current_boss_index]
-            if boss.is_alive():
-                from characters.shadowfin_boss import create_shadowfin_boss, Piranha
-                # For other bosses, use random abilities
-                available_abilities = [i for i, ability in enumerate(boss.abilities) if ability.is_available()]
-                if available_abilities:
-                    ability_idx = np.random.choice(available_abilities)
-                    ability = boss.abilities[ability_idx]
-                    
-                    # Special handling for Shadowfin's Call Piranha ability
-                    if boss.name == "Shadowfin" and ability == boss.abilities[-1]:
-                        def ability_action():
-                            if ability.use(boss, [boss]):
-                                self.battle_log.add_message(
-                                    f"{boss.name} uses {ability.name}!",
-                                    self.battle_log.TEXT_COLOR
-                                )
-                        self.action_queue.add_action(ability_action, duration=0.0)
-                    else:
-                        # For all other abilities, target players
-                        valid_targets = [char for char in self.stage_manager.player_characters if char.is_alive()]
-                        if valid_targets:  # Only proceed if there are valid targets
-                            target = np.random.choice(valid_targets)
-                            
-                            def ability_action():
-                                if ability.use(boss, [target]):
-                                    # Log the boss ability use
-                                    self.battle_log.add_message(
-                                        f"{boss.name} uses {ability.name}!",
-                                        self.battle_log.TEXT_COLOR
-                                    )
-                                    
-                                    # Log the effects
-                                    for effect in ability.effects:
-                                        if effect.type == "damage":
-                                            # Calculate actual damage after reductions
-                                            damage_reduction = target.get_damage_reduction()
-                                            reduced_amount = effect.value * (1 - damage_reduction / 100)
-                                            final_damage = max(1, int(reduced_amount - target.stats.defense))
-                                            self.battle_log.add_message(
-                                                f"  Deals {final_damage} damage to {target.name}",
-                                                self.battle_log.DAMAGE_COLOR
-                                            )
-                                        elif effect.type == "heal":
-                                            self.battle_log.add_message(
-                                                f"  Heals for {effect.value}",
-                                                self.battle_log.HEAL_COLOR
-                                            )
-                                        elif effect.type == "restore_mana_self":
-                                            self.battle_log.add_message(
-                                                f"  Restores {effect.value} mana",
-                                                self.battle_log.MANA_COLOR
-                                            )
-                                        elif effect.type in ["buff", "debuff"]:
-                                            self.battle_log.add_message(
-                                                f"  {'Buffs' if effect.type == 'buff' else 'Debuffs'} target by {effect.value} for {effect.duration} turns",
-                                                self.battle_log.BUFF_COLOR
-                                            )
-                            self.action_queue.add_action(ability_action, duration=0.0)
-                
-                # Move to next boss immediately after queueing the action
-                self._current_boss_index += 1
-        else:
-            self._current_boss_index = 0
+        if not self.turn_scheduler.is_active:
+            # One view of the battle per turn, shared by every boss AI
+            view = BattleView.build(self.stage_manager.player_characters, bosses)
+            self.turn_scheduler.begin_round(bosses, view)
+        
+        view = self.turn_scheduler.view
+        boss = self.turn_scheduler.next_actor()
+        if boss is None:
             self.game_state.is_player_turn = True
+            return
+        
+        if self.boss_planner:
+            self._boss_plan = self.boss_planner.plan(boss, view, bosses, self.stage_manager.player_characters)
+            if self._boss_plan:
+                return
+        
+        action = self.choose_boss_action(boss, view)
+        if action:
+            self.queue_boss_ability(boss, *action)
+    
+    def choose_boss_action(self, boss: Character, view: BattleView) -> Optional[Tuple["Ability", List[Character]]]:
+        """Pick a boss's ability and targets with its AI profile, or randomly"""
+        ai_profile = getattr(boss, 'ai_profile', None)
+        if ai_profile:
+            # Bosses with their own priorities
+            return ai_profile.choose_action(boss, view)
+        
+        # For other bosses, use random abilities
+        available_abilities = [i for i, ability in enumerate(boss.abilities) if ability.is_available()]
+        if not available_abilities:
+            return None
+        ability = boss.abilities[np.random.choice(available_abilities)]
+        
+        # Special handling for Shadowfin's Call Piranha ability
+        if boss.name == "Shadowfin" and ability == boss.abilities[-1]:
+            return ability, [boss]
+        
+        # For all other abilities, target players
+        alive_players = [char for char in self.stage_manager.player_characters if char.is_alive()]
+        if not alive_players:  # Only proceed if there are valid targets
+            return None
+        return ability, [np.random.choice(alive_players)]
+    
+    def set_hard_mode(self, enabled: bool):
+        """Turn the lookahead boss planner on or off"""
+        if enabled and not self.boss_planner:
+            self.boss_planner = LookaheadPlanner()
+            self.boss_planner.start()
+        elif not enabled and self.boss_planner:
+            self.cancel_boss_plan()
+            self.boss_planner.shutdown()
+            self.boss_planner = None
+    
+    def cancel_boss_plan(self):
+        """Drop a lookahead that is still running"""
+        if self._boss_plan:
+            self._boss_plan.cancel()
+            self._boss_plan = None
+    
+    def queue_boss_ability(self, boss: Character, ability: "Ability", targets: List[Character]):
+        """Queue a boss ability use and log it when it resolves"""
+        target = targets[0]
+        
+        def ability_action():
+            if ability.use(boss, targets):
+                # Log the boss ability use
+                self.battle_log.add_message(
+                    f"{boss.name} uses {ability.name}!",
+                    self.battle_log.TEXT_COLOR
+                )
+                
+                # Log the effects
+                for effect in ability.effects:
+                    if effect.type == "damage" and target is not boss:
+                        # Calculate actual damage after reductions
+                        damage_reduction = target.get_damage_reduction()
+                        reduced_amount = effect.value * (1 - damage_reduction / 100)
+                        final_damage = max(1, int(reduced_amount - target.stats.defense))
+                        self.battle_log.add_message(
+                            f"  Deals {final_damage} damage to {target.name}",
+                            self.battle_log.DAMAGE_COLOR
+                        )
+                    elif effect.type == "heal":
+                        self.battle_log.add_message(
+                            f"  Heals for {effect.value}",
+                            self.battle_log.HEAL_COLOR
+                        )
+                    elif effect.type == "restore_mana_self":
+                        self.battle_log.add_message(
+                            f"  Restores {effect.value} mana",
+                            self.battle_log.MANA_COLOR
+                        )
+                    elif effect.type in ["buff", "debuff"]:
+                        self.battle_log.add_message(
+                            f"  {'Buffs' if effect.type == 'buff' else 'Debuffs'} target by {effect.value} for {effect.duration} turns",
+                            self.battle_log.BUFF_COLOR
+                        )
+        self.action_queue.add_action(ability_action, duration=0.0)
+    
+    def update_hit_index(self):
+        """Register the rects of characters (below) and their ability icons (above)."""
+        characters = list(self.stage_manager.player_characters)
+        if self.stage_manager.current_stage:
+            characters.extend(self.stage_manager.current_stage.bosses)
+        keys = []
+        for char in characters:
+            self.hit_index.update(char, (*char.position, *char.image.get_size()), z=0)
+            keys.append(char)
+            for ability in char.abilities:
+                self.hit_index.update(ability, (*ability.position, char.ABILITY_ICON_SIZE, char.ABILITY_ICON_SIZE), z=1)
+                keys.append(ability)
+        if len(keys) != len(self.hit_index):
+            self.hit_index.retain(keys)
+    
+    def character_at(self, pos) -> Optional[Character]:
+        """Topmost character at a screen position, ignoring ability icons."""
+        for key in self.hit_index.hits(pos):
+            if isinstance(key, Character):
+                return key
+        return None
+    
+    def targetable_boss_index(self, target: Optional[Character]) -> Optional[int]:
+        """Index of target among the bosses if the player can target it."""
+        if target is None or not self.stage_manager.current_stage:
+            return None
+        bosses = self.stage_manager.current_stage.bosses
+        if target not in bosses:
+            return None
+        if target.is_alive() and not isinstance(target, Piranha) and target.is_targetable():  # Check targetable
+            return bosses.index(target)
+        return None
     
     def handle_target_hover(self, pos):
         """Handle mouse hover over potential targets"""
@@ -966,19 +1112,14 @@ class GameEngine:
         if self.game_state.targeting_item:
             # Handle item targeting hover
             char = self.stage_manager.player_characters[self.game_state.selected_character_index]
-            char_rect = pygame.Rect(char.position, char.image.get_size())
-            if char_rect.collidepoint(pos):
+            target = self.character_at(pos)
+            if target is char:
                 self.hovered_target = ("player", 0)
                 return
             
-            if self.stage_manager.current_stage:
-                from characters.shadowfin_boss import Piranha
-                for i, boss in enumerate(self.stage_manager.current_stage.bosses):
-                    if boss.is_alive() and not isinstance(boss, Piranha) and boss.is_targetable():  # Check targetable
-                        boss_rect = pygame.Rect(boss.position, boss.image.get_size())
-                        if boss_rect.collidepoint(pos):
-                            self.hovered_target = ("boss", i)
-                            return
+            boss_index = self.targetable_boss_index(target)
+            if boss_index is not None:
+                self.hovered_target = ("boss", boss_index)
             return
             
         if self.game_state.selected_ability is None:
@@ -991,22 +1132,17 @@ class GameEngine:
         if ability.auto_self_target or any(effect.type == "damage_all" for effect in ability.effects):
             return
         
+        target = self.character_at(pos)
+        
         # Check for self-targeting
-        if ability.can_self_target:
-            char_rect = pygame.Rect(char.position, char.image.get_size())
-            if char_rect.collidepoint(pos):
-                self.hovered_target = ("player", 0)
-                return
+        if ability.can_self_target and target is char:
+            self.hovered_target = ("player", 0)
+            return
         
         # Check for boss targeting
-        if self.stage_manager.current_stage:
-            from characters.shadowfin_boss import Piranha
-            for i, boss in enumerate(self.stage_manager.current_stage.bosses):
-                if boss.is_alive() and not isinstance(boss, Piranha) and boss.is_targetable():  # Check targetable
-                    boss_rect = pygame.Rect(boss.position, boss.image.get_size())
-                    if boss_rect.collidepoint(pos):
-                        self.hovered_target = ("boss", i)
-                        return
+        boss_index = self.targetable_boss_index(target)
+        if boss_index is not None:
+            self.hovered_target = ("boss", boss_index)
     
     def draw_target_indicators(self):
         """Draw indicators for valid targets"""
@@ -1116,46 +1252,25 @@ class GameEngine:
                 if self.loot_window:
                     kept_items = self.loot_window.handle_event(event)
                     if kept_items is not None:
-                        # Add kept items to inventory
-                        for item in kept_items:
-                            self.raid_inventory.add_item(item.name, item.stack_count)
-                        
-                        # Refresh from database to ensure we have the latest state
-                        self.raid_inventory.load_inventory()
-                        
-                        # Save to database
-                        self.raid_inventory.save_inventory()
-                        
-                        # Clear both inventories
-                        for char in self.stage_manager.player_characters:
-                            if char.inventory:
-                                char.inventory.slots = [None] * 6
-                        self.inventory.slots = [None] * 6
-                        
-                        # Repopulate both inventories from RaidInventory
-                        for char in self.stage_manager.player_characters:
-                            if char.inventory:
-                                self.raid_inventory.populate_ui_inventory(char.inventory)
-                        self.raid_inventory.populate_ui_inventory(self.inventory)
+                        # Add kept items to inventory, bound UI inventories update their slots
+                        self.raid_inventory.add_items((item.name, item.stack_count) for item in kept_items)
                         
                         self.pending_loot = []  # Clear pending loot
                         self.loot_window = None  # Close loot window
                         return
                 
                 # Handle character selection first
-                for i, char in enumerate(self.stage_manager.player_characters):
-                    if char.is_alive():
-                        char_rect = pygame.Rect(char.position, char.image.get_size())
-                        if char_rect.collidepoint(event.pos):
-                            # Only select character if not targeting
-                            if not self.game_state.targeting_item and self.game_state.selected_ability is None:
-                                self.game_state.selected_character_index = i
-                                # Log character selection
-                                self.battle_log.add_message(
-                                    f"Selected {char.name}",
-                                    self.battle_log.TEXT_COLOR
-                                )
-                                return
+                char = self.character_at(event.pos)
+                if char in self.stage_manager.player_characters and char.is_alive():
+                    # Only select character if not targeting
+                    if not self.game_state.targeting_item and self.game_state.selected_ability is None:
+                        self.game_state.selected_character_index = self.stage_manager.player_characters.index(char)
+                        # Log character selection
+                        self.battle_log.add_message(
+                            f"Selected {char.name}",
+                            self.battle_log.TEXT_COLOR
+                        )
+                        return
                 
                 # Handle end turn button first
                 if self.game_state.is_player_turn and self.stage_manager.handle_events(event):
@@ -1175,14 +1290,12 @@ class GameEngine:
             else:
                 self.running = False
         elif event.type == pygame.MOUSEMOTION:
-            # Handle ability tooltips
-            for char in self.stage_manager.player_characters:
-                for ability in char.abilities:
-                    ability.handle_mouse_motion(event.pos)
-            if self.stage_manager.current_stage:
-                for boss in self.stage_manager.current_stage.bosses:
-                    for ability in boss.abilities:
-                        ability.handle_mouse_motion(event.pos)
+            # Handle ability tooltips, only the abilities the pointer left or entered change
+            left, entered = self.hit_index.move_pointer(event.pos)
+            if isinstance(left, Ability):
+                left.is_hovered = False
+            if isinstance(entered, Ability):
+                entered.is_hovered = True
             # Handle target hover
             self.handle_target_hover(event.pos)
         elif event.type == pygame.KEYDOWN:
@@ -1233,21 +1346,10 @@ class GameEngine:
                             # Execute immediately if it's an auto-target ability
                             if ability.auto_self_target:
                                 self.execute_player_turn()
-            elif event.type == pygame.MOUSEMOTION:
-                # Handle ability tooltips
-                for char in self.stage_manager.player_characters:
-                    for ability in char.abilities:
-                        ability.handle_mouse_motion(event.pos)
-                if self.stage_manager.current_stage:
-                    for boss in self.stage_manager.current_stage.bosses:
-                        for ability in boss.abilities:
-                            ability.handle_mouse_motion(event.pos)
-                # Handle target hover
-                self.handle_target_hover(event.pos)
     
     def handle_events(self):
-        """Handle all pending pygame events."""
-        for event in pygame.event.get():
+        """Handle this frame's pygame events, mouse motion folded to its latest position."""
+        for event in self.input.poll():
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -1285,27 +1387,8 @@ class GameEngine:
                 if self.loot_window:
                     kept_items = self.loot_window.handle_event(event)
                     if kept_items is not None:
-                        # Add kept items to inventory
-                        for item in kept_items:
-                            self.raid_inventory.add_item(item.name, item.stack_count)
-                        
-                        # Refresh from database to ensure we have the latest state
-                        self.raid_inventory.load_inventory()
-                        
-                        # Save to database
-                        self.raid_inventory.save_inventory()
-                        
-                        # Clear both inventories
-                        for char in self.stage_manager.player_characters:
-                            if char.inventory:
-                                char.inventory.slots = [None] * 6
-                        self.inventory.slots = [None] * 6
-                        
-                        # Repopulate both inventories from RaidInventory
-                        for char in self.stage_manager.player_characters:
-                            if char.inventory:
-                                self.raid_inventory.populate_ui_inventory(char.inventory)
-                        self.raid_inventory.populate_ui_inventory(self.inventory)
+                        # Add kept items to inventory, bound UI inventories update their slots
+                        self.raid_inventory.add_items((item.name, item.stack_count) for item in kept_items)
                         
                         self.pending_loot = []  # Clear pending loot
                         self.loot_window = None  # Close loot window
@@ -1355,6 +1438,10 @@ class GameEngine:
         # Update action queue first
         self.action_queue.update()
         
+        # Apply inventory changes pulled from Firebase by the background sync,
+        # bound UI inventories update from the change events
+        self.raid_inventory.apply_pending_sync()
+        
         # Only proceed with other updates if no actions are in progress
         if not self.action_queue.is_busy:
             # Update debug console
@@ -1396,11 +1483,10 @@ class GameEngine:
         pygame.display.flip()
     
     def sync_inventory(self):
-        """Helper method to sync UI inventory with RaidInventory."""
+        """Bind character inventories to RaidInventory, bound ones are already in sync."""
         for char in self.stage_manager.player_characters:
             if char.inventory:
-                char.inventory.slots = [None] * 6
-                self.raid_inventory.populate_ui_inventory(char.inventory)
+                char.inventory.bind(self.raid_inventory)
     
     def draw_turn_counter(self):
         # Turn counter container
@@ -1442,6 +1528,9 @@ class GameEngine:
                 for boss in self.stage_manager.current_stage.bosses:
                     boss.draw(self.screen)
             
+            # Drawing placed the characters and their abilities, refresh their hit rects
+            self.update_hit_index()
+            
             # Draw target indicators for valid targets
             self.draw_target_indicators()
             
@@ -1496,6 +1585,9 @@ class GameEngine:
             self.render()
             self.clock.tick(60)
         
+        # Push any pending inventory changes before exiting
+        self.raid_inventory.close()
+        self.set_hard_mode(False)
         pygame.quit()
 
     def handle_character_death(self, character: Character):
@@ -0,0 +1,64 @@
+"""Per-frame input batching for the main loop.
+
+The game only reacts to quitting, keys and the mouse, so every other event type is
+blocked at the queue with `pygame.event.set_allowed` and never reaches Python.
+Each frame drains the queue once and folds every run of consecutive MOUSEMOTION
+events into one event at the latest position, so a high polling rate mouse costs
+one hover update per frame instead of one per report. Clicks and keys are kept in
+order between the folded motions, so drags and typing behave as before.
+"""
+from typing import List, Optional
+import pygame
+
+HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+)
+
+class InputBatcher:
+    """Drains the pygame event queue into one batch per frame."""
+
+    def __init__(self):
+        self.dropped_motion = 0  # Motion events folded away during the last poll
+
+    def install(self):
+        """Only let the handled event types into the queue. Needs pygame.display set up."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(HANDLED_EVENTS))
+        # Blocking only filters new events, drop what init queued (audio devices, window events)
+        pygame.event.clear()
+
+    def poll(self) -> List[pygame.event.Event]:
+        """Get this frame's events with motion runs folded into their last position."""
+        batch: List[pygame.event.Event] = []
+        motion: Optional[pygame.event.Event] = None
+        rel_x = rel_y = 0
+        self.dropped_motion = 0
+
+        for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                if motion is not None:
+                    self.dropped_motion += 1
+                motion = event
+                rel_x += event.rel[0]
+                rel_y += event.rel[1]
+                continue
+            if motion is not None:
+                batch.append(self._fold(motion, rel_x, rel_y))
+                motion = None
+                rel_x = rel_y = 0
+            batch.append(event)
+
+        if motion is not None:
+            batch.append(self._fold(motion, rel_x, rel_y))
+        return batch
+
+    @staticmethod
+    def _fold(last: pygame.event.Event, rel_x: int, rel_y: int) -> pygame.event.Event:
+        """Motion event at the last position, with the movement of the whole run."""
+        if last.rel == (rel_x, rel_y):
+            return last
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=last.pos, rel=(rel_x, rel_y), buttons=last.buttons)
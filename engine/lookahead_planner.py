@@ -0,0 +1,272 @@
+"""Hard mode boss planner using Monte Carlo rollouts.
+
+For each candidate (ability, target) of the acting boss the planner plays a few
+turns ahead from a plain-data model of the battle, with random follow-up moves for
+both sides, and picks the candidate with the best average outcome for the bosses.
+
+The model mirrors `Ability.use` for the base effect types (damage with damage
+reduction and defense, damage_all, heal, mana cost and cooldown). Abilities with a
+custom `use` are modeled by their declared effects only. Rollouts run in a process
+pool; whatever finished within the per-turn time budget is used, so a slow machine
+plays weaker instead of stalling the game.
+"""
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from abilities.base_ability import Ability
+    from characters.base_character import Character
+    from engine.utility_ai import BattleView
+
+SELF_TARGET = -1
+
+# Score of a killed player in HP, keeps the planner focused on finishing targets
+KILL_BONUS = 1000.0
+
+@dataclass(frozen=True)
+class AbilityModel:
+    damage: float  # Expected single target damage before reductions
+    damage_all: float  # Expected damage to every enemy before reductions
+    heal: float
+    cooldown: int
+    current_cooldown: int
+    mana_cost: int
+    self_target: bool
+    disabled: bool
+
+@dataclass(frozen=True)
+class CombatantModel:
+    hp: int
+    max_hp: int
+    mana: int
+    defense: int
+    damage_reduction: float
+    targetable: bool
+    abilities: Tuple[AbilityModel, ...]
+
+@dataclass(frozen=True)
+class RolloutState:
+    bosses: Tuple[CombatantModel, ...]
+    players: Tuple[CombatantModel, ...]
+
+def _expected(effect) -> float:
+    return effect.value * (effect.chance if effect.chance is not None else 1.0)
+
+def model_ability(ability: "Ability") -> AbilityModel:
+    return AbilityModel(
+        damage=sum(_expected(e) for e in ability.effects if e.type == "damage"),
+        damage_all=sum(_expected(e) for e in ability.effects if e.type == "damage_all"),
+        heal=sum(_expected(e) for e in ability.effects if e.type == "heal"),
+        cooldown=ability.cooldown,
+        current_cooldown=ability.current_cooldown,
+        mana_cost=ability.mana_cost,
+        self_target=ability.auto_self_target,
+        disabled=ability.is_disabled
+    )
+
+def model_character(char: "Character") -> CombatantModel:
+    return CombatantModel(
+        hp=char.stats.current_hp,
+        max_hp=char.stats.max_hp,
+        mana=char.stats.current_mana,
+        defense=char.stats.defense,
+        damage_reduction=char.get_damage_reduction(),
+        targetable=char.is_targetable(),
+        abilities=tuple(model_ability(ability) for ability in char.abilities)
+    )
+
+def build_state(bosses: Sequence["Character"], players: Sequence["Character"]) -> RolloutState:
+    return RolloutState(
+        bosses=tuple(model_character(boss) for boss in bosses),
+        players=tuple(model_character(char) for char in players)
+    )
+
+class _Side:
+    """Mutable copy of one side of a RolloutState used during a single rollout."""
+
+    def __init__(self, combatants: Tuple[CombatantModel, ...]):
+        self.models = combatants
+        self.hp = [c.hp for c in combatants]
+        self.mana = [c.mana for c in combatants]
+        self.cooldowns = [[a.current_cooldown for a in c.abilities] for c in combatants]
+
+    def alive(self) -> List[int]:
+        return [i for i, hp in enumerate(self.hp) if hp > 0]
+
+    def targets(self) -> List[int]:
+        return [i for i in self.alive() if self.models[i].targetable]
+
+    def usable(self, index: int) -> List[int]:
+        model = self.models[index]
+        return [
+            i for i, ability in enumerate(model.abilities)
+            if not ability.disabled and self.cooldowns[index][i] == 0 and self.mana[index] >= ability.mana_cost
+        ]
+
+    def hit(self, index: int, amount: float):
+        model = self.models[index]
+        reduced = amount * (1 - model.damage_reduction / 100)
+        self.hp[index] = max(0, self.hp[index] - max(1, int(reduced - model.defense)))
+
+    def end_turn(self):
+        for cooldowns in self.cooldowns:
+            for i, cooldown in enumerate(cooldowns):
+                if cooldown > 0:
+                    cooldowns[i] = cooldown - 1
+
+def _act(side: _Side, enemies: _Side, actor: int, ability_index: int, target: int):
+    ability = side.models[actor].abilities[ability_index]
+    if ability.damage and target != SELF_TARGET and enemies.hp[target] > 0:
+        enemies.hit(target, ability.damage)
+    if ability.damage_all:
+        for enemy in enemies.alive():
+            enemies.hit(enemy, ability.damage_all)
+    if ability.heal:
+        # Like Ability.use, heal whoever was targeted
+        healed, index = (side, actor) if target == SELF_TARGET else (enemies, target)
+        if healed.hp[index] > 0:
+            healed.hp[index] = min(healed.models[index].max_hp, healed.hp[index] + int(ability.heal))
+    side.mana[actor] -= ability.mana_cost
+    side.cooldowns[actor][ability_index] = ability.cooldown
+
+def _random_move(side: _Side, enemies: _Side, actor: int, rng: random.Random) -> Optional[Tuple[int, int]]:
+    usable = side.usable(actor)
+    targets = enemies.targets()
+    if not usable:
+        return None
+    ability_index = rng.choice(usable)
+    if side.models[actor].abilities[ability_index].self_target:
+        return ability_index, SELF_TARGET
+    if not targets:
+        return None
+    return ability_index, rng.choice(targets)
+
+def rollout(state: RolloutState, boss_index: int, candidate: Tuple[int, int], depth: int, rng: random.Random) -> float:
+    """Play depth turns starting with candidate and score the result for the bosses."""
+    bosses = _Side(state.bosses)
+    players = _Side(state.players)
+    start_boss_hp = sum(bosses.hp)
+    start_player_hp = sum(players.hp)
+
+    for turn in range(depth):
+        for boss in bosses.alive():
+            if turn == 0 and boss == boss_index:
+                move = candidate
+            elif turn == 0 and boss < boss_index:
+                continue  # Already acted this turn
+            else:
+                move = _random_move(bosses, players, boss, rng)
+            if move:
+                _act(bosses, players, boss, *move)
+        bosses.end_turn()
+        if not players.alive():
+            break
+        for player in players.alive():
+            move = _random_move(players, bosses, player, rng)
+            if move:
+                _act(players, bosses, player, *move)
+        players.end_turn()
+        if not bosses.alive():
+            break
+
+    damage_dealt = start_player_hp - sum(players.hp)
+    damage_taken = start_boss_hp - sum(bosses.hp)
+    kills = len(state.players) - len(players.alive())
+    return damage_dealt - damage_taken + kills * KILL_BONUS
+
+def evaluate_candidate(state: RolloutState, boss_index: int, candidate: Tuple[int, int],
+                       rollouts: int, depth: int, seed: int) -> float:
+    """Average rollout score of a candidate. Runs in a worker process."""
+    rng = random.Random(seed)
+    return sum(rollout(state, boss_index, candidate, depth, rng) for _ in range(rollouts)) / rollouts
+
+class PendingPlan:
+    """Rollouts submitted for one boss, collected once done or out of time."""
+
+    def __init__(self, boss: "Character", view: "BattleView", deadline: float,
+                 futures: Dict[Future, Tuple["Ability", List["Character"]]]):
+        self.boss = boss
+        self.view = view
+        self.deadline = deadline
+        self._futures = futures
+
+    def done(self) -> bool:
+        return time.perf_counter() >= self.deadline or all(f.done() for f in self._futures)
+
+    def result(self) -> Optional[Tuple["Ability", List["Character"]]]:
+        """Best candidate among the finished rollouts, None if none finished."""
+        best, best_score = None, None
+        for future, action in self._futures.items():
+            if not future.done() or future.cancelled() or future.exception():
+                future.cancel()
+                continue
+            score = future.result()
+            if best_score is None or score > best_score:
+                best, best_score = action, score
+        return best
+
+    def cancel(self):
+        for future in self._futures:
+            future.cancel()
+
+class LookaheadPlanner:
+    """Plans boss actions with rollouts in a process pool.
+
+    Args:
+        time_budget: Seconds to wait for rollouts per boss action
+        rollouts: Rollouts per candidate action
+        depth: Turns simulated per rollout
+        workers: Worker processes, defaults to the CPU count
+    """
+
+    def __init__(self, time_budget: float = 0.05, rollouts: int = 48, depth: int = 3, workers: Optional[int] = None):
+        self.time_budget = time_budget
+        self.rollouts = rollouts
+        self.depth = depth
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        """Spawn the worker processes ahead of the first boss turn."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            # Worker startup is slow, get it out of the way now
+            self._executor.submit(evaluate_candidate, RolloutState((), ()), 0, (0, 0), 1, 0, 0)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def plan(self, boss: "Character", view: "BattleView",
+             bosses: Sequence["Character"], players: Sequence["Character"]) -> Optional[PendingPlan]:
+        """Submit rollouts for every candidate of a boss.
+
+        Returns:
+            Optional[PendingPlan]: None if there is nothing to choose between
+        """
+        targets = [char for char in view.targets if char.is_alive()]
+        candidates = []
+        for ability_index, ability in enumerate(boss.abilities):
+            if not ability.can_use(boss):
+                continue
+            if ability.auto_self_target:
+                candidates.append(((ability_index, SELF_TARGET), (ability, [boss])))
+            else:
+                for target in targets:
+                    candidates.append(((ability_index, list(players).index(target)), (ability, [target])))
+        if len(candidates) < 2:
+            return None
+
+        self.start()
+        state = build_state(bosses, players)
+        boss_index = list(bosses).index(boss)
+        futures = {
+            self._executor.submit(evaluate_candidate, state, boss_index, candidate,
+                                  self.rollouts, self.depth, random.getrandbits(32)): action
+            for candidate, action in candidates
+        }
+        return PendingPlan(boss, view, time.perf_counter() + self.time_budget, futures)
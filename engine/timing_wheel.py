@@ -0,0 +1,102 @@
+"""Turn-indexed timing wheel for cooldowns.
+
+Cooldowns used to be decremented by walking every ability and inventory slot at the
+end of each turn. Instead, setting a cooldown schedules a timer on the shared
+`turn_wheel` for the turn it runs out, and the remaining turns are read off the
+wheel's clock. Ending a turn advances the clock once and only touches the timers
+that are due, so its cost follows what expires that turn, not how many abilities
+and items exist.
+
+The wheel is hierarchical: level 0 has one bucket per turn for the next `slots`
+turns, each higher level has buckets `slots` times as wide. Timers further out
+wait in a higher level and cascade down as the clock reaches their bucket.
+
+Example:
+    timer = turn_wheel.schedule(3, lambda: print("ready"))
+    turn_wheel.remaining(timer)  # 3
+"""
+from typing import Callable, List, Optional
+
+class Timer:
+    """A callback due on a turn of a TimingWheel."""
+    __slots__ = ("due", "callback", "cancelled")
+
+    def __init__(self, due: int, callback: Optional[Callable[[], None]]):
+        self.due = due
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        """Don't fire. The timer is dropped when the wheel reaches its bucket."""
+        self.cancelled = True
+        self.callback = None
+
+class TimingWheel:
+    """Timers by turn, fired when the clock advances past their turn.
+
+    Args:
+        slots: Buckets per level
+        levels: Number of levels, timers beyond slots ** levels turns wait in an overflow list
+    """
+
+    def __init__(self, slots: int = 64, levels: int = 2):
+        self.slots = slots
+        self.now = 0
+        self._wheels: List[List[List[Timer]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._overflow: List[Timer] = []
+
+    def schedule(self, delay: int, callback: Optional[Callable[[], None]] = None) -> Timer:
+        """Fire callback when the clock has advanced delay turns, at least one."""
+        timer = Timer(self.now + max(1, delay), callback)
+        self._place(timer)
+        return timer
+
+    def remaining(self, timer: Optional[Timer]) -> int:
+        """Turns until a timer is due, 0 once it fired or for no timer."""
+        if timer is None or timer.cancelled:
+            return 0
+        return max(0, timer.due - self.now)
+
+    def _place(self, timer: Timer):
+        delta = timer.due - self.now
+        span = 1
+        for wheel in self._wheels:
+            if delta < span * self.slots:
+                wheel[(timer.due // span) % self.slots].append(timer)
+                return
+            span *= self.slots
+        self._overflow.append(timer)
+
+    def _cascade(self, bucket: List[Timer]):
+        for timer in bucket:
+            if not timer.cancelled:
+                self._place(timer)
+
+    def advance(self):
+        """Move the clock one turn forward and fire the timers due on it."""
+        self.now += 1
+
+        # Every slots ** level turns, the next bucket of a level moves down a level
+        span = self.slots
+        for wheel in self._wheels[1:]:
+            if self.now % span:
+                break
+            index = (self.now // span) % self.slots
+            bucket, wheel[index] = wheel[index], []
+            self._cascade(bucket)
+            span *= self.slots
+        else:
+            if self.now % span == 0:
+                overflow, self._overflow = self._overflow, []
+                self._cascade(overflow)
+
+        index = self.now % self.slots
+        due, self._wheels[0][index] = self._wheels[0][index], []
+        for timer in due:
+            if not timer.cancelled:
+                callback = timer.callback
+                timer.cancel()  # Fired, remaining() is 0 from here on
+                if callback:
+                    callback()
+
+turn_wheel = TimingWheel()
@@ -0,0 +1,80 @@
+"""Ordered turn end processing.
+
+Ending a turn runs a fixed list of named phases (cooldowns, character effects,
+modifiers, stage mechanics, ...) registered once by the game engine. Each phase
+runs exactly once per turn, so hooks like modifier turn ends can't be triggered
+again from inside another phase, and every phase is timed so the cost of a turn
+can be read per phase and checked against a budget.
+
+Example:
+    pipeline.register("cooldowns", turn_wheel.advance, budget_ms=1.0)
+    pipeline.run()
+    for line in pipeline.report():
+        print(line)
+"""
+from dataclasses import dataclass
+import time
+from typing import Callable, List, Optional
+
+@dataclass(slots=True)
+class TurnPhase:
+    """A named step of the turn pipeline with its timings in milliseconds."""
+    name: str
+    callback: Callable[[], None]
+    budget_ms: Optional[float] = None  # Warn when a run takes longer
+    last_ms: float = 0.0
+    total_ms: float = 0.0
+    runs: int = 0
+
+    @property
+    def average_ms(self) -> float:
+        return self.total_ms / self.runs if self.runs else 0.0
+
+class TurnPipeline:
+    """Phases run in registration order, once per turn."""
+
+    def __init__(self):
+        self.phases: List[TurnPhase] = []
+        self._running = False
+
+    def register(self, name: str, callback: Callable[[], None], budget_ms: Optional[float] = None,
+                 before: Optional[str] = None):
+        """Add a phase at the end, or right before the phase named before."""
+        if any(phase.name == name for phase in self.phases):
+            raise ValueError(f"Turn phase {name!r} is already registered")
+        phase = TurnPhase(name, callback, budget_ms)
+        if before is None:
+            self.phases.append(phase)
+            return
+        for i, existing in enumerate(self.phases):
+            if existing.name == before:
+                self.phases.insert(i, phase)
+                return
+        raise KeyError(f"No turn phase named {before!r}")
+
+    def run(self):
+        """Run every phase once, timing each of them."""
+        if self._running:
+            raise RuntimeError("Turn pipeline is already running, phases must not end the turn")
+        self._running = True
+        try:
+            for phase in self.phases:
+                start = time.perf_counter()
+                phase.callback()
+                phase.last_ms = (time.perf_counter() - start) * 1000
+                phase.total_ms += phase.last_ms
+                phase.runs += 1
+                if phase.budget_ms is not None and phase.last_ms > phase.budget_ms:
+                    print(f"Turn phase {phase.name} took {phase.last_ms:.2f}ms (budget {phase.budget_ms:.2f}ms)")
+        finally:
+            self._running = False
+
+    def reset_timings(self):
+        for phase in self.phases:
+            phase.last_ms = phase.total_ms = 0.0
+            phase.runs = 0
+
+    def report(self) -> List[str]:
+        """One line per phase with its last and average time."""
+        return [f"{phase.name}: {phase.last_ms:.2f}ms last, {phase.average_ms:.2f}ms avg over {phase.runs}"
+                for phase in self.phases]
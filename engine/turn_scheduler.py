@@ -0,0 +1,48 @@
+"""Boss turn scheduling.
+
+Bosses used to poll for their turn in `update()` every frame. The scheduler
+instead wakes each boss exactly once when the boss phase of a turn begins, so the
+per-frame cost doesn't grow with the number of bosses.
+"""
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from characters.base_character import Character
+    from engine.utility_ai import BattleView
+
+class TurnScheduler:
+    """Hands out the bosses that still have to act in the current boss phase."""
+
+    def __init__(self):
+        self._pending: List["Character"] = []
+        self.is_active = False
+        self.round = 0
+        self.view: Optional["BattleView"] = None
+
+    def begin_round(self, bosses: List["Character"], view: Optional["BattleView"] = None):
+        """Start a boss phase. Bosses summoned during it act from the next one.
+
+        Args:
+            bosses: Bosses to wake, in order
+            view: Battle view shared by every boss AI during this phase
+        """
+        self._pending = list(bosses)
+        self.view = view
+        self.is_active = True
+        self.round += 1
+
+    def next_actor(self) -> Optional["Character"]:
+        """Get the next living boss to wake, None once every boss has acted."""
+        while self._pending:
+            boss = self._pending.pop(0)
+            if boss.is_alive():
+                return boss
+        self.is_active = False
+        self.view = None
+        return None
+
+    def reset(self):
+        """Drop the current boss phase, e.g. after restoring a checkpoint."""
+        self._pending = []
+        self.is_active = False
+        self.view = None
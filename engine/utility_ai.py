@@ -0,0 +1,182 @@
+"""Data-driven utility AI for boss ability selection.
+
+A boss declares an `ai_profile`: for each ability name a list of considerations
+that raise its weight in the right situation (low HP, unmarked targets, several
+targets, ...). Considerations are evaluated against a ScoringContext derived from a
+BattleView, which is built once when the boss phase begins and shared by every
+boss acting in it.
+
+Considerations only use numpy operations, so the fields of a ScoringContext can
+also be arrays (one entry per simulated battle) to score many states at once.
+
+Example:
+    ai_profile = UtilityProfile({
+        "Shadowstep": [SelfHpBelow(0.4, 2.0)],
+        "Death Mark": [HasUnmarkedTarget("Death Mark", 1.8)],
+    }, target_preferences={"Death Mark": PreferUnmarked("Death Mark")})
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from abilities.base_ability import Ability
+    from characters.base_character import Character
+
+Number = Union[float, np.ndarray]
+
+@dataclass
+class BattleView:
+    """What the boss AI needs to know about the battle, computed once per turn."""
+    targets: List["Character"]
+    hp_ratios: Dict[int, float]  # id(character) -> current/max HP, for targets and bosses
+    target_buffs: List[frozenset]  # Names of each target's buffs and debuffs
+    _marked: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, players: Sequence["Character"], bosses: Sequence["Character"]) -> "BattleView":
+        targets = [char for char in players if char.is_alive() and char.is_targetable()]
+        hp_ratios = {
+            id(char): char.stats.current_hp / char.stats.max_hp if char.stats.max_hp else 0.0
+            for char in list(targets) + list(bosses)
+        }
+        target_buffs = [
+            frozenset(getattr(effect, "name", None) for effect in char.buffs + char.debuffs)
+            for char in targets
+        ]
+        return cls(targets, hp_ratios, target_buffs)
+
+    @property
+    def target_count(self) -> int:
+        return len(self.targets)
+
+    def marked(self, mark: str) -> np.ndarray:
+        """Boolean array telling which targets carry the named effect."""
+        if mark not in self._marked:
+            self._marked[mark] = np.array([mark in buffs for buffs in self.target_buffs], dtype=bool)
+        return self._marked[mark]
+
+    def unmarked_count(self, mark: str) -> int:
+        return int(self.target_count - self.marked(mark).sum())
+
+    def context_for(self, boss: "Character") -> "ScoringContext":
+        """Build the scoring inputs for one boss."""
+        ratio = self.hp_ratios.get(id(boss))
+        if ratio is None:
+            ratio = boss.stats.current_hp / boss.stats.max_hp if boss.stats.max_hp else 0.0
+        return ScoringContext(self, ratio, self.target_count)
+
+@dataclass
+class ScoringContext:
+    """Inputs of the considerations. Scalars in game, arrays in batch simulations."""
+    view: Optional[BattleView]
+    self_hp_ratio: Number
+    target_count: Number
+    unmarked_counts: Dict[str, Number] = field(default_factory=dict)
+
+    def unmarked_count(self, mark: str) -> Number:
+        if mark not in self.unmarked_counts:
+            self.unmarked_counts[mark] = self.view.unmarked_count(mark) if self.view else 0
+        return self.unmarked_counts[mark]
+
+class Consideration:
+    """Raises an ability's weight to `weight` when the consideration applies."""
+
+    def __init__(self, weight: float):
+        self.weight = weight
+
+    def applies(self, context: ScoringContext) -> Union[bool, np.ndarray]:
+        raise NotImplementedError("Each consideration must implement applies")
+
+    def score(self, context: ScoringContext) -> Number:
+        return np.where(self.applies(context), self.weight, 1.0)
+
+class Always(Consideration):
+    def applies(self, context: ScoringContext) -> bool:
+        return True
+
+class SelfHpBelow(Consideration):
+    """The boss is below a fraction of its max HP."""
+
+    def __init__(self, threshold: float, weight: float):
+        super().__init__(weight)
+        self.threshold = threshold
+
+    def applies(self, context: ScoringContext) -> Union[bool, np.ndarray]:
+        return np.asarray(context.self_hp_ratio) < self.threshold
+
+class HasUnmarkedTarget(Consideration):
+    """At least one target doesn't carry the named effect yet."""
+
+    def __init__(self, mark: str, weight: float):
+        super().__init__(weight)
+        self.mark = mark
+
+    def applies(self, context: ScoringContext) -> Union[bool, np.ndarray]:
+        return np.asarray(context.unmarked_count(self.mark)) > 0
+
+class TargetCountAtLeast(Consideration):
+    """There are at least `count` targets."""
+
+    def __init__(self, count: int, weight: float):
+        super().__init__(weight)
+        self.count = count
+
+    def applies(self, context: ScoringContext) -> Union[bool, np.ndarray]:
+        return np.asarray(context.target_count) >= self.count
+
+class PreferUnmarked:
+    """Target preference: pick among targets without the named effect if there are any."""
+
+    def __init__(self, mark: str):
+        self.mark = mark
+
+    def filter(self, view: BattleView, targets: List["Character"]) -> List["Character"]:
+        marked = {id(char) for char, is_marked in zip(view.targets, view.marked(self.mark)) if is_marked}
+        return [target for target in targets if id(target) not in marked]
+
+class UtilityProfile:
+    """Ability considerations and target preferences of one kind of boss.
+
+    An ability's weight is the highest weight among its applying considerations,
+    1.0 if none apply or the ability isn't listed.
+    """
+
+    def __init__(self,
+                 considerations: Dict[str, Sequence[Consideration]],
+                 target_preferences: Optional[Dict[str, PreferUnmarked]] = None):
+        self.considerations = {name: tuple(items) for name, items in considerations.items()}
+        self.target_preferences = target_preferences or {}
+
+    def weight(self, ability_name: str, context: ScoringContext) -> Number:
+        weight = np.asarray(1.0)
+        for consideration in self.considerations.get(ability_name, ()):
+            weight = np.maximum(weight, consideration.score(context))
+        return weight
+
+    def weights(self, ability_names: Sequence[str], context: ScoringContext) -> np.ndarray:
+        """Weights of several abilities, shape (abilities,) or (abilities, states) in batches."""
+        return np.stack([np.broadcast_to(self.weight(name, context), np.shape(context.self_hp_ratio))
+                         for name in ability_names])
+
+    def choose_action(self, boss: "Character", view: BattleView) -> Optional[Tuple["Ability", List["Character"]]]:
+        """Pick a weighted ability and its targets for a boss."""
+        targets = [target for target in view.targets if target.is_alive()]
+        available_abilities = [
+            ability for ability in boss.abilities
+            if ability.can_use(boss) and (ability.auto_self_target or targets)
+        ]
+        if not available_abilities:
+            return None
+
+        context = view.context_for(boss)
+        weights = self.weights([ability.name for ability in available_abilities], context)
+        ability = random.choices(available_abilities, weights=weights.tolist(), k=1)[0]
+
+        if ability.auto_self_target:
+            return ability, [boss]
+
+        preference = self.target_preferences.get(ability.name)
+        candidates = (preference.filter(view, targets) if preference else None) or targets
+        return ability, [random.choice(candidates)]
@@ -0,0 +1,90 @@
+"""Weighted random sampling for loot and modifier rolls.
+
+AliasTable draws with replacement in constant time per draw after a linear setup
+(Vose's alias method), so a table built once per loot table or modifier pool makes
+every later roll O(1). weighted_sample draws k distinct items without replacement
+with Efraimidis-Spirakis keys: one pass over the weights keeping the k best keys in
+a heap, instead of renormalizing the remaining weights after every pick.
+
+Both work on plain sequences, e.g. modifier classes weighted by their rarity,
+without creating any of the items.
+"""
+import heapq
+import math
+import random
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+class AliasTable(Generic[T]):
+    """Items with weights, sampled with replacement in constant time.
+
+    Args:
+        items: Items to draw
+        weights: Non-negative weights of the items, with a positive sum
+
+    Raises:
+        ValueError: If there are no items, the lengths differ or all weights are 0
+    """
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if not items or len(items) != len(weights):
+            raise ValueError("AliasTable needs one weight per item and at least one item")
+        total = sum(weights)
+        if total <= 0 or min(weights) < 0:
+            raise ValueError("AliasTable weights must be non-negative with a positive sum")
+
+        size = len(weights)
+        self.items = list(items)
+        self._size = size
+        self._probability = [1.0] * size
+        self._alias = list(range(size))
+
+        # Split the scaled weights into columns of height 1, each holding at most two items
+        scaled = [weight * size / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever is left is 1 up to rounding errors, its columns keep probability 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def sample_index(self, rng: Optional[random.Random] = None) -> int:
+        """Draw the index of an item."""
+        rng = rng or random
+        index = rng.randrange(self._size)
+        return index if rng.random() < self._probability[index] else self._alias[index]
+
+    def sample(self, rng: Optional[random.Random] = None) -> T:
+        """Draw an item."""
+        return self.items[self.sample_index(rng)]
+
+def weighted_sample(items: Sequence[T], weights: Sequence[float], k: int,
+                    rng: Optional[random.Random] = None) -> List[T]:
+    """Draw up to k distinct items without replacement.
+
+    Each pick is proportional to its weight among the items not picked yet, in pick
+    order. Items with a weight of 0 are never picked, so fewer than k items are
+    returned if fewer have a positive weight.
+    """
+    if k <= 0:
+        return []
+    rng = rng or random
+    best = []  # Min-heap of the (key, index) pairs with the k largest keys
+    for index, weight in enumerate(weights):
+        if weight <= 0:
+            continue
+        # log(u) / w orders items like u ** (1 / w) without underflowing for small weights
+        key = math.log(1.0 - rng.random()) / weight
+        if len(best) < k:
+            heapq.heappush(best, (key, index))
+        elif key > best[0][0]:
+            heapq.heapreplace(best, (key, index))
+    best.sort(reverse=True)
+    return [items[index] for _, index in best]
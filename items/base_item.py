@@ -1,7 +1,8 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Optional, List, TYPE_CHECKING
 import pygame
-from pathlib import Path
-from PIL import Image
+from characters.prototypes import get_font
+from items.item_registry import cooldown_overlay, load_item_icon, number_glyph
+from engine.timing_wheel import Timer, turn_wheel
 
 if TYPE_CHECKING:
     from characters.base_character import Character
@@ -21,6 +22,12 @@ class Item:
         "Legendary": (255, 128, 0)   # Orange
     }
     
+    # Rendered tooltip text per item type, see draw_tooltip
+    _tooltip_cache: Dict[tuple, tuple] = {}
+    
+    # Cooldown timer on the turn wheel, see current_cooldown
+    _cooldown_timer: Optional[Timer] = None
+    
     def __init__(self, name: str, description: str, rarity: str, item_type: str, icon_path: str, max_stack: int = 1):
         self.name = name
         self.description = description
@@ -29,22 +36,15 @@ class Item:
         self.max_stack = max_stack
         self.stack_count = 1
         
-        # Load and scale item icon with high quality scaling
-        pil_image = Image.open(str(Path(icon_path)))
-        pil_image = pil_image.convert('RGBA')  # Ensure RGBA mode for transparency
-        pil_image = pil_image.resize((50, 50), Image.Resampling.LANCZOS)  # High quality resize
-        
-        # Convert PIL image to Pygame surface
-        image_data = pil_image.tobytes()
-        self.icon = pygame.image.fromstring(image_data, pil_image.size, 'RGBA')
-        self.icon = self.icon.convert_alpha()  # Convert for faster blitting
+        # Icon is loaded once per path and shared by every stack of the item
+        self.icon = load_item_icon(icon_path)
         
         # UI state
         self.is_hovered = False
         self.position = (0, 0)  # Will be set when drawn
         
         # Tooltip font
-        self.tooltip_font = pygame.font.Font(None, 24)
+        self.tooltip_font = get_font(24)
         
         # Cooldown system
         self.cooldown = 0  # Base cooldown duration
@@ -82,8 +82,8 @@ class Item:
         if count <= 0 or count >= self.stack_count:
             return None
         
-        # Create new item with the split amount
-        new_item = self.__class__(self.name, self.description, self.rarity, self.item_type, self.max_stack)
+        # Create new item with the split amount, item types take no arguments
+        new_item = self.__class__()
         new_item.stack_count = count
         self.stack_count -= count
         return new_item
@@ -103,23 +103,28 @@ class Item:
         padding = 16
         line_spacing = 6
         
-        # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
-        
-        title_shadow = title_font.render(self.name, True, (0, 0, 0))
-        title_surface = title_font.render(self.name, True, self.RARITY_COLORS.get(self.rarity, (255, 255, 255)))
-        desc_surface = desc_font.render(self.description, True, (220, 220, 220))
-        
-        # Prepare effect text
-        effect_lines = ["Effects:"]
-        if self.cooldown > 0:
-            effect_lines.append(f"• Cooldown: {self.cooldown} turns")
-        if self.ends_turn:
-            effect_lines.append("• Ends your turn")
-        
-        effect_surfaces = [detail_font.render(line, True, (220, 220, 220)) for line in effect_lines]
+        # Tooltip text only depends on the item type, render it once
+        key = (self.name, self.rarity, self.description, self.cooldown, self.ends_turn)
+        if key not in Item._tooltip_cache:
+            title_font = get_font(32)
+            desc_font = get_font(26)
+            detail_font = get_font(24)
+            
+            # Prepare effect text
+            effect_lines = ["Effects:"]
+            if self.cooldown > 0:
+                effect_lines.append(f"• Cooldown: {self.cooldown} turns")
+            if self.ends_turn:
+                effect_lines.append("• Ends your turn")
+            
+            Item._tooltip_cache[key] = (
+                title_font.render(self.name, True, (0, 0, 0)),
+                title_font.render(self.name, True, self.RARITY_COLORS.get(self.rarity, (255, 255, 255))),
+                desc_font.render(self.description, True, (220, 220, 220)),
+                [detail_font.render(line, True, (220, 220, 220)) for line in effect_lines],
+                [detail_font.render(line, True, (0, 0, 0)) for line in effect_lines]
+            )
+        title_shadow, title_surface, desc_surface, effect_surfaces, effect_shadows = Item._tooltip_cache[key]
         
         # Calculate tooltip dimensions
         width = max(
@@ -166,13 +171,23 @@ class Item:
         current_y += desc_surface.get_height() + line_spacing * 2
         
         # Draw effects
-        for i, effect_surface in enumerate(effect_surfaces):
+        for effect_surface, shadow in zip(effect_surfaces, effect_shadows):
             # Draw shadow for each line
-            shadow = detail_font.render(effect_lines[i], True, (0, 0, 0))
             screen.blit(shadow, (x + padding + 1, current_y + 1))
             screen.blit(effect_surface, (x + padding, current_y))
             current_y += effect_surface.get_height() + line_spacing
         
+    @property
+    def current_cooldown(self) -> int:
+        """Turns until the item can be used again, counted down by the turn wheel."""
+        return turn_wheel.remaining(self._cooldown_timer)
+    
+    @current_cooldown.setter
+    def current_cooldown(self, turns: int):
+        if self._cooldown_timer is not None:
+            self._cooldown_timer.cancel()
+        self._cooldown_timer = turn_wheel.schedule(turns) if turns > 0 else None
+    
     def is_available(self) -> bool:
         """Check if the item can be used (cooldown)"""
         return self.current_cooldown == 0
@@ -208,33 +223,18 @@ class Item:
         """Draw the item with cooldown overlay"""
         # Draw item icon
         screen.blit(self.icon, self.position)
+        width, height = self.icon.get_size()
         
-        # Draw cooldown overlay if not available
+        # Draw cooldown overlay and number if not available
         if not self.is_available():
-            cooldown_surface = pygame.Surface(self.icon.get_size(), pygame.SRCALPHA)
-            cooldown_surface.fill((0, 0, 0, 128))  # Semi-transparent black
-            screen.blit(cooldown_surface, self.position)
-            
-            # Draw cooldown number
-            font = pygame.font.Font(None, 36)
-            text = font.render(str(self.current_cooldown), True, (255, 255, 255))
-            text_rect = text.get_rect(center=(self.position[0] + self.icon.get_width()//2,
-                                            self.position[1] + self.icon.get_height()//2))
-            screen.blit(text, text_rect)
+            screen.blit(cooldown_overlay((width, height)), self.position)
+            text = number_glyph(self.current_cooldown, 36)
+            screen.blit(text, text.get_rect(center=(self.position[0] + width//2, self.position[1] + height//2)))
         
         # Draw stack count if more than 1
         if self.stack_count > 1:
-            font = pygame.font.Font(None, 24)
-            text = font.render(str(self.stack_count), True, (255, 255, 255))
-            text_rect = text.get_rect(bottomright=(self.position[0] + self.icon.get_width() - 2,
-                                                 self.position[1] + self.icon.get_height() - 2))
-            # Draw text shadow
-            shadow = font.render(str(self.stack_count), True, (0, 0, 0))
-            shadow_rect = text_rect.copy()
-            shadow_rect.x += 1
-            shadow_rect.y += 1
-            screen.blit(shadow, shadow_rect)
-            screen.blit(text, text_rect)
+            text = number_glyph(self.stack_count)
+            screen.blit(text, text.get_rect(bottomright=(self.position[0] + width - 1, self.position[1] + height - 1)))
 
     def get_rarity_color(self) -> tuple:
         """Get the color associated with this item's rarity."""
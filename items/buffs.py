@@ -1,5 +1,6 @@
 from items.base_item import Item
 from characters.base_character import Character, StatusEffect
+from characters.prototypes import get_font
 import pygame
 
 class PiranhaScales(Item):
@@ -46,9 +47,9 @@ class PiranhaScales(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -187,9 +188,9 @@ class TidalCharm(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -338,9 +339,9 @@ class VoidEssence(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -1,6 +1,7 @@
 from items.base_item import Item
 from characters.base_character import Character, StatusEffect
 from abilities.base_ability import Ability
+from characters.prototypes import get_font
 import pygame
 from typing import List
 
@@ -49,9 +50,9 @@ class MurkyWaterVial(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -125,6 +126,28 @@ class MurkyWaterVial(Item):
             screen.blit(effect_surface, (x + padding, current_y))
             current_y += effect_surface.get_height() + line_spacing
 
+class DamageBoostBuff(StatusEffect):
+    """Piranha Tooth buff that adds flat damage to abilities"""
+    __slots__ = ("name", "description")
+    
+    def __init__(self, icon):
+        super().__init__("custom", 40, 10, icon)  # Use custom type to enable custom tooltips
+        self.name = "Piranha's Bite"
+        self.description = "Your abilities are empowered with the piranha's ferocity."
+    
+    def apply_damage_increase(self, damage: int) -> int:
+        return damage + self.value  # Add flat damage bonus
+    
+    def update(self) -> bool:
+        self.duration -= 1
+        return self.duration > 0
+    
+    def get_tooltip_title(self) -> str:
+        return "Piranha's Bite"
+    
+    def get_tooltip_text(self) -> str:
+        return f"Your abilities are empowered with the piranha's ferocity.\n\nEffects:\n• Increases ability damage by {self.value}\n• {self.duration} turns remaining"
+
 class PiranhaTooth(Item):
     def __init__(self):
         super().__init__(
@@ -146,26 +169,6 @@ class PiranhaTooth(Item):
         # Call base class use method to log the use
         super().use(user, target)
         
-        # Create a custom buff that adds flat damage to abilities
-        class DamageBoostBuff(StatusEffect):
-            def __init__(self, icon):
-                super().__init__("custom", 40, 10, icon)  # Use custom type to enable custom tooltips
-                self.name = "Piranha's Bite"
-                self.description = "Your abilities are empowered with the piranha's ferocity."
-            
-            def apply_damage_increase(self, damage: int) -> int:
-                return damage + self.value  # Add flat damage bonus
-            
-            def update(self) -> bool:
-                self.duration -= 1
-                return self.duration > 0
-            
-            def get_tooltip_title(self) -> str:
-                return "Piranha's Bite"
-            
-            def get_tooltip_text(self) -> str:
-                return f"Your abilities are empowered with the piranha's ferocity.\n\nEffects:\n• Increases ability damage by {self.value}\n• {self.duration} turns remaining"
-        
         # Apply the buff
         buff = DamageBoostBuff(self.icon)
         target.add_buff(buff)
@@ -189,9 +192,9 @@ class PiranhaTooth(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -346,9 +349,9 @@ class DeepSeaEssence(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -464,9 +467,9 @@ class IceShard(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS["Common"])  # Use common color
@@ -608,6 +611,68 @@ class IceDagger(Item):
         
         return True 
 
+class StealthBuff(StatusEffect):
+    """Smoke Bomb buff that makes the target untargetable"""
+    __slots__ = ("name", "description", "original_alpha", "target")
+    
+    def __init__(self, icon):
+        super().__init__("stealth", 0, 4, icon)
+        self.name = "Smoke Screen"
+        self.description = "Untargetable from Smoke Bomb"
+        self.original_alpha = None
+        self.target = None
+        print("[DEBUG] StealthBuff created with duration:", self.duration)
+        
+    def update(self):
+        """Update duration and return True if buff should continue"""
+        self.duration -= 1
+        self.description = f"Untargetable from Smoke Bomb\n{self.duration} turns remaining"
+        print(f"[DEBUG] StealthBuff updated - {self.duration} turns remaining")
+        
+        # If buff is expiring, restore opacity
+        if self.duration <= 0 and self.target:
+            if self.original_alpha is not None:
+                self.target.own_image().set_alpha(self.original_alpha)
+                print("[DEBUG] Restored original alpha:", self.original_alpha)
+            from engine.game_engine import GameEngine
+            if GameEngine.instance:
+                GameEngine.instance.battle_log.add_message(
+                    f"{self.target.name} emerges from the shadows!",
+                    GameEngine.instance.battle_log.TEXT_COLOR
+                )
+        
+        return self.duration > 0
+        
+    def is_stealthed(self):
+        """Return True while buff is active"""
+        print("[DEBUG] Checking stealth status:", self.duration > 0)
+        return self.duration > 0
+        
+    def get_tooltip_title(self):
+        return "Smoke Screen"
+        
+    def get_tooltip_text(self):
+        return f"Untargetable for {self.duration} more turns"
+        
+    def on_apply(self, target: Character):
+        """Called when the buff is applied"""
+        print("[DEBUG] Applying stealth buff to target:", target.name)
+        self.target = target
+        self.original_alpha = target.image.get_alpha()
+        target.own_image().set_alpha(51)  # 20% opacity
+        print("[DEBUG] Set alpha to 51 (20% opacity)")
+        
+    def on_remove(self, target: Character):
+        """Called when the buff is removed"""
+        print("[DEBUG] Removing stealth buff from target:", target.name)
+        if self.original_alpha is not None:
+            target.own_image().set_alpha(self.original_alpha)
+            print("[DEBUG] Restored original alpha:", self.original_alpha)
+        
+    def is_targetable(self):
+        """Return False to make character untargetable"""
+        return False
+
 class SmokeBomb(Item):
     def __init__(self):
         super().__init__(
@@ -632,66 +697,6 @@ class SmokeBomb(Item):
         # Call base class use method to log the use
         super().use(user, target)
             
-        # Create stealth buff
-        class StealthBuff(StatusEffect):
-            def __init__(self, icon):
-                super().__init__("stealth", 0, 4, icon)
-                self.name = "Smoke Screen"
-                self.description = "Untargetable from Smoke Bomb"
-                self.original_alpha = None
-                self.target = None
-                print("[DEBUG] StealthBuff created with duration:", self.duration)
-                
-            def update(self):
-                """Update duration and return True if buff should continue"""
-                self.duration -= 1
-                self.description = f"Untargetable from Smoke Bomb\n{self.duration} turns remaining"
-                print(f"[DEBUG] StealthBuff updated - {self.duration} turns remaining")
-                
-                # If buff is expiring, restore opacity
-                if self.duration <= 0 and self.target:
-                    if self.original_alpha is not None:
-                        self.target.image.set_alpha(self.original_alpha)
-                        print("[DEBUG] Restored original alpha:", self.original_alpha)
-                    from engine.game_engine import GameEngine
-                    if GameEngine.instance:
-                        GameEngine.instance.battle_log.add_message(
-                            f"{self.target.name} emerges from the shadows!",
-                            GameEngine.instance.battle_log.TEXT_COLOR
-                        )
-                
-                return self.duration > 0
-                
-            def is_stealthed(self):
-                """Return True while buff is active"""
-                print("[DEBUG] Checking stealth status:", self.duration > 0)
-                return self.duration > 0
-                
-            def get_tooltip_title(self):
-                return "Smoke Screen"
-                
-            def get_tooltip_text(self):
-                return f"Untargetable for {self.duration} more turns"
-                
-            def on_apply(self, target: Character):
-                """Called when the buff is applied"""
-                print("[DEBUG] Applying stealth buff to target:", target.name)
-                self.target = target
-                self.original_alpha = target.image.get_alpha()
-                target.image.set_alpha(51)  # 20% opacity
-                print("[DEBUG] Set alpha to 51 (20% opacity)")
-                
-            def on_remove(self, target: Character):
-                """Called when the buff is removed"""
-                print("[DEBUG] Removing stealth buff from target:", target.name)
-                if self.original_alpha is not None:
-                    target.image.set_alpha(self.original_alpha)
-                    print("[DEBUG] Restored original alpha:", self.original_alpha)
-                
-            def is_targetable(self):
-                """Return False to make character untargetable"""
-                return False
-        
         # Apply the stealth buff
         buff = StealthBuff(self.icon)
         print("[DEBUG] Adding stealth buff to target")
@@ -718,9 +723,9 @@ class SmokeBomb(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, (255, 255, 255))
@@ -795,6 +800,42 @@ class SmokeBomb(Item):
             screen.blit(effect_surface, (x + padding, current_y))
             current_y += effect_surface.get_height() + line_spacing
 
+class AbyssalRegenBuff(StatusEffect):
+    """Leviathan's Mist Vial regeneration"""
+    __slots__ = ("name", "description", "_character")
+    
+    def __init__(self, character: Character):
+        super().__init__("custom", 88, 2, pygame.image.load("assets/buffs/abyssal_regen.png"))
+        self.name = "Abyssal Regeneration"
+        self.description = "Regenerates 88 HP at the end of each turn"
+        self._character = character
+        self.heal_per_turn = 88  # Same as boss's healing amount
+    
+    def update(self) -> bool:
+        """Update duration and return True if buff should continue"""
+        if self.duration > 0:
+            # Apply healing at end of turn
+            self._character.heal(self.heal_per_turn)
+            # Log the healing
+            from engine.game_engine import GameEngine
+            if GameEngine.instance:
+                GameEngine.instance.battle_log.add_message(
+                    f"  {self._character.name} regenerates {self.heal_per_turn} HP from Abyssal Regeneration",
+                    GameEngine.instance.battle_log.HEAL_COLOR
+                )
+        
+        self.duration -= 1
+        self.description = f"Regenerates {self.heal_per_turn} HP at the end of each turn\n{self.duration} turns remaining"
+        return self.duration > 0
+    
+    def get_tooltip_title(self) -> str:
+        return "Abyssal Regeneration"
+    
+    def get_tooltip_text(self) -> str:
+        if self.duration > 0:
+            return f"Regenerates {self.heal_per_turn} HP at the end of each turn\n{self.duration} turns remaining"
+        return "Abyssal Regeneration has expired"
+
 class LeviathanMistVial(Item):
     def __init__(self):
         super().__init__(
@@ -815,40 +856,6 @@ class LeviathanMistVial(Item):
         heal_amount = int(target.stats.max_hp * 0.20)  # 20% max HP
         target.heal(heal_amount)
         
-        # Create and apply the Abyssal Regeneration buff
-        class AbyssalRegenBuff(StatusEffect):
-            def __init__(self, character: Character):
-                super().__init__("custom", 88, 2, pygame.image.load("assets/buffs/abyssal_regen.png"))
-                self.name = "Abyssal Regeneration"
-                self.description = "Regenerates 88 HP at the end of each turn"
-                self._character = character
-                self.heal_per_turn = 88  # Same as boss's healing amount
-            
-            def update(self) -> bool:
-                """Update duration and return True if buff should continue"""
-                if self.duration > 0:
-                    # Apply healing at end of turn
-                    self._character.heal(self.heal_per_turn)
-                    # Log the healing
-                    from engine.game_engine import GameEngine
-                    if GameEngine.instance:
-                        GameEngine.instance.battle_log.add_message(
-                            f"  {self._character.name} regenerates {self.heal_per_turn} HP from Abyssal Regeneration",
-                            GameEngine.instance.battle_log.HEAL_COLOR
-                        )
-                
-                self.duration -= 1
-                self.description = f"Regenerates {self.heal_per_turn} HP at the end of each turn\n{self.duration} turns remaining"
-                return self.duration > 0
-            
-            def get_tooltip_title(self) -> str:
-                return "Abyssal Regeneration"
-            
-            def get_tooltip_text(self) -> str:
-                if self.duration > 0:
-                    return f"Regenerates {self.heal_per_turn} HP at the end of each turn\n{self.duration} turns remaining"
-                return "Abyssal Regeneration has expired"
-        
         # Apply the buff
         buff = AbyssalRegenBuff(target)
         target.add_buff(buff)
@@ -874,9 +881,9 @@ class LeviathanMistVial(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS["Rare"])  # Use Rare color
@@ -1087,9 +1094,9 @@ class ManaPotion(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS["Common"])
@@ -1212,9 +1219,9 @@ class AtlanteanTrident(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS["Epic"])
@@ -1409,9 +1416,9 @@ class UnderwaterCursedShell(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS["Rare"])
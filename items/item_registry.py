@@ -0,0 +1,99 @@
+"""Item types by name and the data shared by every stack of a type.
+
+Everything an item type has that never changes per stack (the scaled icon, the
+rendered tooltip text) is built once per type. The Item objects in inventory slots
+are stack handles holding only per-stack state (count, cooldown, hover state), and
+syncing an inventory reuses the handles already in the slots, so it touches neither
+the disk nor PIL. Stack counts and cooldowns are drawn from shared number glyphs and
+a shared cooldown overlay, so drawing a stack never renders text.
+"""
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, TYPE_CHECKING
+import pygame
+from PIL import Image
+from characters.prototypes import get_font
+
+if TYPE_CHECKING:
+    from items.base_item import Item
+
+ITEM_ICON_SIZE = (50, 50)
+
+_icon_cache: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+
+def load_item_icon(icon_path: str, size: Tuple[int, int] = ITEM_ICON_SIZE) -> pygame.Surface:
+    """Load an item icon with high quality scaling, once per path.
+
+    The returned surface is shared by every stack of the item, callers must copy it
+    before drawing on it or changing its alpha.
+    """
+    key = (icon_path, size)
+    if key not in _icon_cache:
+        # Load and scale using PIL for high quality resizing
+        pil_image = Image.open(str(Path(icon_path)))
+        pil_image = pil_image.convert('RGBA')  # Ensure RGBA mode for transparency
+        pil_image = pil_image.resize(size, Image.Resampling.LANCZOS)  # High quality resize
+        icon = pygame.image.fromstring(pil_image.tobytes(), pil_image.size, 'RGBA')
+        _icon_cache[key] = icon.convert_alpha()  # Convert for faster blitting
+    return _icon_cache[key]
+
+_overlay_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+_glyph_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+def cooldown_overlay(size: Tuple[int, int]) -> pygame.Surface:
+    """Get the shared semi-transparent overlay dimming an item on cooldown."""
+    if size not in _overlay_cache:
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 128))  # Semi-transparent black
+        _overlay_cache[size] = overlay
+    return _overlay_cache[size]
+
+def number_glyph(value: int, font_size: int = 24) -> pygame.Surface:
+    """Get the shared white rendering of a number with a 1px drop shadow.
+
+    The text sits at the top left of the surface, the shadow makes it 1px wider and
+    taller.
+    """
+    key = (value, font_size)
+    if key not in _glyph_cache:
+        font = get_font(font_size)
+        text = font.render(str(value), True, (255, 255, 255))
+        glyph = pygame.Surface((text.get_width() + 1, text.get_height() + 1), pygame.SRCALPHA)
+        glyph.blit(font.render(str(value), True, (0, 0, 0)), (1, 1))
+        glyph.blit(text, (0, 0))
+        _glyph_cache[key] = glyph
+    return _glyph_cache[key]
+
+class ItemRegistry:
+    """Item classes by display name."""
+
+    def __init__(self):
+        self._classes: Dict[str, type] = {}
+
+    def register(self, name: str, item_class: type):
+        self._classes[name] = item_class
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._classes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._classes)
+
+    def create(self, name: str, count: int = 1) -> "Item":
+        """Create a new stack handle of an item type."""
+        if name not in self._classes:
+            raise KeyError(f"No item registered as {name!r}")
+        item = self._classes[name]()
+        item.stack_count = count
+        return item
+
+    def stack(self, name: str, count: int, handle: Optional["Item"] = None) -> "Item":
+        """Get a stack handle of count items, reusing handle if it is of the same type.
+
+        Reused handles keep their cooldown and UI state.
+        """
+        if handle is not None and type(handle) is self._classes.get(name):
+            handle.stack_count = count
+            return handle
+        return self.create(name, count)
+
+item_registry = ItemRegistry()
@@ -1,5 +1,6 @@
 from items.base_item import Item
 from characters.base_character import Character, StatusEffect
+from characters.prototypes import get_font
 import pygame
 
 class IceBlade(Item):
@@ -61,9 +62,9 @@ class IceBlade(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS["Legendary"])  # Use legendary color
@@ -196,9 +197,9 @@ class ZasalamelsScythe(Item):
         line_spacing = 6
         
         # Prepare text surfaces with shadows
-        title_font = pygame.font.Font(None, 32)
-        desc_font = pygame.font.Font(None, 26)
-        detail_font = pygame.font.Font(None, 24)
+        title_font = get_font(32)
+        desc_font = get_font(26)
+        detail_font = get_font(24)
         
         title_shadow = title_font.render(self.name, True, (0, 0, 0))
         title_surface = title_font.render(self.name, True, self.RARITY_COLORS.get(self.rarity, (255, 255, 255)))
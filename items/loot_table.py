@@ -1,29 +1,70 @@
+"""Loot tables of bosses and drop statistics for balancing them.
+
+`LootTable.roll_loot` rolls the drops of one kill. `simulate` samples many kills at
+once with NumPy and `exact_stats` computes the same statistics exactly by
+enumerating every combination of entry outcomes, e.g. to tune a table:
+
+    print(stage.get_loot_table(Piranha).exact_stats())
+"""
 from typing import List, Dict, Optional
 from dataclasses import dataclass
+from math import comb
 import random
+import numpy as np
+from engine.weighted_sampling import AliasTable
 
-@dataclass
+# Joint entry outcomes exact_stats enumerates before giving up
+EXACT_MAX_OUTCOMES = 1_000_000
+SIMULATION_BATCH = 100_000  # Kills sampled per batch, bounds simulate's memory use
+
+@dataclass(slots=True)
 class LootEntry:
     item_class: type  # The class of the item to create
     chance: float  # Drop chance as a percentage (0-100)
     min_count: int = 1  # Minimum number of items to drop
     max_count: int = 1  # Maximum number of items to drop
 
+@dataclass
+class LootStats:
+    """Drop statistics of a loot table per kill, items keyed by class name."""
+    kills: Optional[int]  # Simulated kills, None for exact statistics
+    expected: Dict[str, float]  # Mean dropped units per kill
+    distribution: Dict[str, np.ndarray]  # Probability of dropping k units, indexed by k
+    total_distribution: np.ndarray  # Probability of dropping k items in total
+
+    def __str__(self) -> str:
+        source = "exact" if self.kills is None else f"{self.kills} kills"
+        lines = [f"Loot per kill ({source}):"]
+        for name, mean in self.expected.items():
+            chance = 1 - self.distribution[name][0]
+            lines.append(f"  {name}: {mean:.3f} expected, {chance * 100:.2f}% drop chance")
+        totals = ", ".join(f"{k}: {p * 100:.2f}%" for k, p in enumerate(self.total_distribution) if p > 0)
+        lines.append(f"  Total drops: {totals}")
+        return "\n".join(lines)
+
 class LootTable:
     def __init__(self, min_total_drops: int = 0, max_total_drops: int = 1):
         self.entries: List[LootEntry] = []
         self.min_total_drops = min_total_drops
         self.max_total_drops = max_total_drops
+        self._top_up_table: Optional[AliasTable] = None  # Built on the first top up
     
     def add_entry(self, item_class: type, chance: float, min_count: int = 1, max_count: int = 1):
         """Add an item to the loot table with its drop chance and count range."""
         self.entries.append(LootEntry(item_class, chance, min_count, max_count))
+        self._top_up_table = None
+    
+    def _top_up_weights(self) -> List[float]:
+        """Weights of the entries when topping up to min_total_drops: their drop chances,
+        or equal weights if no entry can drop."""
+        chances = [max(entry.chance, 0.0) for entry in self.entries]
+        return chances if sum(chances) > 0 else [1.0] * len(chances)
     
     def roll_loot(self) -> List:
         """Roll for loot drops and return a list of instantiated items."""
         print("\nRolling for loot...")
         print(f"Min drops: {self.min_total_drops}, Max drops: {self.max_total_drops}")
-        potential_drops = []
+        potential_drops = []  # Item classes, only the final drops are instantiated
         
         # First, roll for each entry
         for entry in self.entries:
@@ -33,8 +74,7 @@ class LootTable:
                 # Determine how many to drop
                 count = random.randint(entry.min_count, entry.max_count)
                 print(f"Success! Rolling {count} {entry.item_class.__name__}(s)")
-                for _ in range(count):
-                    potential_drops.append(entry.item_class())
+                potential_drops.extend([entry.item_class] * count)
         
         print(f"Total potential drops: {len(potential_drops)}")
         
@@ -47,9 +87,162 @@ class LootTable:
         # If we have fewer drops than min_total_drops, add random items until we reach min_total_drops
         while len(potential_drops) < self.min_total_drops and self.entries:
             print(f"Too few drops ({len(potential_drops)}), adding random item to reach minimum {self.min_total_drops}")
-            # Pick a random entry and create an item
-            entry = random.choice(self.entries)
-            potential_drops.append(entry.item_class())
+            # Pick an entry weighted by its drop chance
+            if self._top_up_table is None:
+                self._top_up_table = AliasTable(self.entries, self._top_up_weights())
+            entry = self._top_up_table.sample()
+            potential_drops.append(entry.item_class)
         
-        print(f"Final drops: {[type(item).__name__ for item in potential_drops]}\n")
-        return potential_drops 
\ No newline at end of file
+        print(f"Final drops: {[item_class.__name__ for item_class in potential_drops]}\n")
+        return [item_class() for item_class in potential_drops]
+
+    def _entry_groups(self):
+        """Item class names in entry order and the group index of each entry."""
+        names = []
+        groups = []
+        for entry in self.entries:
+            name = entry.item_class.__name__
+            if name not in names:
+                names.append(name)
+            groups.append(names.index(name))
+        return names, np.array(groups, dtype=np.intp)
+
+    def simulate(self, kills: int, seed: Optional[int] = None) -> LootStats:
+        """Sample the drops of many kills at once, following roll_loot's rules.
+
+        Entries are rolled for every kill in one go. Truncation to max_total_drops
+        keeps a uniformly random subset of the rolled units like roll_loot's
+        shuffle, sampled entry by entry from conditional hypergeometric
+        distributions. The top up to min_total_drops picks entries weighted by
+        their drop chance.
+
+        Raises:
+            ValueError: If kills is less than 1
+        """
+        if kills < 1:
+            raise ValueError(f"Need at least one kill to simulate, got {kills}")
+        rng = np.random.default_rng(seed)
+        names, groups = self._entry_groups()
+        if not self.entries:
+            return LootStats(kills, {}, {}, np.array([1.0]))
+        chances = np.array([entry.chance for entry in self.entries])
+        min_counts = np.array([entry.min_count for entry in self.entries])
+        max_counts = np.array([entry.max_count for entry in self.entries])
+        num_entries = len(self.entries)
+        top_up_weights = np.array(self._top_up_weights(), dtype=float)
+        top_up_weights /= top_up_weights.sum()
+
+        histograms = [np.zeros(1, dtype=np.int64) for _ in names]
+        total_histogram = np.zeros(1, dtype=np.int64)
+        done = 0
+        while done < kills:
+            batch = min(SIMULATION_BATCH, kills - done)
+            done += batch
+
+            hits = rng.random((batch, num_entries)) * 100 < chances
+            rolled = rng.integers(min_counts, max_counts + 1, size=(batch, num_entries)) * hits
+            total = rolled.sum(axis=1)
+            kept = np.minimum(total, self.max_total_drops)
+
+            # Keep a uniform random subset of kept units out of the rolled ones
+            dropped = np.empty_like(rolled)
+            remaining_total = total.copy()
+            remaining_kept = kept.copy()
+            for i in range(num_entries):
+                count = rolled[:, i]
+                remaining_total -= count
+                dropped[:, i] = rng.hypergeometric(count, remaining_total, remaining_kept) if i < num_entries - 1 else remaining_kept
+                remaining_kept -= dropped[:, i]
+
+            # Top up with entries picked by drop chance
+            deficit = np.maximum(self.min_total_drops - kept, 0)
+            dropped += rng.multinomial(deficit, top_up_weights)
+
+            for group, name in enumerate(names):
+                counts = dropped[:, groups == group].sum(axis=1)
+                histograms[group] = _add_histogram(histograms[group], np.bincount(counts))
+            total_histogram = _add_histogram(total_histogram, np.bincount(dropped.sum(axis=1)))
+
+        distribution = {name: histograms[group] / kills for group, name in enumerate(names)}
+        return LootStats(
+            kills=kills,
+            expected={name: float(np.dot(np.arange(len(dist)), dist)) for name, dist in distribution.items()},
+            distribution=distribution,
+            total_distribution=total_histogram / kills
+        )
+
+    def exact_stats(self) -> LootStats:
+        """Compute the drop statistics of roll_loot exactly.
+
+        Every combination of entry outcomes is enumerated, so this is only feasible
+        for tables with few entries and small count ranges.
+
+        Raises:
+            ValueError: If there are more than EXACT_MAX_OUTCOMES combinations
+        """
+        names, groups = self._entry_groups()
+        if not self.entries:
+            return LootStats(None, {}, {}, np.array([1.0]))
+
+        outcomes = 1
+        for entry in self.entries:
+            outcomes *= entry.max_count - entry.min_count + 2
+        if outcomes > EXACT_MAX_OUTCOMES:
+            raise ValueError(f"Loot table has {outcomes} outcome combinations, use simulate instead")
+
+        # Joint distribution of rolled counts per group, built one entry at a time
+        rolled = np.zeros((1, len(names)), dtype=np.int64)
+        probability = np.ones(1)
+        for entry, group in zip(self.entries, groups):
+            chance = min(max(entry.chance / 100, 0.0), 1.0)
+            counts = np.arange(entry.min_count, entry.max_count + 1)
+            values = np.concatenate(([0], counts))
+            weights = np.concatenate(([1 - chance], np.full(len(counts), chance / len(counts))))
+            rolled = np.repeat(rolled, len(values), axis=0)
+            rolled[:, group] += np.tile(values, len(probability))
+            probability = np.outer(probability, weights).ravel()
+
+        total = rolled.sum(axis=1)
+        kept = np.minimum(total, self.max_total_drops)
+
+        top_up_weights = np.array(self._top_up_weights(), dtype=float)
+        distribution = {}
+        for group, name in enumerate(names):
+            share = top_up_weights[groups == group].sum() / top_up_weights.sum()
+            # Outcomes only matter through (group count, total), merge the rest
+            pairs, inverse = np.unique(np.stack((rolled[:, group], total)), axis=1, return_inverse=True)
+            pair_probability = np.bincount(inverse.ravel(), weights=probability)
+            dist = np.zeros(int(pairs[0].max() + max(self.max_total_drops, self.min_total_drops)) + 1)
+            for (count, rolled_total), p in zip(pairs.T, pair_probability):
+                if p <= 0:
+                    continue
+                kept_units = min(rolled_total, self.max_total_drops)
+                # Units of this group among the kept ones, then among the top up
+                truncated = _hypergeometric_pmf(count, rolled_total, kept_units)
+                topped_up = _binomial_pmf(max(self.min_total_drops - kept_units, 0), share)
+                pmf = np.convolve(truncated, topped_up)
+                dist[:len(pmf)] += p * pmf
+            distribution[name] = np.trim_zeros(dist, "b")
+
+        final_total = np.maximum(kept, self.min_total_drops)
+        return LootStats(
+            kills=None,
+            expected={name: float(np.dot(np.arange(len(dist)), dist)) for name, dist in distribution.items()},
+            distribution=distribution,
+            total_distribution=np.bincount(final_total, weights=probability)
+        )
+
+def _add_histogram(histogram: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    if len(counts) > len(histogram):
+        histogram = np.pad(histogram, (0, len(counts) - len(histogram)))
+    histogram[:len(counts)] += counts
+    return histogram
+
+def _hypergeometric_pmf(good: int, total: int, drawn: int) -> np.ndarray:
+    """Probability of drawing k of good units when drawing drawn out of total, indexed by k."""
+    if total == 0:
+        return np.ones(1)
+    return np.array([comb(good, k) * comb(total - good, drawn - k) for k in range(min(good, drawn) + 1)]) / comb(total, drawn)
+
+def _binomial_pmf(trials: int, chance: float) -> np.ndarray:
+    return np.array([comb(trials, k) * chance ** k * (1 - chance) ** (trials - k) for k in range(trials + 1)])
@@ -1,11 +1,21 @@
-"""Raid inventory management."""
+"""Raid inventory management.
+
+RaidInventory is the source of truth for the items a player holds. UI inventories
+subscribe to it and get an InventoryChange per changed item, so they only update
+the slots that changed instead of being rebuilt.
+"""
 import json
 import os
+import threading
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
-from services.database_service import DatabaseService
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+from services.local_store import LocalStore
+from services.sync_reconciler import SyncReconciler
 from config.login_config import LoginManager
 from items.base_item import Item
+from items.item_registry import item_registry
 from items.consumables import (
     MurkyWaterVial, DeepSeaEssence, IceShard, IceDagger, IceFlask, 
     PiranhaTooth, SmokeBomb, LeviathanMistVial, AbyssalEcho, AtlanteanTrident,
@@ -40,16 +50,30 @@ ITEM_CLASSES = {
     "Underwater Cursed Shell": UnderwaterCursedShell
 }
 
+for _name, _item_class in ITEM_CLASSES.items():
+    item_registry.register(_name, _item_class)
+
+# Kinds of inventory changes
+ITEM_ADDED = "added"
+ITEM_REMOVED = "removed"
+COUNT_CHANGED = "count"
+COOLDOWN_CHANGED = "cooldown"
+
+@dataclass(frozen=True, slots=True)
+class InventoryChange:
+    kind: str  # One of ITEM_ADDED, ITEM_REMOVED, COUNT_CHANGED, COOLDOWN_CHANGED
+    item_name: str
+    value: int  # New count, or remaining cooldown turns for COOLDOWN_CHANGED
+
 class RaidInventory:
     MAX_ITEMS = 6  # Maximum number of different items that can be held
+    STORE_KEY = "RaidInventory"  # Local store key, mirrored to /users/{user_id}/RaidInventory
     
     def __init__(self):
         """Initialize the raid inventory."""
         self.login_manager = LoginManager()
         credentials = self.login_manager.load_credentials()
         self.username = credentials[0] if credentials else "default_user"
-        self.db_service = DatabaseService()
-        self.user_id = self.db_service.user_id  # Get user_id from DatabaseService
         
         self.inventory: Dict[str, int] = {}  # {item_name: count}
         self.modifiers: Dict[str, Dict[int, list]] = {}  # {raid_type: {stage: [modifiers]}}
@@ -80,157 +104,186 @@ class RaidInventory:
         self.raid_folder = Path("Raidfolder")
         self.raid_folder.mkdir(exist_ok=True)
         
+        # Listeners of active item changes, held weakly so dropped UI inventories go away
+        self._listeners: List[weakref.WeakMethod] = []
+        
+        # Local store is the source of truth, Firebase is reconciled in the background
+        self.store = LocalStore(self.raid_folder / "raid_store.db")
+        self._remote_lock = threading.Lock()
+        self._pending_remote = False  # Set by the reconciler thread after a pull changed the store
+        self.reconciler = SyncReconciler(
+            self.store,
+            keys=[self.STORE_KEY],
+            on_remote_change=self._on_remote_change
+        )
+        
         # Load saved inventory
         self.load_inventory()
         print(f"Initial active items loaded: {self.items}")  # Debug print
         print(f"Initial global items loaded: {self.global_inventory}")  # Debug print
         print(f"Initial currencies loaded: {self.currencies}")  # Debug print
         print(f"Initial active modifiers loaded: {self.active_modifiers}")  # Debug print
+        
+        # Start pushing/pulling changes once the local state is ready
+        self.reconciler.start()
     
-    def save_inventory(self):
-        """Save the current inventory state."""
-        # Save to local file
-        inventory_data = {
+    @property
+    def user_id(self) -> Optional[str]:
+        """Firebase user ID, available once the reconciler has connected."""
+        return self.reconciler.user_id
+    
+    @property
+    def db_service(self):
+        """DatabaseService owned by the reconciler, None while offline."""
+        return self.reconciler.db_service
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the persisted inventory state."""
+        return {
             "items": self.items,
             "global_inventory": self.global_inventory,
             "currencies": self.currencies,
             "active_modifiers": self.active_modifiers
         }
+    
+    def save_inventory(self):
+        """Save the current inventory state.
         
-        with open(self.raid_folder / "inventory.json", "w") as f:
-            json.dump(inventory_data, f, indent=2)
-            
-        # Save to Firebase
-        print(f"Saving to Firebase for user: {self.user_id}")  # Debug print
-        print(f"Current active items: {self.items}")  # Debug print
-        print(f"Current global items: {self.global_inventory}")  # Debug print
-        print(f"Current currencies: {self.currencies}")  # Debug print
-        print(f"Current active modifiers: {self.active_modifiers}")  # Debug print
-        
-        try:
-            # Prepare data in the exact format matching the database
-            data = {
-                "RaidInventory": {
-                    "items": self.items,
-                    "currencies": self.currencies,
-                    "active_modifiers": self.active_modifiers
-                }
-            }
-            
-            # If there are items in global inventory, merge them with items
-            if self.global_inventory:
-                for item_name, count in self.global_inventory.items():
-                    if item_name in data["RaidInventory"]["items"]:
-                        data["RaidInventory"]["items"][item_name] += count
-                    else:
-                        data["RaidInventory"]["items"][item_name] = count
-            
-            self.db_service.save_player_data(self.user_id, data)
-            print("Successfully saved inventory to Firebase")
-        except Exception as e:
-            print(f"Error saving to Firebase: {e}")
+        Writes to the local store only; the reconciler pushes it to Firebase
+        in the background.
+        """
+        self.store.put(self.STORE_KEY, self.to_dict())
+        self.reconciler.request_sync()
     
     def load_inventory(self):
-        """Load the inventory state."""
-        print(f"\nLoading from Firebase for user: {self.user_id}")  # Debug print
+        """Load the inventory state from the local store."""
+        data = self.store.get(self.STORE_KEY)
         
-        # Try to load from Firebase first
-        try:
-            data = self.db_service.get_player_data(self.user_id)
-            print(f"Loaded user data: {data}")  # Debug print
-            
-            if data and "RaidInventory" in data:
-                raid_data = data["RaidInventory"]
-                print(f"Loaded raid data: {raid_data}")  # Debug print
-                
-                # Load items directly without normalization
-                if "items" in raid_data:
-                    self.items = raid_data["items"]
-                    print(f"Loaded items: {self.items}")  # Debug print
-                
-                # Load global inventory directly without normalization
-                if "global_inventory" in raid_data:
-                    self.global_inventory = raid_data.get("global_inventory", {})
-                    print(f"Loaded global items: {self.global_inventory}")  # Debug print
-                
-                if "currencies" in raid_data:
-                    self.currencies = raid_data["currencies"]
-                    print(f"Loaded currencies: {self.currencies}")  # Debug print
-                    
-                if "active_modifiers" in raid_data:
-                    loaded_modifiers = raid_data["active_modifiers"]
-                    print(f"\nLoaded modifiers from database: {loaded_modifiers}")
-                    # Ensure we have stage-specific keys
-                    if isinstance(loaded_modifiers, dict):
-                        # Convert old format if needed
-                        if "atlantean_raid" in loaded_modifiers:
-                            print("Converting old format modifiers to stage-specific format")
-                            # Move old modifiers to stage 1
-                            self.active_modifiers = {
-                                "atlantean_raid_stage1": loaded_modifiers["atlantean_raid"],
-                                "atlantean_raid_stage2": [],
-                                "atlantean_raid_stage3": [],
-                                "atlantean_raid_stage4": [],
-                                "atlantean_raid_stage5": []
-                            }
-                        else:
-                            print("Loading stage-specific modifiers")
-                            # Use loaded modifiers with default empty lists for missing stages
-                            self.active_modifiers = {
-                                "atlantean_raid_stage1": loaded_modifiers.get("atlantean_raid_stage1", []),
-                                "atlantean_raid_stage2": loaded_modifiers.get("atlantean_raid_stage2", []),
-                                "atlantean_raid_stage3": loaded_modifiers.get("atlantean_raid_stage3", []),
-                                "atlantean_raid_stage4": loaded_modifiers.get("atlantean_raid_stage4", []),
-                                "atlantean_raid_stage5": loaded_modifiers.get("atlantean_raid_stage5", [])
-                            }
-                    else:
-                        print("Invalid modifier format, initializing empty")
-                        # Initialize with empty lists if format is invalid
-                        self.active_modifiers = {
-                            "atlantean_raid_stage1": [],
-                            "atlantean_raid_stage2": [],
-                            "atlantean_raid_stage3": [],
-                            "atlantean_raid_stage4": [],
-                            "atlantean_raid_stage5": []
-                        }
-                    print(f"Final active modifiers state: {self.active_modifiers}")  # Debug print
-            else:
-                print("First time loading, saving initial state")
-                self.save_inventory()
-                
-        except Exception as e:
-            print(f"Error loading from Firebase: {e}")
-            
-            # Fall back to local file if Firebase fails
-            try:
-                if (self.raid_folder / "inventory.json").exists():
-                    with open(self.raid_folder / "inventory.json", "r") as f:
+        if data is None:
+            # First start with the local store, import the legacy JSON file if present
+            legacy_path = self.raid_folder / "inventory.json"
+            if legacy_path.exists():
+                try:
+                    with open(legacy_path, "r") as f:
                         data = json.load(f)
-                        self.items = data.get("items", {})
-                        self.global_inventory = data.get("global_inventory", {})
-                        self.currencies = data.get("currencies", self.currencies)
-                        loaded_modifiers = data.get("active_modifiers", {})
-                        # Ensure we have stage-specific keys
-                        if "atlantean_raid" in loaded_modifiers:
-                            # Move old modifiers to stage 1
-                            self.active_modifiers = {
-                                "atlantean_raid_stage1": loaded_modifiers["atlantean_raid"],
-                                "atlantean_raid_stage2": [],
-                                "atlantean_raid_stage3": [],
-                                "atlantean_raid_stage4": [],
-                                "atlantean_raid_stage5": []
-                            }
-                        else:
-                            self.active_modifiers = {
-                                "atlantean_raid_stage1": loaded_modifiers.get("atlantean_raid_stage1", []),
-                                "atlantean_raid_stage2": loaded_modifiers.get("atlantean_raid_stage2", []),
-                                "atlantean_raid_stage3": loaded_modifiers.get("atlantean_raid_stage3", []),
-                                "atlantean_raid_stage4": loaded_modifiers.get("atlantean_raid_stage4", []),
-                                "atlantean_raid_stage5": loaded_modifiers.get("atlantean_raid_stage5", [])
-                            }
-            except Exception as e:
-                print(f"Error loading from local file: {e}")
+                    print(f"Imported legacy inventory from {legacy_path}")  # Debug print
+                except Exception as e:
+                    print(f"Error loading from local file: {e}")
+            if data is None:
+                data = self.to_dict()
+            # Not dirty: Firebase may hold newer data that the reconciler should pull first
+            self.store.put(self.STORE_KEY, data, dirty=False)
+        
+        self._apply_state(data)
     
+    def _apply_state(self, raid_data: Dict[str, Any]):
+        """Apply a stored or pulled inventory document to this inventory."""
+        # Load items directly without normalization (Firebase drops empty maps)
+        previous_items = self.items
+        self.items = raid_data.get("items") or {}
+        self._emit_item_changes(previous_items)
+        
+        # Load global inventory directly without normalization
+        self.global_inventory = raid_data.get("global_inventory") or {}
+        
+        if "currencies" in raid_data:
+            self.currencies = raid_data["currencies"]
+        
+        loaded_modifiers = raid_data.get("active_modifiers") or {}
+        if not isinstance(loaded_modifiers, dict):
+            print("Invalid modifier format, initializing empty")
+            loaded_modifiers = {}
+        
+        if "atlantean_raid" in loaded_modifiers:
+            print("Converting old format modifiers to stage-specific format")
+            # Move old modifiers to stage 1
+            loaded_modifiers = {"atlantean_raid_stage1": loaded_modifiers["atlantean_raid"]}
+        
+        # Use loaded modifiers with default empty lists for missing stages
+        self.active_modifiers = {
+            f"atlantean_raid_stage{stage}": loaded_modifiers.get(f"atlantean_raid_stage{stage}") or []
+            for stage in range(1, 6)
+        }
+    
+    def subscribe(self, listener: Callable[[InventoryChange], None]):
+        """Call a bound method with every change of the active items."""
+        if not any(ref() == listener for ref in self._listeners):
+            self._listeners.append(weakref.WeakMethod(listener))
+    
+    def unsubscribe(self, listener: Callable[[InventoryChange], None]):
+        self._listeners = [ref for ref in self._listeners if ref() is not None and ref() != listener]
+    
+    def _emit(self, kind: str, item_name: str, value: int):
+        change = InventoryChange(kind, item_name, value)
+        for ref in list(self._listeners):
+            listener = ref()
+            if listener is None:
+                self._listeners.remove(ref)
+            else:
+                listener(change)
+    
+    def _emit_item_changes(self, previous_items: Dict[str, int]):
+        """Notify listeners of the differences between previous_items and the active items."""
+        if not self._listeners:
+            return
+        for item_name in previous_items:
+            if item_name not in self.items:
+                self._emit(ITEM_REMOVED, item_name, 0)
+        for item_name, count in self.items.items():
+            if item_name not in previous_items:
+                self._emit(ITEM_ADDED, item_name, count)
+            elif previous_items[item_name] != count:
+                self._emit(COUNT_CHANGED, item_name, count)
+    
+    def _set_active_count(self, item_name: str, count: int):
+        """Set the count of an active item, removing it at zero, and notify listeners."""
+        if count <= 0:
+            if item_name in self.items:
+                del self.items[item_name]
+                self._emit(ITEM_REMOVED, item_name, 0)
+        elif item_name not in self.items:
+            self.items[item_name] = count
+            self._emit(ITEM_ADDED, item_name, count)
+        elif self.items[item_name] != count:
+            self.items[item_name] = count
+            self._emit(COUNT_CHANGED, item_name, count)
+    
+    def set_cooldown(self, item_name: str, turns: int):
+        """Share the cooldown of a used item with every subscribed UI inventory."""
+        self._emit(COOLDOWN_CHANGED, item_name, turns)
+    
+    def _on_remote_change(self, key: str, data: Dict[str, Any]):
+        """Called from the reconciler thread when Firebase holds newer data."""
+        with self._remote_lock:
+            self._pending_remote = True
+    
+    def apply_pending_sync(self) -> bool:
+        """Apply data pulled by the reconciler. Call from the game loop.
+        
+        The state is reloaded from the local store rather than taken from the pull:
+        a local save after the pull already replaced the pulled data there, and
+        applying the pulled copy would bring back stale items. Bound UI inventories
+        are updated through change events.
+        
+        Returns:
+            bool: True if the inventory changed
+        """
+        with self._remote_lock:
+            pending, self._pending_remote = self._pending_remote, False
+        if not pending:
+            return False
+        data = self.store.get(self.STORE_KEY)
+        if data is None:
+            return False
+        before = self.to_dict()
+        self._apply_state(data)
+        return self.to_dict() != before
+    
+    def close(self):
+        """Stop the reconciler, pushing any pending changes if online."""
+        self.reconciler.stop(flush=True)
+        self.store.close()
+
     def add_modifier(self, raid_type: str, modifier_name: str, stage: int):
         """Add a modifier to the specified raid type and stage."""
         key = f"{raid_type}_stage{stage}"
@@ -262,6 +315,15 @@ class RaidInventory:
         print(f"Found modifiers: {modifiers}")
         return modifiers
     
+    def get_all_modifiers(self, raid_type: str) -> set:
+        """Get the names of the modifiers active in any stage of a raid type."""
+        prefix = f"{raid_type}_stage"
+        return {
+            modifier_name
+            for key, modifiers in self.active_modifiers.items() if key.startswith(prefix)
+            for modifier_name in modifiers
+        }
+    
     def can_add_item(self, item_name: str) -> bool:
         """Check if an item can be added to the inventory."""
         # If the item already exists in active inventory, we can always add more
@@ -276,35 +338,38 @@ class RaidInventory:
         Returns:
             bool: True if the item was added successfully
         """
+        self._add_item(item_name, amount)
+        self.save_inventory()
+        return True
+    
+    def add_items(self, items: Iterable[Tuple[str, int]]):
+        """Add several (item_name, amount) pairs, saving once."""
+        for item_name, amount in items:
+            self._add_item(item_name, amount)
+        self.save_inventory()
+    
+    def _add_item(self, item_name: str, amount: int):
         print(f"\n[DEBUG] Adding {amount} {item_name} to inventory")  # Debug print
         print(f"[DEBUG] Current items: {self.items}")  # Debug print
         print(f"[DEBUG] Current global inventory: {self.global_inventory}")  # Debug print
         
         # Check if item exists in active inventory
         if item_name in self.items:
-            self.items[item_name] += amount
+            self._set_active_count(item_name, self.items[item_name] + amount)
             print(f"[DEBUG] Added {amount} {item_name} to active inventory (existing stack)")  # Debug print
-            self.save_inventory()
-            return True
+            return
             
         # If not in active inventory and we have space, add it
         if len(self.items) < self.MAX_ITEMS:
-            self.items[item_name] = amount
+            self._set_active_count(item_name, amount)
             print(f"[DEBUG] Added {amount} {item_name} to active inventory (new stack)")  # Debug print
-            self.save_inventory()
-            return True
+            return
             
         # Add to global inventory if active inventory is full
         if item_name not in self.global_inventory:
             self.global_inventory[item_name] = 0
         self.global_inventory[item_name] += amount
         print(f"[DEBUG] Added {amount} {item_name} to global inventory (active inventory full)")  # Debug print
-        
-        # Save to database and refresh
-        self.save_inventory()
-        self.load_inventory()  # Refresh from database to ensure consistency
-        
-        return True
     
     def remove_item(self, item_name: str, amount: int = 1) -> bool:
         """Remove an item from the inventory.
@@ -321,16 +386,13 @@ class RaidInventory:
         if item_name in self.items:
             print(f"[DEBUG] Found item in active inventory with count: {self.items[item_name]}")  # Debug print
             if self.items[item_name] >= amount:
-                self.items[item_name] -= amount
-                print(f"[DEBUG] Removed {amount}, new count: {self.items[item_name]}")  # Debug print
-                if self.items[item_name] <= 0:
-                    del self.items[item_name]
-                    print(f"[DEBUG] Count zero, removed item from inventory")  # Debug print
+                self._set_active_count(item_name, self.items[item_name] - amount)
+                print(f"[DEBUG] Removed {amount}, new count: {self.items.get(item_name, 0)}")  # Debug print
                 self.save_inventory()
                 return True
             else:
                 remaining = amount - self.items[item_name]
-                del self.items[item_name]
+                self._set_active_count(item_name, 0)
                 print(f"[DEBUG] Not enough in active inventory, checking global for remaining {remaining}")  # Debug print
                 # Try to remove remaining amount from global inventory
                 if item_name in self.global_inventory and self.global_inventory[item_name] >= remaining:
@@ -396,40 +458,43 @@ class RaidInventory:
     
     def create_item_object(self, item_name: str, count: int = 1) -> Optional[Item]:
         """Create an Item object from the item name."""
-        if item_name in ITEM_CLASSES:
-            item = ITEM_CLASSES[item_name]()
-            item.stack_count = count
-            return item
+        if item_name in item_registry:
+            return item_registry.create(item_name, count)
         print(f"Warning: Unknown item type {item_name}")
         return None
 
     def populate_ui_inventory(self, inventory):
-        """Populate a UI inventory with the current items."""
+        """Populate a UI inventory with the current items.
+        
+        Items already in the UI inventory are reused as the stacks of their type and
+        stay in their slots, so they keep their cooldowns and no icons are loaded
+        again. New items go to the first free slots.
+        """
         print("\nPopulating UI inventory...")
         
-        # Clear inventory first
+        # Current stacks by name, then clear inventory
+        handles = {item.name: (index, item) for index, item in enumerate(inventory.slots) if item is not None}
         inventory.slots = [None] * 6
         
-        # Add items to inventory
-        slot_index = 0
+        # Keep stacks of items that are still held in their slots
+        new_items = []
         for item_name, count in self.items.items():
-            print(f"Processing item: {item_name} (count: {count})")
-            if item_name in ITEM_CLASSES:
-                item_class = ITEM_CLASSES[item_name]
-                print(f"Found item class: {item_class.__name__}")
-                try:
-                    # Create item instance
-                    item = item_class()
-                    item.stack_count = count
-                    if slot_index < len(inventory.slots):
-                        inventory.slots[slot_index] = item
-                        slot_index += 1
-                        print(f"Added {item.name} to slot {slot_index-1}")
-                    else:
-                        print(f"No more slots available for {item_name}")
-                except Exception as e:
-                    print(f"Error creating item {item_name}: {str(e)}")
-            else:
+            if item_name not in item_registry:
                 print(f"Warning: Unknown item type {item_name}")
+            elif item_name in handles and handles[item_name][0] < len(inventory.slots):
+                index, handle = handles[item_name]
+                inventory.slots[index] = item_registry.stack(item_name, count, handle)
+            else:
+                new_items.append((item_name, count))
+        
+        # Add the rest to the free slots
+        for item_name, count in new_items:
+            if None not in inventory.slots:
+                print(f"No more slots available for {item_name}")
+                continue
+            try:
+                inventory.slots[inventory.slots.index(None)] = item_registry.create(item_name, count)
+            except Exception as e:
+                print(f"Error creating item {item_name}: {str(e)}")
         
-        print("UI inventory population complete\n") 
\ No newline at end of file
+        print("UI inventory population complete\n")
@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
+import pygame
 
 class ModifierRarity(Enum):
     COMMON = (165, 165, 165)     # Gray
@@ -8,18 +9,48 @@ class ModifierRarity(Enum):
     EPIC = (128, 0, 128)         # Purple
     LEGENDARY = (255, 165, 0)    # Orange
 
+_image_cache: Dict[Tuple[str, Optional[Tuple[int, int]]], pygame.Surface] = {}
+
+def load_modifier_image(image_path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+    """Load a modifier image, once per path and size.
+    
+    The returned surface is shared, callers must copy it before drawing on it or
+    changing its alpha.
+    """
+    key = (image_path, size)
+    if key not in _image_cache:
+        image = pygame.image.load(image_path)
+        _image_cache[key] = pygame.transform.scale(image, size) if size else image
+    return _image_cache[key]
+
 class Modifier:
+    """Base class of talents.
+    
+    Subclasses declare their name, description, rarity and image path as class
+    attributes, so pools of modifiers can be listed, weighted and drawn without
+    creating any of them.
+    """
+    name: str = ""
+    description: str = ""
+    rarity: ModifierRarity = ModifierRarity.COMMON
+    image_path: Optional[str] = None
+    
     def __init__(self, 
-                 name: str,
-                 description: str,
-                 rarity: ModifierRarity,
+                 name: Optional[str] = None,
+                 description: Optional[str] = None,
+                 rarity: Optional[ModifierRarity] = None,
                  image_path: Optional[str] = None):
-        self.name = name
-        self.description = description
-        self.rarity = rarity
-        self.image_path = image_path
+        # Arguments override the class metadata of this instance
+        if name is not None:
+            self.name = name
+        if description is not None:
+            self.description = description
+        if rarity is not None:
+            self.rarity = rarity
+        if image_path is not None:
+            self.image_path = image_path
         self.is_active = False
-        print(f"Created modifier: {name} with rarity {rarity.name}")
+        print(f"Created modifier: {self.name} with rarity {self.rarity.name}")
 
     def activate(self):
         """Called when the modifier is chosen and activated"""
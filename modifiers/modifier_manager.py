@@ -1,5 +1,5 @@
-import random
 from typing import List, Type
+from engine.weighted_sampling import weighted_sample
 from .modifier_base import Modifier, ModifierRarity
 from .talent_modifiers import (
     HealingWave, BubbleBarrier, VialCarrier, Fishnet, CoralArmor, 
@@ -46,66 +46,34 @@ class ModifierManager:
         }
 
     def get_random_modifiers(self, count: int = 3) -> List[Modifier]:
-        """Get a list of random modifiers to choose from"""
+        """Get a list of random modifiers to choose from.
+        
+        Modifiers are picked from their class metadata, only the picked ones are
+        created.
+        """
         print(f"\nRequested {count} modifiers")
-        print(f"Available modifier classes: {[mod.__name__ for mod in self.available_modifiers]}")
         
         # Get currently active modifier names from all stages
         from engine.game_engine import GameEngine
         active_modifier_names = set()
         if GameEngine.instance and hasattr(GameEngine.instance, 'raid_inventory'):
-            for stage in range(1, 6):  # Check stages 1 through 5
-                stage_modifiers = GameEngine.instance.raid_inventory.get_modifiers("atlantean_raid", stage)
-                active_modifier_names.update(stage_modifiers)
+            active_modifier_names = GameEngine.instance.raid_inventory.get_all_modifiers("atlantean_raid")
         print(f"Currently active modifiers across all stages: {active_modifier_names}")
         
         # Filter out already active modifiers
         available_modifiers = [mod for mod in self.available_modifiers 
                              if mod.__name__ not in active_modifier_names]
-        print(f"Available modifiers after filtering: {[mod.__name__ for mod in available_modifiers]}")
-        
-        # Create instances of available modifiers
-        modifier_instances = [mod() for mod in available_modifiers]
-        print(f"Created modifier instances: {[m.name for m in modifier_instances]}")
         
         # Ensure we have enough modifiers
-        if len(modifier_instances) < count:
-            print(f"Warning: Not enough modifiers available. Requested {count}, but only have {len(modifier_instances)}")
-            return modifier_instances  # Return all available if we don't have enough
-        
-        # Weight modifiers by rarity
-        weights = [self.rarity_weights[mod.rarity] for mod in modifier_instances]
-        print(f"Weights by rarity: {list(zip([m.name for m in modifier_instances], weights))}")
+        if len(available_modifiers) < count:
+            print(f"Warning: Not enough modifiers available. Requested {count}, but only have {len(available_modifiers)}")
+            return [mod() for mod in available_modifiers]  # Return all available if we don't have enough
         
-        # Select random modifiers without replacement
-        selected = []
-        remaining_instances = modifier_instances.copy()
-        remaining_weights = weights.copy()
+        # Select random modifiers without replacement, weighted by rarity
+        weights = [self.rarity_weights[mod.rarity] for mod in available_modifiers]
+        selected = [mod() for mod in weighted_sample(available_modifiers, weights, count)]
         
-        while len(selected) < count and remaining_instances:
-            # Calculate total weight of remaining modifiers
-            total_weight = sum(remaining_weights)
-            if total_weight <= 0:
-                print("Warning: Total weight is 0, breaking selection loop")
-                break
-                
-            # Normalize weights
-            normalized_weights = [w/total_weight for w in remaining_weights]
-            print(f"\nSelection round {len(selected) + 1}:")
-            print(f"Remaining modifiers: {[m.name for m in remaining_instances]}")
-            print(f"Normalized weights: {list(zip([m.name for m in remaining_instances], normalized_weights))}")
-            
-            # Select one modifier
-            chosen_idx = random.choices(range(len(remaining_instances)), weights=normalized_weights, k=1)[0]
-            chosen_modifier = remaining_instances[chosen_idx]
-            print(f"Selected: {chosen_modifier.name} (idx: {chosen_idx})")
-            selected.append(chosen_modifier)
-            
-            # Remove chosen modifier from pool
-            remaining_instances.pop(chosen_idx)
-            remaining_weights.pop(chosen_idx)
-
-        print(f"\nFinal selection: {[m.name for m in selected]}")
+        print(f"Final selection: {[m.name for m in selected]}")
         return selected
 
     def activate_modifier(self, modifier: Modifier):
@@ -1,17 +1,13 @@
-from .modifier_base import Modifier, ModifierRarity
-import pygame
-from characters.base_character import DamageText
+from .modifier_base import Modifier, ModifierRarity, load_modifier_image
+from characters import image_filters
 import types  # For binding methods
 import random  # For random selection
 
 class HealingWave(Modifier):
-    def __init__(self):
-        super().__init__(
-            name="Healing Wave",
-            description="Restore 50HP to all living characters each turn",
-            rarity=ModifierRarity.COMMON,
-            image_path="assets/modifiers/healing_wave.png"
-        )
+    name = "Healing Wave"
+    description = "Restore 50HP to all living characters each turn"
+    rarity = ModifierRarity.COMMON
+    image_path = "assets/modifiers/healing_wave.png"
 
     def on_turn_start(self, game_state):
         if self.is_active:
@@ -19,47 +15,45 @@ class HealingWave(Modifier):
                 if character.is_alive():  # Only heal living characters
                     character.heal(50)
 
+class BubbleBarrierBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "bonus_hp")
+    
+    def __init__(self, icon_path):
+        self.type = "custom"
+        self.bonus_hp = 700
+        self.value = 700  # For display purposes
+        self.name = "Bubble Barrier"
+        self.description = "Bonus HP from Bubble Barrier"
+        self.duration = -1  # Permanent buff
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        return True  # Permanent buff, always return True
+
 class BubbleBarrier(Modifier):
-    def __init__(self):
-        super().__init__(
-            name="Bubble Barrier",
-            description="You start the game with bonus 700 currentHP",
-            rarity=ModifierRarity.RARE,
-            image_path="assets/modifiers/bubble_barrier.png"
-        )
+    name = "Bubble Barrier"
+    description = "You start the game with bonus 700 currentHP"
+    rarity = ModifierRarity.RARE
+    image_path = "assets/modifiers/bubble_barrier.png"
 
     def on_battle_start(self, game_state):
         if self.is_active:
             for character in game_state.stage_manager.player_characters:
-                # Create a custom buff that provides bonus HP
-                class BubbleBarrierBuff:
-                    def __init__(self, icon_path):
-                        self.type = "custom"
-                        self.bonus_hp = 700
-                        self.value = 700  # For display purposes
-                        self.name = "Bubble Barrier"
-                        self.description = "Bonus HP from Bubble Barrier"
-                        self.duration = -1  # Permanent buff
-                        self.heal_per_turn = 0
-                        self.icon = pygame.image.load(icon_path) if icon_path else None
-                    
-                    def update(self):
-                        """Return True to keep the buff active"""
-                        return True  # Permanent buff, always return True
-                
                 # Add the buff and heal to full new max HP
                 character.add_buff(BubbleBarrierBuff(self.image_path))
                 character.heal(700)  # This will now work with the new heal method
                 print(f"Added 700 HP to {character.name}, new HP: {character.stats.current_hp}")
 
 class VialCarrier(Modifier):
+    name = "Vial Carrier"
+    description = "Receive a Murky Water Vial at turn 2, 5, 10, 20 and 30"
+    rarity = ModifierRarity.UNCOMMON
+    image_path = "assets/modifiers/vial_carrier.png"
+
     def __init__(self):
-        super().__init__(
-            name="Vial Carrier",
-            description="Receive a Murky Water Vial at turn 2, 5, 10, 20 and 30",
-            rarity=ModifierRarity.UNCOMMON,
-            image_path="assets/modifiers/vial_carrier.png"
-        )
+        super().__init__()
         self.vial_turns = {2, 5, 10, 20, 30}  # Set of turns when vials are granted
 
     def on_turn_start(self, game_state):
@@ -72,17 +66,9 @@ class VialCarrier(Modifier):
                     # Create the vial item first
                     vial = MurkyWaterVial()
                     
-                    # Add to RaidInventory first
+                    # Add to RaidInventory, bound UI inventories pick it up
                     if hasattr(game_state, 'raid_inventory'):
                         game_state.raid_inventory.add_item("Murky Water Vial", 1)
-                        
-                        # Clear both inventories
-                        character.inventory.slots = [None] * 6
-                        game_state.inventory.slots = [None] * 6
-                        
-                        # Repopulate both inventories from RaidInventory
-                        game_state.raid_inventory.populate_ui_inventory(character.inventory)
-                        game_state.raid_inventory.populate_ui_inventory(game_state.inventory)
                     else:
                         # Fallback to just adding to both UI inventories directly
                         character.inventory.add_item(vial)
@@ -96,21 +82,22 @@ class VialCarrier(Modifier):
                     break  # Only add one vial per turn 
 
 class Fishnet(Modifier):
+    name = "Fishnet"
+    description = "Start the battle with a Piranha companion that has tripled HP and attacks with you"
+    rarity = ModifierRarity.UNCOMMON
+    image_path = "assets/modifiers/fishnet.png"
+
     def __init__(self):
-        super().__init__(
-            name="Fishnet",
-            description="Start the battle with a Piranha companion that has tripled HP and attacks with you",
-            rarity=ModifierRarity.UNCOMMON,
-            image_path="assets/modifiers/fishnet.png"
-        )
+        super().__init__()
         self.piranha_spawned = False
 
     def on_battle_start(self, game_state):
         if self.is_active and not self.piranha_spawned:
+            from characters.prototypes import prototypes
             from characters.shadowfin_boss import Piranha
             
             # Create a Piranha companion
-            piranha = Piranha()
+            piranha = prototypes.spawn("Piranha")
             
             # Triple its HP
             piranha.stats.max_hp *= 3
@@ -143,12 +130,8 @@ class Fishnet(Modifier):
                             # Position the text to the right of the target
                             text_x = target.position[0] + target.image.get_width() + 20
                             text_y = target.position[1] + target.image.get_height() // 2
-                            damage_text = DamageText(
-                                value=damage,
-                                position=(text_x, text_y),
-                                color=(255, 150, 150)  # Light red color for Piranha's attack
-                            )
-                            target.floating_texts.append(damage_text)
+                            target.show_floating_text(damage, (255, 150, 150),  # Light red color for Piranha's attack
+                                                      position=(text_x, text_y))
                             # Use the bite ability
                             bite_ability.use(piranha, actual_targets)
                     return result
@@ -162,14 +145,31 @@ class Fishnet(Modifier):
             
             self.piranha_spawned = True 
 
+class CoralArmorBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "armor_bonus")
+    
+    def __init__(self, icon_path):
+        self.type = "custom"
+        self.armor_bonus = 8
+        self.value = 8  # For display purposes
+        self.name = "Coral Armor"
+        self.description = "8% armor from Coral Armor"
+        self.duration = -1  # Permanent buff
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        return True  # Permanent buff
+
 class CoralArmor(Modifier):
+    name = "Coral Armor"
+    description = "One of your random characters gain 8% armor"
+    rarity = ModifierRarity.COMMON
+    image_path = "assets/modifiers/coral_armor.png"
+
     def __init__(self):
-        super().__init__(
-            name="Coral Armor",
-            description="One of your random characters gain 8% armor",
-            rarity=ModifierRarity.COMMON,
-            image_path="assets/modifiers/coral_armor.png"
-        )
+        super().__init__()
         self.buff_applied = False
 
     def on_battle_start(self, game_state):
@@ -181,22 +181,6 @@ class CoralArmor(Modifier):
             if characters:
                 target = random.choice(characters)
                 
-                # Create armor buff
-                class CoralArmorBuff:
-                    def __init__(self, icon_path):
-                        self.type = "custom"
-                        self.armor_bonus = 8
-                        self.value = 8  # For display purposes
-                        self.name = "Coral Armor"
-                        self.description = "8% armor from Coral Armor"
-                        self.duration = -1  # Permanent buff
-                        self.heal_per_turn = 0
-                        self.icon = pygame.image.load(icon_path) if icon_path else None
-                    
-                    def update(self):
-                        """Return True to keep the buff active"""
-                        return True  # Permanent buff
-                
                 # Add the buff to the character
                 target.add_buff(CoralArmorBuff(self.image_path))
                 target.stats.defense += 8
@@ -209,52 +193,53 @@ class CoralArmor(Modifier):
                 
                 self.buff_applied = True 
 
-class IceCrystal(Modifier):
-    # Class-level cache for frozen images
-    _frozen_image_cache = {}
+class FrozenDebuff:
+    """Ice Crystal freeze, disables the target's abilities"""
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "target", "original_image", "frozen_image", "original_abilities")
     
-    def __init__(self):
-        super().__init__(
-            name="Ice Crystal",
-            description="At game start, randomly freeze an enemy for 5 turns, disabling its abilities",
-            rarity=ModifierRarity.EPIC,
-            image_path="assets/modifiers/ice_crystal.png"
-        )
-        self.freeze_applied = False
-    
-    @staticmethod
-    def get_frozen_image(original_image):
-        """Get or create a frozen version of the image."""
-        # Use image memory view as cache key
-        key = original_image.get_view().raw
+    def __init__(self, target, icon_path):
+        self.type = "custom"
+        self.value = 5  # Duration display
+        self.name = "Frozen"
+        self.description = "Frozen solid! Cannot use abilities"
+        self.duration = 5
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
         
-        if key not in IceCrystal._frozen_image_cache:
-            # Create a copy of the original image
-            frozen = original_image.copy()
-            
-            # Get image dimensions
-            width = frozen.get_width()
-            height = frozen.get_height()
-            
-            # Create ice effect by adding blue tint and crystalline overlay
-            for x in range(width):
-                for y in range(height):
-                    r, g, b, a = frozen.get_at((x, y))
-                    if a > 0:  # Only modify visible pixels
-                        # Add blue tint
-                        b = min(255, b + 50)
-                        r = max(0, r - 30)
-                        g = max(0, g - 10)
-                        # Add crystalline effect
-                        if (x + y) % 20 == 0:  # Create crystal pattern
-                            r = min(255, r + 100)
-                            g = min(255, g + 100)
-                            b = min(255, b + 100)
-                    frozen.set_at((x, y), (r, g, b, a))
-            
-            IceCrystal._frozen_image_cache[key] = frozen
+        # Store original image and create frozen version
+        self.target = target
+        self.original_image = target.image
+        self.frozen_image = image_filters.apply(target.original_image, "freeze")
+        target.image = self.frozen_image
         
-        return IceCrystal._frozen_image_cache[key].copy()
+        # Store original ability use functions
+        self.original_abilities = [(ability, ability.use) for ability in target.abilities]
+        # Disable all abilities
+        for ability in target.abilities:
+            ability.use = lambda *args, **kwargs: False
+    
+    def update(self):
+        """Update the buff and return True if it should continue"""
+        self.duration -= 1
+        self.description = f"Frozen solid! Cannot use abilities\n{self.duration} turns remaining"
+        
+        if self.duration <= 0:
+            # Restore original image and abilities
+            self.target.image = self.original_image
+            for ability, original_use in self.original_abilities:
+                ability.use = original_use
+            return False
+        return True
+
+class IceCrystal(Modifier):
+    name = "Ice Crystal"
+    description = "At game start, randomly freeze an enemy for 5 turns, disabling its abilities"
+    rarity = ModifierRarity.EPIC
+    image_path = "assets/modifiers/ice_crystal.png"
+
+    def __init__(self):
+        super().__init__()
+        self.freeze_applied = False
     
     def on_battle_start(self, game_state):
         if self.is_active and not self.freeze_applied:
@@ -266,42 +251,9 @@ class IceCrystal(Modifier):
                 target = random.choice(enemies)
                 
                 # Create freeze effect
-                class FrozenDebuff:
-                    def __init__(self, icon_path):
-                        self.type = "custom"
-                        self.value = 5  # Duration display
-                        self.name = "Frozen"
-                        self.description = "Frozen solid! Cannot use abilities"
-                        self.duration = 5
-                        self.heal_per_turn = 0
-                        self.icon = pygame.image.load(icon_path) if icon_path else None
-                        
-                        # Store original image and create frozen version
-                        self.original_image = target.image
-                        self.frozen_image = IceCrystal.get_frozen_image(self.original_image)
-                        target.image = self.frozen_image
-                        
-                        # Store original ability use functions
-                        self.original_abilities = [(ability, ability.use) for ability in target.abilities]
-                        # Disable all abilities
-                        for ability in target.abilities:
-                            ability.use = lambda *args, **kwargs: False
-                    
-                    def update(self):
-                        """Update the buff and return True if it should continue"""
-                        self.duration -= 1
-                        self.description = f"Frozen solid! Cannot use abilities\n{self.duration} turns remaining"
-                        
-                        if self.duration <= 0:
-                            # Restore original image and abilities
-                            target.image = self.original_image
-                            for ability, original_use in self.original_abilities:
-                                ability.use = original_use
-                            return False
-                        return True
                 
                 # Add the freeze debuff
-                target.add_buff(FrozenDebuff(self.image_path))
+                target.add_buff(FrozenDebuff(target, self.image_path))
                 
                 # Log the freeze
                 game_state.battle_log.add_message(
@@ -311,14 +263,32 @@ class IceCrystal(Modifier):
                 
                 self.freeze_applied = True 
 
+class PressureBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "armor_bonus")
+    
+    def __init__(self, armor_value, icon_path):
+        self.type = "custom"
+        self.armor_bonus = armor_value
+        self.value = armor_value  # For display purposes
+        self.name = "Deep Sea Pressure"
+        self.description = f"+{armor_value}% armor from Deep Sea Pressure"
+        self.duration = 1  # Refreshed each turn
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        self.duration -= 1
+        return self.duration > 0
+
 class DeepSeaPressure(Modifier):
+    name = "Deep Sea Pressure"
+    description = "Your characters gain 2% armor for each 10% HP they're missing"
+    rarity = ModifierRarity.EPIC
+    image_path = "assets/modifiers/deep_sea_pressure.png"
+
     def __init__(self):
-        super().__init__(
-            name="Deep Sea Pressure",
-            description="Your characters gain 2% armor for each 10% HP they're missing",
-            rarity=ModifierRarity.EPIC,
-            image_path="assets/modifiers/deep_sea_pressure.png"
-        )
+        super().__init__()
         self.pressure_buffs = {}  # Track buffs per character
 
     def calculate_armor_bonus(self, character):
@@ -340,23 +310,6 @@ class DeepSeaPressure(Modifier):
                             character.buffs.remove(old_buff)
                             character.stats.defense -= old_buff.armor_bonus
 
-                    # Create new pressure buff
-                    class PressureBuff:
-                        def __init__(self, armor_value, icon_path):
-                            self.type = "custom"
-                            self.armor_bonus = armor_value
-                            self.value = armor_value  # For display purposes
-                            self.name = "Deep Sea Pressure"
-                            self.description = f"+{armor_value}% armor from Deep Sea Pressure"
-                            self.duration = 1  # Refreshed each turn
-                            self.heal_per_turn = 0
-                            self.icon = pygame.image.load(icon_path) if icon_path else None
-                        
-                        def update(self):
-                            """Return True to keep the buff active"""
-                            self.duration -= 1
-                            return self.duration > 0
-
                     # Apply new buff
                     new_buff = PressureBuff(armor_bonus, self.image_path)
                     character.add_buff(new_buff)
@@ -370,14 +323,40 @@ class DeepSeaPressure(Modifier):
                             game_state.battle_log.BUFF_COLOR
                         ) 
 
+class EssenceBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon",)
+    
+    def __init__(self, icon_path):
+        self.type = "custom"
+        self.value = 15  # 15% damage increase
+        self.name = "Spirit Essence"
+        self.description = "Damage increased by 15% from Spirit Essence"
+        self.duration = 2  # 2 turns
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        self.duration -= 1
+        self.description = f"Damage increased by 15% from Spirit Essence\n{self.duration} turns remaining"
+        return self.duration > 0
+    
+    def apply_damage_increase(self, damage):
+        """Increase damage by 15%"""
+        return int(damage * 1.15)
+    
+    def on_hit_heal(self, damage):
+        """Return healing amount based on damage dealt"""
+        return int(damage * 0.15)  # Heal for 15% of damage dealt
+
 class SpiritEssence(Modifier):
+    name = "Spirit Essence"
+    description = "When you heal, gain 15% increased damage for 2 turns"
+    rarity = ModifierRarity.RARE
+    image_path = "assets/modifiers/spirit_essence.png"
+
     def __init__(self):
-        super().__init__(
-            name="Spirit Essence",
-            description="When you heal, gain 15% increased damage for 2 turns",
-            rarity=ModifierRarity.RARE,
-            image_path="assets/modifiers/spirit_essence.png"
-        )
+        super().__init__()
         self.essence_buffs = {}  # Track buffs per character
         
     def on_turn_start(self, game_state):
@@ -395,31 +374,6 @@ class SpiritEssence(Modifier):
                                 if old_buff in character.buffs:
                                     character.buffs.remove(old_buff)
                             
-                            # Create new essence buff
-                            class EssenceBuff:
-                                def __init__(self, icon_path):
-                                    self.type = "custom"
-                                    self.value = 15  # 15% damage increase
-                                    self.name = "Spirit Essence"
-                                    self.description = "Damage increased by 15% from Spirit Essence"
-                                    self.duration = 2  # 2 turns
-                                    self.heal_per_turn = 0
-                                    self.icon = pygame.image.load(icon_path) if icon_path else None
-                                
-                                def update(self):
-                                    """Return True to keep the buff active"""
-                                    self.duration -= 1
-                                    self.description = f"Damage increased by 15% from Spirit Essence\n{self.duration} turns remaining"
-                                    return self.duration > 0
-                                
-                                def apply_damage_increase(self, damage):
-                                    """Increase damage by 15%"""
-                                    return int(damage * 1.15)
-                                
-                                def on_hit_heal(self, damage):
-                                    """Return healing amount based on damage dealt"""
-                                    return int(damage * 0.15)  # Heal for 15% of damage dealt
-                            
                             # Apply new buff
                             new_buff = EssenceBuff(self.image_path)
                             character.add_buff(new_buff)
@@ -434,13 +388,13 @@ class SpiritEssence(Modifier):
                     character.heal = heal_with_essence
 
 class EssenceLink(Modifier):
+    name = "Essence Link"
+    description = "When you use an ability that costs mana, heal for 15% of the mana spent"
+    rarity = ModifierRarity.RARE
+    image_path = "assets/modifiers/essence_link.png"
+
     def __init__(self):
-        super().__init__(
-            name="Essence Link",
-            description="When you use an ability that costs mana, heal for 15% of the mana spent",
-            rarity=ModifierRarity.RARE,
-            image_path="assets/modifiers/essence_link.png"
-        )
+        super().__init__()
         self.modified_abilities = {}  # Track modified abilities per character
 
     def on_turn_start(self, game_state):
@@ -472,14 +426,53 @@ class EssenceLink(Modifier):
                         self.modified_abilities[ability] = original_use
                         ability.use = use_with_essence_link 
 
+class CrystallizeBuff:
+    """Crystalline Resonance mark, the next hit on the target deals 25% more damage"""
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "triggered", "target")
+    
+    def __init__(self, target, icon_path):
+        self.type = "custom"
+        self.value = 25  # 25% increased damage
+        self.name = "Crystallized"
+        self.description = "Takes 25% more damage from the next ability"
+        self.duration = -1  # Will be removed after taking damage
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+        self.triggered = False
+        self.target = target
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        return not self.triggered
+    
+    def apply_damage_taken_increase(self, damage):
+        """Increase damage taken by 25% and mark as triggered"""
+        self.triggered = True
+        return int(damage * 1.25)
+    
+    def on_damage_taken(self, damage):
+        """Called when the target takes damage"""
+        increased_damage = self.apply_damage_taken_increase(damage)
+        # Log the bonus damage
+        from engine.game_engine import GameEngine
+        if GameEngine.instance:
+            GameEngine.instance.battle_log.add_message(
+                f"Crystallize shatters! +{increased_damage - damage} bonus damage!",
+                GameEngine.instance.battle_log.DAMAGE_COLOR
+            )
+        # Safely remove the buff
+        if self in self.target.buffs:
+            self.target.buffs.remove(self)
+        return increased_damage
+
 class CrystallineResonance(Modifier):
+    name = "Crystalline Resonance"
+    description = "Your abilities have a 20% chance to crystallize targets, making them take 25% more damage from the next ability that hits them"
+    rarity = ModifierRarity.RARE
+    image_path = "assets/modifiers/crystalline_resonance.png"
+
     def __init__(self):
-        super().__init__(
-            name="Crystalline Resonance",
-            description="Your abilities have a 20% chance to crystallize targets, making them take 25% more damage from the next ability that hits them",
-            rarity=ModifierRarity.RARE,
-            image_path="assets/modifiers/crystalline_resonance.png"
-        )
+        super().__init__()
         self.modified_abilities = {}  # Track modified abilities per character
 
     def on_turn_start(self, game_state):
@@ -517,44 +510,10 @@ class CrystallineResonance(Modifier):
                                 # 20% chance to crystallize each target
                                 for target in actual_targets:
                                     if target.is_alive() and random.random() < 0.20:
-                                        # Create crystallize buff
-                                        class CrystallizeBuff:
-                                            def __init__(self, icon_path):
-                                                self.type = "custom"
-                                                self.value = 25  # 25% increased damage
-                                                self.name = "Crystallized"
-                                                self.description = "Takes 25% more damage from the next ability"
-                                                self.duration = -1  # Will be removed after taking damage
-                                                self.heal_per_turn = 0
-                                                self.icon = pygame.image.load(icon_path) if icon_path else None
-                                                self.triggered = False
-                                            
-                                            def update(self):
-                                                """Return True to keep the buff active"""
-                                                return not self.triggered
-                                            
-                                            def apply_damage_taken_increase(self, damage):
-                                                """Increase damage taken by 25% and mark as triggered"""
-                                                self.triggered = True
-                                                return int(damage * 1.25)
-                                            
-                                            def on_damage_taken(self, damage):
-                                                """Called when the target takes damage"""
-                                                increased_damage = self.apply_damage_taken_increase(damage)
-                                                # Log the bonus damage
-                                                game_state.battle_log.add_message(
-                                                    f"Crystallize shatters! +{increased_damage - damage} bonus damage!",
-                                                    game_state.battle_log.DAMAGE_COLOR
-                                                )
-                                                # Safely remove the buff
-                                                if self in target.buffs:
-                                                    target.buffs.remove(self)
-                                                return increased_damage
-                                        
                                         # Remove any existing crystallize
                                         target.buffs = [b for b in target.buffs if not isinstance(b, CrystallizeBuff)]
                                         # Add new crystallize
-                                        target.add_buff(CrystallizeBuff(self.image_path))
+                                        target.add_buff(CrystallizeBuff(target, self.image_path))
                                         # Log the crystallize
                                         game_state.battle_log.add_message(
                                             f"{target.name} has been crystallized!",
@@ -567,13 +526,13 @@ class CrystallineResonance(Modifier):
                         ability.use = use_with_crystallize 
 
 class ArcaneMomentum(Modifier):
+    name = "Arcane Momentum"
+    description = "Whenever you cast an ability, there is 35% chance/ability to be reduced (the active cooldown) by 1 turn"
+    rarity = ModifierRarity.RARE
+    image_path = "assets/modifiers/arcane_momentum.png"
+
     def __init__(self):
-        super().__init__(
-            name="Arcane Momentum",
-            description="Whenever you cast an ability, there is 35% chance/ability to be reduced (the active cooldown) by 1 turn",
-            rarity=ModifierRarity.RARE,
-            image_path="assets/modifiers/arcane_momentum.png"
-        )
+        super().__init__()
         self.modified_abilities = {}  # Track modified abilities per character
 
     def on_turn_start(self, game_state):
@@ -608,13 +567,13 @@ class ArcaneMomentum(Modifier):
                         ability.use = use_with_momentum 
 
 class RapidGoldenArrows(Modifier):
+    name = "Rapid Golden Arrows"
+    description = "After each hit of an ability, fire a golden arrow at the same target dealing 50% of Kagome's Golden Arrow damage."
+    rarity = ModifierRarity.EPIC
+    image_path = "assets/modifiers/rapid_golden_arrows.png"
+
     def __init__(self):
-        super().__init__(
-            name="Rapid Golden Arrows",
-            description="After each hit of an ability, fire a golden arrow at the same target dealing 50% of Kagome's Golden Arrow damage.",
-            rarity=ModifierRarity.EPIC,
-            image_path="assets/modifiers/rapid_golden_arrows.png"
-        )
+        super().__init__()
         self.original_ability_uses = {}  # Store original ability use methods
         self.original_execute_hits = {}  # Store original execute_hit methods
         self.golden_arrow_damage = 345  # Kagome's Golden Arrow base damage
@@ -761,14 +720,31 @@ class RapidGoldenArrows(Modifier):
         self.processed_characters.clear()  # Clear processed characters list
         print("Cleared stored methods") 
 
+class AtlanteanWardBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "armor_bonus")
+    
+    def __init__(self, armor_bonus, icon_path):
+        self.type = "custom"
+        self.armor_bonus = armor_bonus
+        self.value = armor_bonus  # For display purposes
+        self.name = "Atlantean Ward"
+        self.description = f"Total of {armor_bonus:.2f}% armor from Atlantean Ward"
+        self.duration = -1  # Permanent buff
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        return True  # Permanent buff
+
 class AtlanteanWard(Modifier):
+    name = "Atlantean Ward"
+    description = "Characters gain 0.5% armor each turn from ancient Atlantean protection"
+    rarity = ModifierRarity.UNCOMMON
+    image_path = "assets/modifiers/atlantean_ward.png"
+
     def __init__(self):
-        super().__init__(
-            name="Atlantean Ward",
-            description="Characters gain 0.5% armor each turn from ancient Atlantean protection",
-            rarity=ModifierRarity.UNCOMMON,
-            image_path="assets/modifiers/atlantean_ward.png"
-        )
+        super().__init__()
         self.armor_buffs = {}  # Track buffs per character
 
     def on_turn_start(self, game_state):
@@ -786,23 +762,9 @@ class AtlanteanWard(Modifier):
                     if character in self.armor_buffs:
                         current_bonus = self.armor_buffs[character].armor_bonus + 0.5
 
-                    class AtlanteanWardBuff:
-                        def __init__(self, icon_path):
-                            self.type = "custom"
-                            self.armor_bonus = current_bonus
-                            self.value = current_bonus  # For display purposes
-                            self.name = "Atlantean Ward"
-                            self.description = f"Total of {current_bonus:.2f}% armor from Atlantean Ward"
-                            self.duration = -1  # Permanent buff
-                            self.heal_per_turn = 0
-                            self.icon = pygame.image.load(icon_path) if icon_path else None
-                        
-                        def update(self):
-                            """Return True to keep the buff active"""
-                            return True  # Permanent buff
                     
                     # Add the buff to the character
-                    new_buff = AtlanteanWardBuff(self.image_path)
+                    new_buff = AtlanteanWardBuff(current_bonus, self.image_path)
                     character.add_buff(new_buff)
                     character.stats.defense += 0.5
                     self.armor_buffs[character] = new_buff
@@ -813,14 +775,31 @@ class AtlanteanWard(Modifier):
                         game_state.battle_log.BUFF_COLOR
                     ) 
 
+class AncientAwakeningBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "mana_multiplier")
+    
+    def __init__(self, icon_path):
+        self.type = "custom"
+        self.mana_multiplier = 2
+        self.value = 2  # For display purposes
+        self.name = "Ancient Awakening"
+        self.description = "Maximum mana doubled by Ancient Awakening"
+        self.duration = -1  # Permanent buff
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        return True  # Permanent buff
+
 class AncientAwakening(Modifier):
+    name = "Ancient Awakening"
+    description = "One of your random characters awakens their ancient power, gaining double maximum mana"
+    rarity = ModifierRarity.LEGENDARY
+    image_path = "assets/modifiers/ancient_awakening.png"
+
     def __init__(self):
-        super().__init__(
-            name="Ancient Awakening",
-            description="One of your random characters awakens their ancient power, gaining double maximum mana",
-            rarity=ModifierRarity.LEGENDARY,
-            image_path="assets/modifiers/ancient_awakening.png"
-        )
+        super().__init__()
         self.buff_applied = False
         self.excluded_types = {"Piranha", "FrozenWarrior"}  # Types to exclude
 
@@ -837,22 +816,6 @@ class AncientAwakening(Modifier):
             if eligible_characters:
                 target = random.choice(eligible_characters)
                 
-                # Create mana buff
-                class AncientAwakeningBuff:
-                    def __init__(self, icon_path):
-                        self.type = "custom"
-                        self.mana_multiplier = 2
-                        self.value = 2  # For display purposes
-                        self.name = "Ancient Awakening"
-                        self.description = "Maximum mana doubled by Ancient Awakening"
-                        self.duration = -1  # Permanent buff
-                        self.heal_per_turn = 0
-                        self.icon = pygame.image.load(icon_path) if icon_path else None
-                    
-                    def update(self):
-                        """Return True to keep the buff active"""
-                        return True  # Permanent buff
-                
                 # Add the buff to the character
                 target.add_buff(AncientAwakeningBuff(self.image_path))
                 
@@ -868,14 +831,35 @@ class AncientAwakening(Modifier):
                 
                 self.buff_applied = True 
 
+class MermaidCrystalBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "ability_name", "ability_id")
+    
+    def __init__(self, ability_name, ability_id, icon_path):
+        self.type = "custom"
+        self.value = 5  # Duration display
+        self.name = "Mermaid Crystal Enchantment"
+        self.description = f"{ability_name} is enchanted:\n• Costs no mana\n• Deals 20% more damage\n{self.value} turns remaining"
+        self.duration = 5
+        self.heal_per_turn = 0
+        self.ability_name = ability_name
+        self.ability_id = ability_id  # Store ability_id for reference
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+    
+    def update(self):
+        """Update the buff and return True if it should continue"""
+        self.duration -= 1
+        self.value = self.duration
+        self.description = f"{self.ability_name} is enchanted:\n• Costs no mana\n• Deals 20% more damage\n{self.duration} turns remaining"
+        return self.duration > 0
+
 class MermaidCrystal(Modifier):
+    name = "Mermaid Crystal"
+    description = "At turn 10,20,25,35,45 and every 10 turns after, enchants one random ability, making it cost no mana and deal 20% more damage for 5 turns"
+    rarity = ModifierRarity.EPIC
+    image_path = "assets/modifiers/mermaid_crystal.png"
+
     def __init__(self):
-        super().__init__(
-            name="Mermaid Crystal",
-            description="At turn 10,20,25,35,45 and every 10 turns after, enchants one random ability, making it cost no mana and deal 20% more damage for 5 turns",
-            rarity=ModifierRarity.EPIC,
-            image_path="assets/modifiers/mermaid_crystal.png"
-        )
+        super().__init__()
         # Store the turns when enchantment should occur
         self.enchant_turns = {9, 19, 24, 34, 44}  # Adjusted for 0-based turn count
         # Add turns beyond 45 up to a reasonable limit
@@ -960,28 +944,8 @@ class MermaidCrystal(Modifier):
                     ability_id = self.store_original_use(target_ability)
                     print(f"Stored original use method for {target_ability.name}")
                     
-                    # Create enchantment buff
-                    class MermaidCrystalBuff:
-                        def __init__(self, ability_name, icon_path):
-                            self.type = "custom"
-                            self.value = 5  # Duration display
-                            self.name = "Mermaid Crystal Enchantment"
-                            self.description = f"{ability_name} is enchanted:\n• Costs no mana\n• Deals 20% more damage\n{self.value} turns remaining"
-                            self.duration = 5
-                            self.heal_per_turn = 0
-                            self.ability_name = ability_name
-                            self.ability_id = ability_id  # Store ability_id for reference
-                            self.icon = pygame.image.load(icon_path) if icon_path else None
-                        
-                        def update(self):
-                            """Update the buff and return True if it should continue"""
-                            self.duration -= 1
-                            self.value = self.duration
-                            self.description = f"{self.ability_name} is enchanted:\n• Costs no mana\n• Deals 20% more damage\n{self.duration} turns remaining"
-                            return self.duration > 0
-                    
                     # Create and add the buff
-                    new_buff = MermaidCrystalBuff(target_ability.name, self.image_path)
+                    new_buff = MermaidCrystalBuff(target_ability.name, ability_id, self.image_path)
                     target_char.add_buff(new_buff)
                     self.current_buffs[target_char] = new_buff
                     print(f"Added new buff to {target_char.name}")
@@ -1057,14 +1021,37 @@ class MermaidCrystal(Modifier):
             self.current_buffs.clear()
             print("Cleared stored methods") 
 
+class HourglassDebuff:
+    __slots__ = ("type", "name", "description", "duration", "value", "icon", "target")
+    
+    def __init__(self, target, icon_path):
+        self.type = "debuff"
+        self.name = "Atlantean Hourglass"
+        self.description = "After 10 turns, this hourglass will explode dealing 3700 HP damage"
+        self.duration = 10
+        self.value = 3700  # Show the damage value in tooltip instead of duration
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+        self.target = target
+    
+    def update(self):
+        """Return True to keep the debuff active"""
+        self.duration -= 1
+        self.description = f"After {self.duration} turns, this hourglass will explode dealing 3700 HP damage"
+        if self.duration <= 0:
+            # Deal damage when the hourglass expires
+            damage = 3700
+            self.target.take_damage(damage)  # Shows the damage text
+            return False
+        return True
+
 class AtlanteanHourglass(Modifier):
+    name = "Atlantean Hourglass"
+    description = "Places an Atlantean Hourglass debuff on a random enemy that explodes after 10 turns, dealing 3700 HP damage"
+    rarity = ModifierRarity.RARE
+    image_path = "assets/modifiers/atlantean_hourglass.png"
+
     def __init__(self):
-        super().__init__(
-            name="Atlantean Hourglass",
-            description="Places an Atlantean Hourglass debuff on a random enemy that explodes after 10 turns, dealing 3700 HP damage",
-            rarity=ModifierRarity.RARE,
-            image_path="assets/modifiers/atlantean_hourglass.png"
-        )
+        super().__init__()
         self.hourglass_applied = False
 
     def on_battle_start(self, game_state):
@@ -1076,34 +1063,8 @@ class AtlanteanHourglass(Modifier):
             if enemies:
                 target = random.choice(enemies)
                 
-                # Create a custom debuff that tracks turns and explodes
-                class HourglassDebuff:
-                    def __init__(self, icon_path):
-                        self.type = "debuff"
-                        self.name = "Atlantean Hourglass"
-                        self.description = "After 10 turns, this hourglass will explode dealing 3700 HP damage"
-                        self.duration = 10
-                        self.value = 3700  # Show the damage value in tooltip instead of duration
-                        self.icon = pygame.image.load(icon_path) if icon_path else None
-                        self.target = target
-                    
-                    def update(self):
-                        """Return True to keep the debuff active"""
-                        self.duration -= 1
-                        self.description = f"After {self.duration} turns, this hourglass will explode dealing 3700 HP damage"
-                        if self.duration <= 0:
-                            # Deal damage when the hourglass expires
-                            damage = 3700
-                            self.target.take_damage(damage)
-                            # Create damage text using position instead of rect
-                            DamageText(self.target.position[0] + self.target.image.get_width() // 2,
-                                     self.target.position[1],
-                                     str(damage), (255, 0, 0))
-                            return False
-                        return True
-                
                 # Add the hourglass debuff
-                target.add_buff(HourglassDebuff(self.image_path))
+                target.add_buff(HourglassDebuff(target, self.image_path))
                 
                 # Log the application
                 game_state.battle_log.add_message(
@@ -1113,14 +1074,37 @@ class AtlanteanHourglass(Modifier):
                 
                 self.hourglass_applied = True 
 
+class SwitchingSwordBuff:
+    __slots__ = ("type", "value", "name", "description", "duration", "heal_per_turn", "icon", "is_switching_sword", "is_positive")
+    
+    def __init__(self, is_positive, icon_path):
+        self.type = "custom"
+        self.is_switching_sword = True  # Mark this as our buff
+        self.value = 15 if is_positive else -15  # For display purposes
+        self.name = "Switching Sword"
+        self.description = f"{'Increased' if is_positive else 'Decreased'} damage by 15%"
+        self.duration = 1  # Lasts until next turn
+        self.heal_per_turn = 0
+        self.icon = load_modifier_image(icon_path) if icon_path else None
+        self.is_positive = is_positive
+    
+    def update(self):
+        """Return True to keep the buff active"""
+        self.duration -= 1
+        return self.duration > 0
+    
+    def apply_damage_increase(self, damage):
+        """Modify damage based on current state"""
+        return int(damage * (1.15 if self.is_positive else 0.85))
+
 class SwitchingSword(Modifier):
+    name = "Switching Sword"
+    description = "Randomly placed on an ally at game start. Alternates between +15% and -15% damage each turn."
+    rarity = ModifierRarity.COMMON
+    image_path = "assets/modifiers/switching_sword.png"
+
     def __init__(self):
-        super().__init__(
-            name="Switching Sword",
-            description="Randomly placed on an ally at game start. Alternates between +15% and -15% damage each turn.",
-            rarity=ModifierRarity.COMMON,
-            image_path="assets/modifiers/switching_sword.png"
-        )
+        super().__init__()
         self.buff_applied = False
         self.current_turn_positive = True
         self.buffed_character = None
@@ -1153,39 +1137,17 @@ class SwitchingSword(Modifier):
             self.buffed_character.buffs = [buff for buff in self.buffed_character.buffs 
                                          if not hasattr(buff, 'is_switching_sword')]
             
-            # Create new buff
-            class SwitchingSwordBuff:
-                def __init__(self, is_positive, icon_path):
-                    self.type = "custom"
-                    self.is_switching_sword = True  # Mark this as our buff
-                    self.value = 15 if is_positive else -15  # For display purposes
-                    self.name = "Switching Sword"
-                    self.description = f"{'Increased' if is_positive else 'Decreased'} damage by 15%"
-                    self.duration = 1  # Lasts until next turn
-                    self.heal_per_turn = 0
-                    self.icon = pygame.image.load(icon_path) if icon_path else None
-                    self.is_positive = is_positive
-                
-                def update(self):
-                    """Return True to keep the buff active"""
-                    self.duration -= 1
-                    return self.duration > 0
-                
-                def apply_damage_increase(self, damage):
-                    """Modify damage based on current state"""
-                    return int(damage * (1.15 if self.is_positive else 0.85))
-            
             # Add the new buff
             new_buff = SwitchingSwordBuff(self.current_turn_positive, self.image_path)
             self.buffed_character.add_buff(new_buff)
             
             # Create floating text to show the effect
             buff_text = f"+15% DMG" if self.current_turn_positive else "-15% DMG"
-            DamageText(
-                self.buffed_character.position[0] + self.buffed_character.image.get_width() // 2,
-                self.buffed_character.position[1],
+            self.buffed_character.show_floating_text(
                 buff_text,
-                (0, 255, 0) if self.current_turn_positive else (255, 0, 0)
+                (0, 255, 0) if self.current_turn_positive else (255, 0, 0),
+                position=(self.buffed_character.position[0] + self.buffed_character.image.get_width() // 2,
+                          self.buffed_character.position[1])
             )
             
             # Log the buff application
@@ -1,36 +1,55 @@
+import base64
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
-from firebase_admin import db
-from config.firebase_config import initialize_firebase
 from config.login_config import LoginManager
+from services.storage_backend import StorageBackend, get_backend
+from services.snapshot_format import encode_snapshot, decode_snapshot
 
 class DatabaseService:
-    def __init__(self):
-        """Initialize the database service with Firebase."""
+    LEADERBOARD_TTL = 30.0  # Seconds before the cached leaderboard is refreshed
+    
+    def __init__(self, backend: Optional[StorageBackend] = None, user_id: Optional[str] = None):
+        """Initialize the database service.
+        
+        Args:
+            backend: Storage backend to use, defaults to get_backend() (Firebase unless configured otherwise)
+            user_id: Skip the username lookup and use this user ID directly
+        """
         print("Initializing DatabaseService...")  # Debug print
-        initialize_firebase()  # Just initialize Firebase, don't store the reference
-        # Get the user ID from credentials
-        login_manager = LoginManager()
-        credentials = login_manager.load_credentials()
-        username = credentials[0] if credentials else None
-        # TODO: Get actual user ID from Firebase Auth
-        # For now, we'll look up the user ID from the username
-        users_ref = db.reference('/users')
-        users_data = users_ref.get()
-        self.user_id = None
-        if users_data and username:
-            for uid, user_data in users_data.items():
-                if user_data.get('username') == username:
-                    self.user_id = uid
-                    break
+        self.backend = backend or get_backend()
+        self.user_id = user_id
+        if not self.user_id:
+            # Get the user ID from credentials
+            login_manager = LoginManager()
+            credentials = login_manager.load_credentials()
+            username = credentials[0] if credentials else None
+            # TODO: Get actual user ID from Firebase Auth
+            # For now, we'll look up the user ID from the username
+            users_ref = self.backend.reference('/users')
+            users_data = users_ref.get()
+            if users_data and username:
+                for uid, user_data in users_data.items():
+                    if user_data.get('username') == username:
+                        self.user_id = uid
+                        break
         if not self.user_id:
             raise ValueError(f"Could not find user ID for username: {username}")
         print(f"Initialized database service for user ID: {self.user_id}")  # Debug print
         
+        # Locally cached top-N leaderboard, ordered from lowest to highest score
+        self._leaderboard: Dict[str, int] = OrderedDict()
+        self._leaderboard_limit = 0
+        self._leaderboard_fetched_at = 0.0
+        self._leaderboard_refreshing = False
+        self._leaderboard_lock = threading.Lock()
+        
     def test_connection(self, player_id: str) -> bool:
         """Test the database connection by writing and reading a test value."""
         print(f"Testing connection for player: {player_id}")  # Debug print
         try:
-            test_ref = db.reference(f'/users/{self.user_id}/test')
+            test_ref = self.backend.reference(f'/users/{self.user_id}/test')
             test_data = {"test": "connection"}
             print(f"Writing test data to path: /users/{self.user_id}/test")  # Debug print
             test_ref.set(test_data)
@@ -49,10 +68,10 @@ class DatabaseService:
         try:
             if "RaidInventory" in data:
                 # Save RaidInventory directly to maintain exact structure
-                raid_ref = db.reference(f'/users/{self.user_id}/RaidInventory')
+                raid_ref = self.backend.reference(f'/users/{self.user_id}/RaidInventory')
                 raid_ref.set(data["RaidInventory"])
             else:
-                ref = db.reference(f'/users/{self.user_id}')
+                ref = self.backend.reference(f'/users/{self.user_id}')
                 ref.set(data)
             print("Player data saved successfully")  # Debug print
         except Exception as e:
@@ -63,7 +82,7 @@ class DatabaseService:
         """Retrieve player data from Firebase."""
         print(f"Getting player data for: {player_id}")  # Debug print
         try:
-            ref = db.reference(f'/users/{self.user_id}')
+            ref = self.backend.reference(f'/users/{self.user_id}')
             data = ref.get()
             print(f"Retrieved player data: {data}")  # Debug print
             return data if data else {}
@@ -73,57 +92,125 @@ class DatabaseService:
     
     def save_inventory(self, player_id: str, inventory_data: List[Dict[str, Any]]) -> None:
         """Save player's inventory to Firebase."""
-        ref = db.reference(f'/users/{self.user_id}/inventory')
+        ref = self.backend.reference(f'/users/{self.user_id}/inventory')
         ref.set(inventory_data)
     
     def get_inventory(self, player_id: str) -> Optional[List[Dict[str, Any]]]:
         """Retrieve player's inventory from Firebase."""
-        ref = db.reference(f'/users/{self.user_id}/inventory')
+        ref = self.backend.reference(f'/users/{self.user_id}/inventory')
         data = ref.get()
         return data if data else []
     
     def save_stage_progress(self, player_id: str, stage_data: Dict[str, Any]) -> None:
         """Save player's stage progress to Firebase."""
-        ref = db.reference(f'/users/{self.user_id}/stages')
+        ref = self.backend.reference(f'/users/{self.user_id}/stages')
         ref.update(stage_data)
     
     def get_stage_progress(self, player_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve player's stage progress from Firebase."""
-        ref = db.reference(f'/users/{self.user_id}/stages')
+        ref = self.backend.reference(f'/users/{self.user_id}/stages')
         data = ref.get()
         return data if data else {}
         
     def save_character_stats(self, player_id: str, character_id: str, stats: Dict[str, Any]) -> None:
         """Save character stats to Firebase."""
-        ref = db.reference(f'/users/{self.user_id}/characters/{character_id}')
+        ref = self.backend.reference(f'/users/{self.user_id}/characters/{character_id}')
         ref.update(stats)
     
     def get_character_stats(self, player_id: str, character_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve character stats from Firebase."""
-        ref = db.reference(f'/users/{self.user_id}/characters/{character_id}')
+        ref = self.backend.reference(f'/users/{self.user_id}/characters/{character_id}')
         data = ref.get()
         return data if data else {}
     
     def save_game_state(self, player_id: str, state: Dict[str, Any]) -> None:
-        """Save the current game state to Firebase."""
-        ref = db.reference(f'/game_states/{self.user_id}')
-        ref.set(state)
+        """Save the current game state to Firebase as a compact binary snapshot."""
+        ref = self.backend.reference(f'/game_states/{self.user_id}')
+        # The Realtime Database only stores JSON, so the snapshot is base64 encoded
+        ref.set({
+            "format": "snapshot",
+            "data": base64.b64encode(encode_snapshot(state)).decode("ascii")
+        })
     
     def get_game_state(self, player_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve the game state from Firebase."""
-        ref = db.reference(f'/game_states/{self.user_id}')
+        ref = self.backend.reference(f'/game_states/{self.user_id}')
         data = ref.get()
+        if isinstance(data, dict) and data.get("format") == "snapshot":
+            return decode_snapshot(base64.b64decode(data["data"]))
+        # Older saves were stored as plain JSON
         return data if data else {}
     
-    def update_high_scores(self, player_id: str, score: int) -> None:
-        """Update player's high score in Firebase."""
-        ref = db.reference(f'/high_scores/{self.user_id}')
-        current_score = ref.get() or 0
-        if score > current_score:
-            ref.set(score)
+    def update_high_scores(self, player_id: str, score: int) -> int:
+        """Submit a score and return the player's best score.
+        
+        Uses a transaction, so concurrent clients can't overwrite a higher score
+        and the read-compare-write takes a single round trip.
+        """
+        ref = self.backend.reference(f'/high_scores/{self.user_id}')
+        best = ref.transaction(lambda current: score if current is None or score > current else current)
+        self._merge_leaderboard_entry(self.user_id, best)
+        return best
+    
+    def get_high_scores(self, limit: int = 10, max_age: Optional[float] = None) -> Dict[str, int]:
+        """Get top high scores, ordered from lowest to highest.
+        
+        Served from the local leaderboard cache. A stale cache is returned immediately
+        and refreshed in the background; the database is only queried synchronously
+        when nothing large enough is cached yet.
+        
+        Args:
+            limit: Number of top scores to return
+            max_age: Cache TTL in seconds, defaults to LEADERBOARD_TTL
+        """
+        max_age = self.LEADERBOARD_TTL if max_age is None else max_age
+        with self._leaderboard_lock:
+            cached = self._leaderboard if self._leaderboard_limit >= limit else None
+            is_stale = time.monotonic() - self._leaderboard_fetched_at > max_age
+        
+        if cached is None:
+            self.refresh_high_scores(limit)
+        elif is_stale:
+            self._refresh_high_scores_async(limit)
+        
+        with self._leaderboard_lock:
+            entries = list(self._leaderboard.items())
+        return OrderedDict(entries[-limit:] if limit else [])
     
-    def get_high_scores(self, limit: int = 10) -> Dict[str, int]:
-        """Get top high scores from Firebase."""
-        ref = db.reference('/high_scores')
+    def refresh_high_scores(self, limit: int = 10) -> None:
+        """Re-query the top scores and replace the leaderboard cache."""
+        ref = self.backend.reference('/high_scores')
         data = ref.order_by_value().limit_to_last(limit).get()
-        return data if data else {} 
\ No newline at end of file
+        with self._leaderboard_lock:
+            self._leaderboard = OrderedDict(data or {})
+            self._leaderboard_limit = limit
+            self._leaderboard_fetched_at = time.monotonic()
+    
+    def _refresh_high_scores_async(self, limit: int):
+        """Refresh the leaderboard cache on a background thread, once at a time."""
+        with self._leaderboard_lock:
+            if self._leaderboard_refreshing:
+                return
+            self._leaderboard_refreshing = True
+        
+        def refresh():
+            try:
+                self.refresh_high_scores(max(limit, self._leaderboard_limit))
+            except Exception as e:
+                print(f"Error refreshing high scores: {e}")
+            finally:
+                with self._leaderboard_lock:
+                    self._leaderboard_refreshing = False
+        
+        threading.Thread(target=refresh, name="LeaderboardRefresh", daemon=True).start()
+    
+    def _merge_leaderboard_entry(self, user_id: str, score: int):
+        """Apply a known score to the cached leaderboard without re-querying."""
+        with self._leaderboard_lock:
+            if not self._leaderboard_limit:
+                return
+            entries = dict(self._leaderboard)
+            entries[user_id] = score
+            # Same ordering as order_by_value: by score, ties broken by key
+            ordered = sorted(entries.items(), key=lambda entry: (entry[1], entry[0]))
+            self._leaderboard = OrderedDict(ordered[-self._leaderboard_limit:])
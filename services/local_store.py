@@ -0,0 +1,139 @@
+"""Local-first document store backed by SQLite under Raidfolder/."""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+from services.snapshot_format import encode_snapshot, decode_snapshot
+
+def _canonical(value: Any) -> Any:
+    """Copy of a document with dict keys sorted, so equal documents encode to equal blobs."""
+    if isinstance(value, dict):
+        return {key: _canonical(value[key]) for key in sorted(value, key=str)}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+def _decode(data) -> Dict[str, Any]:
+    """Decode a stored document, older stores kept documents as JSON text."""
+    if isinstance(data, str):
+        return json.loads(data)
+    return decode_snapshot(data)
+
+class LocalStore:
+    """Keyed documents persisted locally as compact binary snapshots.
+
+    The local copy is the source of truth for gameplay. Every write bumps the
+    document revision and marks it dirty so the sync reconciler knows what still
+    has to be pushed to Firebase.
+    """
+
+    def __init__(self, path: Path = Path("Raidfolder/raid_store.db")):
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        # The reconciler thread shares this connection, access is serialized by _lock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS documents (
+                key TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                revision INTEGER NOT NULL DEFAULT 0,
+                dirty INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored document for key, or None if it was never written."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM documents WHERE key = ?", (key,)
+            ).fetchone()
+        return _decode(row[0]) if row else None
+
+    def put(self, key: str, data: Dict[str, Any], dirty: bool = True) -> int:
+        """Write a document and return its new revision.
+
+        Local gameplay writes are dirty (pending upload). Pass dirty=False for data
+        that already matches the remote copy, e.g. a legacy import or a pull.
+        """
+        encoded = encode_snapshot(_canonical(data))
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO documents (key, data, revision, dirty, updated_at)
+                   VALUES (?, ?, 1, ?, ?)
+                   ON CONFLICT(key) DO UPDATE SET
+                       data = excluded.data,
+                       revision = documents.revision + 1,
+                       dirty = excluded.dirty,
+                       updated_at = excluded.updated_at""",
+                (key, encoded, int(dirty), time.time())
+            )
+            self._conn.commit()
+            return self._conn.execute(
+                "SELECT revision FROM documents WHERE key = ?", (key,)
+            ).fetchone()[0]
+
+    def is_dirty(self, key: str) -> bool:
+        """Check if a document has local changes that were not pushed yet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT dirty FROM documents WHERE key = ?", (key,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def pending(self) -> List[Tuple[str, Dict[str, Any], int]]:
+        """Get all dirty documents as (key, data, revision) tuples."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, data, revision FROM documents WHERE dirty = 1"
+            ).fetchall()
+        return [(key, _decode(data), revision) for key, data, revision in rows]
+
+    def mark_synced(self, key: str, revision: int) -> bool:
+        """Clear the dirty flag if the document was not changed since revision was read.
+
+        Returns:
+            bool: True if the flag was cleared, False if a newer local write exists
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE documents SET dirty = 0 WHERE key = ? AND revision = ?",
+                (key, revision)
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def apply_remote(self, key: str, data: Dict[str, Any]) -> bool:
+        """Store a pulled remote document unless local changes are still pending.
+
+        Returns:
+            bool: True if the local copy changed
+        """
+        # Key order of pulled documents varies, compare canonical encodings
+        encoded = encode_snapshot(_canonical(data))
+        with self._lock:
+            # Conditional update keeps the dirty check and the write atomic
+            cursor = self._conn.execute(
+                """UPDATE documents SET data = ?, revision = revision + 1, updated_at = ?
+                   WHERE key = ? AND dirty = 0 AND data != ?""",
+                (encoded, time.time(), key, encoded)
+            )
+            if cursor.rowcount == 0:
+                cursor = self._conn.execute(
+                    """INSERT OR IGNORE INTO documents (key, data, revision, dirty, updated_at)
+                       VALUES (?, ?, 1, 0, ?)""",
+                    (key, encoded, time.time())
+                )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,99 @@
+"""Compact, versioned binary format for game state snapshots.
+
+Layout: 4 byte magic, 1 byte flags, 2 byte schema version (big endian), then a
+msgpack payload that is zstd-compressed when the flag is set. zstd is optional;
+without it snapshots are written uncompressed and compressed ones can't be read.
+"""
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict
+import msgpack
+
+try:
+    import zstandard
+except ImportError:  # Optional, snapshots are just written uncompressed
+    zstandard = None
+
+MAGIC = b"PFRS"
+SCHEMA_VERSION = 1
+FLAG_ZSTD = 0x01
+_HEADER = struct.Struct(">4sBH")
+
+# Payloads smaller than this aren't worth the compression frame overhead
+COMPRESS_THRESHOLD = 256
+
+class SnapshotFormatError(ValueError):
+    """Raised when a snapshot can't be decoded or migrated."""
+    pass
+
+# Migrations from a schema version to the next one: {from_version: migrate(state) -> state}
+_migrations: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+def register_migration(from_version: int):
+    """Decorator registering a migration from from_version to from_version + 1.
+
+    Example:
+        @register_migration(1)
+        def add_turn_phase(state):
+            state.setdefault("turn_phase", "player")
+            return state
+    """
+    def decorator(func: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        if from_version in _migrations:
+            raise ValueError(f"Migration from schema {from_version} already registered")
+        _migrations[from_version] = func
+        return func
+    return decorator
+
+def migrate(state: Dict[str, Any], version: int) -> Dict[str, Any]:
+    """Upgrade a decoded state from version to SCHEMA_VERSION."""
+    if version > SCHEMA_VERSION:
+        raise SnapshotFormatError(f"Snapshot schema {version} is newer than supported {SCHEMA_VERSION}")
+    while version < SCHEMA_VERSION:
+        if version not in _migrations:
+            raise SnapshotFormatError(f"No migration from snapshot schema {version}")
+        state = _migrations[version](state)
+        version += 1
+    return state
+
+def encode_snapshot(state: Dict[str, Any], compress: bool = True, level: int = 3) -> bytes:
+    """Encode a state dict into the binary snapshot format."""
+    payload = msgpack.packb(state, use_bin_type=True)
+    flags = 0
+    if compress and zstandard is not None and len(payload) >= COMPRESS_THRESHOLD:
+        payload = zstandard.ZstdCompressor(level=level).compress(payload)
+        flags |= FLAG_ZSTD
+    return _HEADER.pack(MAGIC, flags, SCHEMA_VERSION) + payload
+
+def decode_snapshot(blob: bytes) -> Dict[str, Any]:
+    """Decode a binary snapshot, applying schema migrations if it is older."""
+    if len(blob) < _HEADER.size:
+        raise SnapshotFormatError("Snapshot is truncated")
+    magic, flags, version = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise SnapshotFormatError("Not a snapshot (bad magic)")
+    payload = memoryview(blob)[_HEADER.size:]
+    if flags & FLAG_ZSTD:
+        if zstandard is None:
+            raise SnapshotFormatError("Snapshot is zstd-compressed but zstandard is not installed")
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+    state = msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    return migrate(state, version)
+
+def is_snapshot(blob: Any) -> bool:
+    """Check if a value looks like an encoded snapshot."""
+    return isinstance(blob, (bytes, bytearray, memoryview)) and bytes(blob[:len(MAGIC)]) == MAGIC
+
+def write_snapshot_file(path: Path, state: Dict[str, Any], compress: bool = True):
+    """Atomically write a snapshot file (never leaves a half-written file behind)."""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(encode_snapshot(state, compress))
+    os.replace(tmp_path, path)
+
+def read_snapshot_file(path: Path) -> Dict[str, Any]:
+    """Read a snapshot file written by write_snapshot_file."""
+    with open(path, "rb") as f:
+        return decode_snapshot(f.read())
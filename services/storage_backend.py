@@ -0,0 +1,336 @@
+"""Pluggable storage backends for the Realtime Database API.
+
+DatabaseService only needs `backend.reference(path)` objects that behave like
+`firebase_admin.db.Reference`. FirebaseBackend talks to the production database,
+InMemoryBackend is an in-process stand-in for tests and benchmarks with optional
+latency and failure injection.
+"""
+import copy
+import os
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+class BackendUnavailableError(Exception):
+    """Raised by InMemoryBackend when a failure is injected."""
+    pass
+
+class StorageBackend:
+    """Base class for storage backends."""
+
+    def reference(self, path: str = "/"):
+        """Get a reference to the given database path."""
+        raise NotImplementedError("Each backend must implement reference")
+
+class FirebaseBackend(StorageBackend):
+    """Backend for the production Firebase Realtime Database."""
+
+    def __init__(self):
+        from config.firebase_config import initialize_firebase
+        initialize_firebase()
+
+    def reference(self, path: str = "/"):
+        from firebase_admin import db
+        return db.reference(path)
+
+def _split_path(path: str) -> List[str]:
+    return [part for part in path.strip("/").split("/") if part]
+
+def _normalize(value: Any) -> Any:
+    """Mimic Firebase storage rules: None and empty containers are not stored."""
+    if isinstance(value, dict):
+        result = {}
+        for key, child in value.items():
+            child = _normalize(child)
+            if child is not None:
+                result[str(key)] = child
+        return result or None
+    if isinstance(value, (list, tuple)):
+        # Firebase stores arrays as maps with integer keys
+        return _normalize({str(i): child for i, child in enumerate(value)})
+    return value
+
+def _denormalize(value: Any) -> Any:
+    """Return maps with dense integer keys as lists, like the Firebase SDK does."""
+    if isinstance(value, dict):
+        converted = {key: _denormalize(child) for key, child in value.items()}
+        if converted and all(key.isdigit() for key in converted):
+            indices = sorted(int(key) for key in converted)
+            if indices[-1] < 2 * len(indices):
+                result = [None] * (indices[-1] + 1)
+                for key, child in converted.items():
+                    result[int(key)] = child
+                return result
+        return converted
+    return value
+
+def _sort_key(value: Any) -> Tuple:
+    """Firebase ordering: null < booleans < numbers < strings < objects."""
+    if value is None:
+        return (0, 0)
+    if isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, (int, float)):
+        return (2, value)
+    if isinstance(value, str):
+        return (3, value)
+    return (4, 0)
+
+class MemoryQuery:
+    """Ordered, limited read of the children of a MemoryReference."""
+
+    def __init__(self, ref: "MemoryReference", order_by: Callable[[str, Any], Any]):
+        self._ref = ref
+        self._order_by = order_by
+        self._limit_first: Optional[int] = None
+        self._limit_last: Optional[int] = None
+        self._start = None
+        self._end = None
+
+    def limit_to_first(self, limit: int) -> "MemoryQuery":
+        self._limit_first = limit
+        return self
+
+    def limit_to_last(self, limit: int) -> "MemoryQuery":
+        self._limit_last = limit
+        return self
+
+    def start_at(self, start) -> "MemoryQuery":
+        self._start = start
+        return self
+
+    def end_at(self, end) -> "MemoryQuery":
+        self._end = end
+        return self
+
+    def equal_to(self, value) -> "MemoryQuery":
+        self._start = value
+        self._end = value
+        return self
+
+    def get(self) -> "OrderedDict[str, Any]":
+        node = self._ref.get()
+        if isinstance(node, list):
+            node = {str(i): child for i, child in enumerate(node) if child is not None}
+        if not isinstance(node, dict):
+            return OrderedDict()
+        items = [(key, child, self._order_by(key, child)) for key, child in node.items()]
+        if self._start is not None:
+            items = [item for item in items if _sort_key(item[2]) >= _sort_key(self._start)]
+        if self._end is not None:
+            items = [item for item in items if _sort_key(item[2]) <= _sort_key(self._end)]
+        # Ties are broken by key, as in Firebase
+        items.sort(key=lambda item: (_sort_key(item[2]), item[0]))
+        if self._limit_first is not None:
+            items = items[:self._limit_first]
+        if self._limit_last is not None:
+            items = items[-self._limit_last:] if self._limit_last else []
+        return OrderedDict((key, child) for key, child, _ in items)
+
+class MemoryReference:
+    """Stand-in for firebase_admin.db.Reference backed by an InMemoryBackend."""
+
+    def __init__(self, backend: "InMemoryBackend", path: str):
+        self._backend = backend
+        self._parts = _split_path(path)
+
+    @property
+    def key(self) -> Optional[str]:
+        return self._parts[-1] if self._parts else None
+
+    @property
+    def path(self) -> str:
+        return "/" + "/".join(self._parts)
+
+    @property
+    def parent(self) -> Optional["MemoryReference"]:
+        if not self._parts:
+            return None
+        return MemoryReference(self._backend, "/".join(self._parts[:-1]))
+
+    def child(self, path: str) -> "MemoryReference":
+        return MemoryReference(self._backend, "/".join(self._parts + _split_path(path)))
+
+    def get(self) -> Any:
+        with self._backend.operation("get"):
+            return _denormalize(copy.deepcopy(self._backend.read(self._parts)))
+
+    def set(self, value: Any):
+        with self._backend.operation("set"):
+            self._backend.write(self._parts, _normalize(copy.deepcopy(value)))
+
+    def update(self, value: Dict[str, Any]):
+        if not isinstance(value, dict) or not value:
+            raise ValueError("Value argument must be a non-empty dictionary.")
+        with self._backend.operation("update"):
+            for key, child in value.items():
+                # Keys may be nested paths, exactly like multi-location updates
+                self._backend.write(self._parts + _split_path(key), _normalize(copy.deepcopy(child)))
+
+    def delete(self):
+        with self._backend.operation("delete"):
+            self._backend.write(self._parts, None)
+
+    def push(self, value: Any = "") -> "MemoryReference":
+        # Time-prefixed keys keep pushed children in insertion order
+        key = f"-{time.time_ns():020d}{uuid.uuid4().hex[:8]}"
+        ref = self.child(key)
+        ref.set(value)
+        return ref
+
+    def transaction(self, transaction_update: Callable[[Any], Any]) -> Any:
+        """Atomically read, modify and write this node. Returns the new value."""
+        with self._backend.operation("transaction"):
+            current = _denormalize(copy.deepcopy(self._backend.read(self._parts)))
+            new_value = transaction_update(current)
+            self._backend.write(self._parts, _normalize(copy.deepcopy(new_value)))
+            return new_value
+
+    def order_by_value(self) -> MemoryQuery:
+        return MemoryQuery(self, lambda key, value: value)
+
+    def order_by_key(self) -> MemoryQuery:
+        return MemoryQuery(self, lambda key, value: key)
+
+    def order_by_child(self, path: str) -> MemoryQuery:
+        parts = _split_path(path)
+
+        def child_value(key, value):
+            for part in parts:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(part)
+            return value
+        return MemoryQuery(self, child_value)
+
+class InMemoryBackend(StorageBackend):
+    """In-process Realtime Database stand-in.
+
+    Args:
+        data: Initial database contents
+        latency: Simulated round trip time in seconds per operation
+        jitter: Random extra latency in seconds, uniformly distributed
+        failure_rate: Probability (0-1) that an operation raises BackendUnavailableError
+        seed: Seed for the latency/failure random generator
+    """
+
+    def __init__(self,
+                 data: Optional[Dict[str, Any]] = None,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 failure_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        self._root = _normalize(copy.deepcopy(data)) if data else None
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)
+        self._fail_next = 0
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.operation_counts: Dict[str, int] = {}
+
+    def reference(self, path: str = "/") -> MemoryReference:
+        return MemoryReference(self, path)
+
+    def fail_next(self, count: int = 1):
+        """Make the next count operations fail regardless of failure_rate."""
+        with self._lock:
+            self._fail_next += count
+
+    def reset_stats(self):
+        """Reset the per-operation counters."""
+        with self._lock:
+            self.operation_counts = {}
+
+    def operation(self, name: str) -> "_Operation":
+        return _Operation(self, name)
+
+    def _begin(self, name: str):
+        with self._lock:
+            self.operation_counts[name] = self.operation_counts.get(name, 0) + 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self._fail_next > 0 or (self.failure_rate and self._random.random() < self.failure_rate)
+            if self._fail_next > 0:
+                self._fail_next -= 1
+        # Sleep outside the lock so concurrent clients overlap like real round trips
+        if delay > 0:
+            time.sleep(delay)
+        if fail:
+            raise BackendUnavailableError(f"Injected failure for {name}")
+
+    def read(self, parts: List[str]) -> Any:
+        node = self._root
+        for part in parts:
+            if not isinstance(node, dict) or part not in node:
+                return None
+            node = node[part]
+        return node
+
+    def write(self, parts: List[str], value: Any):
+        if not parts:
+            self._root = value
+            return
+        if not isinstance(self._root, dict):
+            self._root = {}
+        # Walk down creating intermediate maps, remembering the chain for pruning
+        chain = [self._root]
+        node = self._root
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {}
+                node[part] = child
+            node = child
+            chain.append(node)
+        if value is None:
+            node.pop(parts[-1], None)
+        else:
+            node[parts[-1]] = value
+        # Remove maps left empty, Firebase has no empty nodes
+        for depth in range(len(chain) - 1, 0, -1):
+            if chain[depth]:
+                break
+            chain[depth - 1].pop(parts[depth - 1], None)
+        if not self._root:
+            self._root = None
+
+class _Operation:
+    """Context manager applying latency/failure injection and holding the data lock."""
+
+    def __init__(self, backend: InMemoryBackend, name: str):
+        self._backend = backend
+        self._name = name
+
+    def __enter__(self):
+        self._backend._begin(self._name)
+        self._backend._lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._backend._lock.release()
+        return False
+
+# Backend used by DatabaseService when none is passed explicitly
+_default_backend: Optional[StorageBackend] = None
+
+def set_backend(backend: Optional[StorageBackend]):
+    """Set the default backend, or None to go back to the environment selection."""
+    global _default_backend
+    _default_backend = backend
+
+def get_backend() -> StorageBackend:
+    """Get the default backend.
+
+    Uses the backend passed to set_backend, otherwise the RAID_STORAGE_BACKEND
+    environment variable ("firebase" or "memory", defaults to "firebase").
+    """
+    global _default_backend
+    if _default_backend is None:
+        if os.environ.get("RAID_STORAGE_BACKEND", "firebase").lower() == "memory":
+            _default_backend = InMemoryBackend()
+        else:
+            _default_backend = FirebaseBackend()
+    return _default_backend
@@ -0,0 +1,114 @@
+"""Background reconciliation between the local store and Firebase."""
+import threading
+from typing import Callable, Dict, Any, Optional, List
+from services.local_store import LocalStore
+
+class SyncReconciler:
+    """Pushes dirty local documents to Firebase and pulls remote changes.
+
+    Runs on a daemon thread so startup and gameplay never wait on the network.
+    The DatabaseService is created lazily on that thread, and connection failures
+    only delay the next attempt (offline play keeps working from the local store).
+    """
+
+    def __init__(self,
+                 store: LocalStore,
+                 keys: List[str],
+                 on_remote_change: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 interval: float = 30.0,
+                 max_backoff: float = 300.0):
+        self.store = store
+        self.keys = keys  # Top-level keys under /users/{user_id} that are mirrored
+        self.on_remote_change = on_remote_change
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.db_service = None
+        self.is_online = False
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def user_id(self) -> Optional[str]:
+        """The Firebase user ID, or None until the first successful connection."""
+        return self.db_service.user_id if self.db_service else None
+
+    def start(self):
+        """Start the background reconciliation thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="SyncReconciler", daemon=True)
+        self._thread.start()
+
+    def request_sync(self):
+        """Wake the reconciler so pending local writes are pushed soon."""
+        self._wake.set()
+
+    def stop(self, flush: bool = True, timeout: float = 5.0):
+        """Stop the background thread, optionally pushing pending writes first."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        if flush and self.db_service:
+            try:
+                self.push_pending()
+            except Exception as e:
+                print(f"Error flushing pending sync: {e}")
+
+    def _connect(self) -> bool:
+        """Create the DatabaseService if we don't have one yet."""
+        if self.db_service:
+            return True
+        try:
+            from services.database_service import DatabaseService
+            self.db_service = DatabaseService()
+            return True
+        except Exception as e:
+            print(f"Sync offline, will retry: {e}")
+            return False
+
+    def push_pending(self) -> int:
+        """Push all dirty documents to Firebase. Returns the number pushed."""
+        pushed = 0
+        for key, data, revision in self.store.pending():
+            self.db_service.save_player_data(self.db_service.user_id, {key: data})
+            # A newer local write keeps the document dirty for the next pass
+            self.store.mark_synced(key, revision)
+            pushed += 1
+        return pushed
+
+    def pull_remote(self) -> int:
+        """Pull remote documents that have no pending local changes. Returns changes applied."""
+        remote = self.db_service.get_player_data(self.db_service.user_id)
+        applied = 0
+        for key in self.keys:
+            if key in remote and isinstance(remote[key], dict):
+                if self.store.apply_remote(key, remote[key]):
+                    applied += 1
+                    if self.on_remote_change:
+                        self.on_remote_change(key, remote[key])
+        return applied
+
+    def sync_once(self) -> bool:
+        """Run a single push/pull pass. Returns True if it reached Firebase."""
+        if not self._connect():
+            return False
+        self.push_pending()
+        self.pull_remote()
+        return True
+
+    def _run(self):
+        delay = self.interval
+        while not self._stop.is_set():
+            try:
+                self.is_online = self.sync_once()
+            except Exception as e:
+                print(f"Sync error: {e}")
+                self.is_online = False
+            # Back off while offline, return to the normal interval once connected
+            delay = self.interval if self.is_online else min(delay * 2, self.max_backoff)
+            self._wake.wait(delay)
+            self._wake.clear()
@@ -4,11 +4,16 @@ from characters.base_character import Character
 from pathlib import Path
 from items.loot_table import LootTable
 from PIL import Image
+from engine.battle_state import StageSnapshot, snapshot_stage
+from characters.prototypes import prototypes
 
 # Global cache for stage backgrounds to share between stages
 _background_cache: Dict[str, pygame.Surface] = {}
 
 class BaseStage:
+    # Prototype names of characters this stage spawns mid-battle, built while loading
+    summons: List[str] = []
+    
     def __init__(self, 
                  stage_number: int,
                  name: str,
@@ -40,6 +45,7 @@ class BaseStage:
         
         # Loot tables for each enemy type
         self.loot_tables: Dict[Type[Character], LootTable] = {}
+        self._last_snapshot: Optional[StageSnapshot] = None
     
     @staticmethod
     def clear_background_cache():
@@ -71,6 +77,18 @@ class BaseStage:
             return self.loot_tables[char_type]
         return None
     
+    def snapshot(self) -> StageSnapshot:
+        """Take an immutable snapshot of the stage counters and bosses."""
+        self._last_snapshot = snapshot_stage(self, self._last_snapshot)
+        return self._last_snapshot
+    
+    def restore(self, snapshot: StageSnapshot):
+        """Restore the stage counters and bosses, re-adding bosses that died since."""
+        if snapshot.stage is not self:
+            raise ValueError(f"Snapshot of {snapshot.class_name} can't be restored onto {self.name}")
+        snapshot.restore()
+        self._last_snapshot = snapshot
+    
     def setup_bosses(self) -> List[Character]:
         """Override this method to define stage-specific bosses"""
         raise NotImplementedError("Each stage must implement setup_bosses")
@@ -78,6 +96,7 @@ class BaseStage:
     def initialize(self):
         """Initialize the stage, setting up bosses and any stage-specific mechanics"""
         self.bosses = self.setup_bosses()
+        prototypes.prewarm(*self.summons)
     
     def is_completed(self) -> bool:
         return all(not boss.is_alive() for boss in self.bosses)
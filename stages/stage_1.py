@@ -1,5 +1,6 @@
 from stages.base_stage import BaseStage
 from characters.shadowfin_boss import create_shadowfin_boss, Piranha
+from characters.prototypes import prototypes
 from typing import List
 from characters.base_character import Character
 from items.loot_table import LootTable
@@ -8,6 +9,8 @@ from items.buffs import PiranhaScales, TidalCharm, VoidEssence
 import pygame
 
 class Stage1(BaseStage):
+    summons = ["Piranha"]
+    
     def __init__(self):
         super().__init__(
             stage_number=1,
@@ -61,7 +64,7 @@ class Stage1(BaseStage):
             
             # Create and add 3 piranhas
             for _ in range(3):
-                piranha = Piranha()
+                piranha = prototypes.spawn("Piranha")
                 self.bosses.append(piranha)
             
             # Log the event
@@ -75,11 +78,6 @@ class Stage1(BaseStage):
                     "  A school of piranhas appears!",
                     GameEngine.instance.battle_log.TEXT_COLOR
                 )
-        
-        # Apply modifier effects at turn end
-        from engine.game_engine import GameEngine
-        if GameEngine.instance and hasattr(GameEngine.instance, 'modifier_manager'):
-            GameEngine.instance.modifier_manager.apply_turn_end(GameEngine.instance)
     
     def update_character_positions(self):
         """Update positions of all characters"""
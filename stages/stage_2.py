@@ -278,8 +278,3 @@ class Stage2(BaseStage):
                     "  More frozen warriors emerge!",
                     GameEngine.instance.battle_log.TEXT_COLOR
                 )
-        
-        # Apply modifier effects at turn end
-        from engine.game_engine import GameEngine
-        if GameEngine.instance and hasattr(GameEngine.instance, 'modifier_manager'):
-            GameEngine.instance.modifier_manager.apply_turn_end(GameEngine.instance) 
\ No newline at end of file
@@ -1,5 +1,4 @@
 import pygame
-import random
 from stages.base_stage import BaseStage
 from characters.base_character import Character, Stats
 from typing import List
@@ -9,265 +8,36 @@ from items.consumables import SmokeBomb, DeepSeaEssence, MurkyWaterVial
 from items.buffs import TidalCharm, VoidEssence, ShadowDagger
 from abilities.base_ability import Ability, AbilityEffect
 from abilities.status_effect import StatusEffect
+from characters.prototypes import prototypes
+from engine.utility_ai import UtilityProfile, Always, SelfHpBelow, HasUnmarkedTarget, TargetCountAtLeast, PreferUnmarked
 
 class ShadowAssassin(Character):
     """Shadow Assassin boss class"""
-    def update(self):
-        """Use abilities with improved selection logic"""
-        super().update()  # Call parent update for damage flash effects etc.
-        
-        # Reset ability usage flag at the start of each turn
-        from engine.game_engine import GameEngine
-        if not GameEngine.instance:
-            return
-        stage = GameEngine.instance.stage_manager.current_stage
-        
-        # Don't use abilities until game has started
-        if not stage.game_started:
-            return
-            
-        if stage.turn_count > self.last_turn_count:
-            self.ability_used_this_turn = False
-            self.last_turn_count = stage.turn_count
-        
-        # Don't use another ability if we've already used one this turn
-        if self.ability_used_this_turn:
-            return
-            
-        # Get all available abilities that can be used
-        available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-        if not available_abilities:
-            return
-            
-        # Get valid targets first
-        valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                        if char.is_alive() and char.is_targetable()]
-        if not valid_targets:
-            return
-            
-        # Prioritize abilities based on situation
-        weights = []
-        for ability in available_abilities:
-            weight = 1.0
-            
-            # Increase weight for Shadowstep when low on health
-            if ability.name == "Shadowstep" and self.stats.current_hp < self.stats.max_hp * 0.4:
-                weight = 2.0
-            # High priority for Death Mark on targets without it
-            elif ability.name == "Death Mark":
-                # Check if any target doesn't have Death Mark
-                has_unmarked_target = any(
-                    not any(buff.name == "Death Mark" for buff in target.buffs)
-                    for target in valid_targets
-                )
-                if has_unmarked_target:
-                    weight = 1.8  # High priority to mark targets
-            
-            weights.append(weight)
-            
-        # Choose ability based on weights
-        ability = random.choices(available_abilities, weights=weights, k=1)[0]
-        
-        if ability.auto_self_target:
-            if ability.use(self, [self]):
-                self.ability_used_this_turn = True
-        else:
-            if ability.name == "Death Mark":
-                # Prioritize targets that don't have Death Mark
-                unmarked_targets = [
-                    target for target in valid_targets
-                    if not any(buff.name == "Death Mark" for buff in target.buffs)
-                ]
-                if unmarked_targets:
-                    target = random.choice(unmarked_targets)
-                else:
-                    target = random.choice(valid_targets)
-            else:
-                target = random.choice(valid_targets)
-                
-            if ability.use(self, [target]):
-                self.ability_used_this_turn = True
+    ai_profile = UtilityProfile({
+        "Shadowstep": [SelfHpBelow(0.4, 2.0)],  # Escape when low on health
+        "Death Mark": [HasUnmarkedTarget("Death Mark", 1.8)],  # High priority to mark targets
+    }, target_preferences={"Death Mark": PreferUnmarked("Death Mark")})
 
 class ReptilianAssassin(Character):
     """Reptilian Assassin boss class"""
-    def update(self):
-        """Use abilities with improved selection logic"""
-        super().update()  # Call parent update for damage flash effects etc.
-        
-        # Reset ability usage flag at the start of each turn
-        from engine.game_engine import GameEngine
-        if not GameEngine.instance:
-            return
-        stage = GameEngine.instance.stage_manager.current_stage
-        
-        # Don't use abilities until game has started
-        if not stage.game_started:
-            return
-            
-        if stage.turn_count > self.last_turn_count:
-            self.ability_used_this_turn = False
-            self.last_turn_count = stage.turn_count
-        
-        # Don't use another ability if we've already used one this turn
-        if self.ability_used_this_turn:
-            return
-            
-        # Get all available abilities that can be used
-        available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-        if not available_abilities:
-            return
-            
-        # Get valid targets first
-        valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                        if char.is_alive() and char.is_targetable()]
-        if not valid_targets:
-            return
-            
-        # Prioritize abilities based on situation
-        weights = []
-        for ability in available_abilities:
-            weight = 1.0
-            
-            # Increase weight for Shadowstep when low on health
-            if ability.name == "Shadowstep" and self.stats.current_hp < self.stats.max_hp * 0.4:
-                weight = 2.0
-            # Increase weight for Venomous Blade
-            elif ability.name == "Venomous Blade":
-                weight = 1.8  # High priority to use poison
-            
-            weights.append(weight)
-            
-        # Choose ability based on weights
-        ability = random.choices(available_abilities, weights=weights, k=1)[0]
-        
-        if ability.auto_self_target:
-            if ability.use(self, [self]):
-                self.ability_used_this_turn = True
-        else:
-            # Choose a random valid target
-            target = random.choice(valid_targets)
-            if ability.use(self, [target]):
-                self.ability_used_this_turn = True
+    ai_profile = UtilityProfile({
+        "Shadowstep": [SelfHpBelow(0.4, 2.0)],
+        "Venomous Blade": [Always(1.8)],  # High priority to use poison
+    })
 
 class FemaleAssassin(Character):
     """Female Shadow Assassin boss class"""
-    def update(self):
-        """Use abilities with improved selection logic"""
-        super().update()  # Call parent update for damage flash effects etc.
-        
-        # Reset ability usage flag at the start of each turn
-        from engine.game_engine import GameEngine
-        if not GameEngine.instance:
-            return
-        stage = GameEngine.instance.stage_manager.current_stage
-        
-        # Don't use abilities until game has started
-        if not stage.game_started:
-            return
-            
-        if stage.turn_count > self.last_turn_count:
-            self.ability_used_this_turn = False
-            self.last_turn_count = stage.turn_count
-        
-        # Don't use another ability if we've already used one this turn
-        if self.ability_used_this_turn:
-            return
-            
-        # Get all available abilities that can be used
-        available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-        if not available_abilities:
-            return
-            
-        # Get valid targets first
-        valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                        if char.is_alive() and char.is_targetable()]
-        if not valid_targets:
-            return
-            
-        # Prioritize abilities based on situation
-        weights = []
-        for ability in available_abilities:
-            weight = 1.0
-            
-            # Increase weight for Shadowstep when low on health
-            if ability.name == "Shadowstep" and self.stats.current_hp < self.stats.max_hp * 0.4:
-                weight = 2.0
-            # High priority for Fan of Knives when multiple targets are available
-            elif ability.name == "Fan of Knives" and len(valid_targets) > 1:
-                weight = 2.0  # Higher priority with multiple targets
-            elif ability.name == "Fan of Knives":
-                weight = 1.5  # Still good priority with single target
-            
-            weights.append(weight)
-            
-        # Choose ability based on weights
-        ability = random.choices(available_abilities, weights=weights, k=1)[0]
-        
-        if ability.auto_self_target:
-            if ability.use(self, [self]):
-                self.ability_used_this_turn = True
-        else:
-            # Choose a random valid target
-            target = random.choice(valid_targets)
-            if ability.use(self, [target]):
-                self.ability_used_this_turn = True
+    ai_profile = UtilityProfile({
+        "Shadowstep": [SelfHpBelow(0.4, 2.0)],
+        "Fan of Knives": [Always(1.5), TargetCountAtLeast(2, 2.0)],  # Better with multiple targets
+    })
 
 class OctopusAssassin(Character):
     """Octopus Assassin boss class"""
-    def update(self):
-        """Use abilities with improved selection logic"""
-        super().update()  # Call parent update for damage flash effects etc.
-        
-        # Reset ability usage flag at the start of each turn
-        from engine.game_engine import GameEngine
-        if not GameEngine.instance:
-            return
-        stage = GameEngine.instance.stage_manager.current_stage
-        
-        # Don't use abilities until game has started
-        if not stage.game_started:
-            return
-            
-        if stage.turn_count > self.last_turn_count:
-            self.ability_used_this_turn = False
-            self.last_turn_count = stage.turn_count
-        
-        # Don't use another ability if we've already used one this turn
-        if self.ability_used_this_turn:
-            return
-            
-        # Get all available abilities that can be used
-        available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-        if not available_abilities:
-            return
-            
-        # Prioritize abilities based on situation
-        weights = []
-        for ability in available_abilities:
-            weight = 1.0
-            
-            # Increase weight for Shadowstep when low on health
-            if ability.name == "Shadowstep" and self.stats.current_hp < self.stats.max_hp * 0.4:
-                weight = 2.0
-            # Increase weight for Drain Life when below 60% health
-            elif ability.name == "Drain Life" and self.stats.current_hp < self.stats.max_hp * 0.6:
-                weight = 1.5
-                
-            weights.append(weight)
-            
-        # Choose ability based on weights
-        ability = random.choices(available_abilities, weights=weights, k=1)[0]
-        
-        if ability.auto_self_target:
-            if ability.use(self, [self]):
-                self.ability_used_this_turn = True
-        else:
-            # Find a valid target
-            valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                           if char.is_alive() and char.is_targetable()]
-            if valid_targets:
-                if ability.use(self, [random.choice(valid_targets)]):
-                    self.ability_used_this_turn = True
+    ai_profile = UtilityProfile({
+        "Shadowstep": [SelfHpBelow(0.4, 2.0)],
+        "Drain Life": [SelfHpBelow(0.6, 1.5)],
+    })
 
 class IceWarrior(Character):
     """Ice Warrior minion class"""
@@ -410,10 +180,6 @@ def create_assassin(name: str, image_path: str) -> Character:
     
     assassin = Character(name, stats, image_path)
     
-    # Initialize ability usage tracking
-    assassin.ability_used_this_turn = False
-    assassin.last_turn_count = -1
-    
     # Create basic auto attack ability
     auto_attack = Ability(
         name="Assassin Strike",
@@ -480,7 +246,7 @@ def create_assassin(name: str, image_path: str) -> Character:
             # If buff is expiring, restore opacity
             if self.duration <= 0 and self.target:
                 if self.original_alpha is not None:
-                    self.target.image.set_alpha(self.original_alpha)
+                    self.target.own_image().set_alpha(self.original_alpha)
                 from engine.game_engine import GameEngine
                 if GameEngine.instance:
                     GameEngine.instance.battle_log.add_message(
@@ -504,12 +270,12 @@ def create_assassin(name: str, image_path: str) -> Character:
             """Called when the buff is applied"""
             self.target = target  # Store reference to target
             self.original_alpha = target.image.get_alpha()  # Store original alpha
-            target.image.set_alpha(51)  # 20% opacity
+            target.own_image().set_alpha(51)  # 20% opacity
         
         def on_remove(self, target: Character):
             """Called when the buff is removed"""
             if self.original_alpha is not None:
-                target.image.set_alpha(self.original_alpha)  # Restore original alpha
+                target.own_image().set_alpha(self.original_alpha)  # Restore original alpha
     
     # Override use method to handle stealth
     def shadowstep_use(caster: Character, targets: List[Character]) -> bool:
@@ -612,6 +378,8 @@ def create_ice_warrior() -> Character:
     warrior.update = warrior_update
     return warrior
 
+prototypes.register("Frozen Atlantean", create_ice_warrior)
+
 def create_drain_life():
     """Create the Drain Life ability"""
     ability = Ability(
@@ -743,6 +511,8 @@ def create_death_mark():
     return ability
 
 class Stage3(BaseStage):
+    summons = ["Frozen Atlantean"]
+    
     def __init__(self):
         super().__init__(
             stage_number=3,
@@ -900,7 +670,7 @@ class Stage3(BaseStage):
                 if GameEngine.instance and GameEngine.instance.stage_manager.current_stage:
                     # Add 2 ice warriors to player's team
                     for _ in range(2):
-                        warrior = create_ice_warrior()
+                        warrior = prototypes.spawn("Frozen Atlantean")
                         GameEngine.instance.stage_manager.player_characters.append(warrior)
                     
                     GameEngine.instance.battle_log.add_message(
@@ -930,11 +700,6 @@ class Stage3(BaseStage):
     def on_turn_end(self):
         """Called at the end of each turn"""
         self.turn_count += 1
-        
-        # Apply modifier effects at turn end
-        from engine.game_engine import GameEngine
-        if GameEngine.instance and hasattr(GameEngine.instance, 'modifier_manager'):
-            GameEngine.instance.modifier_manager.apply_turn_end(GameEngine.instance)
     
     def update(self):
         """Update stage state"""
@@ -14,6 +14,147 @@ import types
 from functools import partial
 import math
 
+class WaveCrushDebuff(StatusEffect):
+    __slots__ = ("stacks",)
+    
+    def __init__(self, value: float, duration: int, icon: pygame.Surface):
+        super().__init__("damage_taken_increase", value, duration, icon)
+        self.name = "Wave Crush"
+        self.description = f"Taking {int(value * 100)}% increased damage"
+        self.stacks = 1  # Track number of stacks
+    
+    def update(self) -> bool:
+        """Update the debuff"""
+        self.duration -= 1
+        self.description = f"Taking {int(self.value * 100)}% increased damage ({self.stacks} stacks)\n{self.duration} turns remaining"
+        return self.duration > 0
+    
+    def get_tooltip_title(self) -> str:
+        return f"Wave Crush ({self.stacks} stacks)"
+    
+    def get_tooltip_text(self) -> str:
+        return f"Taking {int(self.value * 100)}% increased damage from all sources\n{self.duration} turns remaining"
+    
+    def on_damage_taken(self, damage: int) -> int:
+        """Increase damage taken by the debuff percentage"""
+        return int(damage * (1 + self.value))
+    
+    def stack(self, new_debuff):
+        """Stack with another Wave Crush debuff"""
+        self.value += new_debuff.value  # Add the values together
+        self.duration = max(self.duration, new_debuff.duration)  # Take the longer duration
+        self.stacks += 1  # Increment stack count
+        self.description = f"Taking {int(self.value * 100)}% increased damage ({self.stacks} stacks)\n{self.duration} turns remaining"
+
+class DisabledAbilityDebuff(StatusEffect):
+    __slots__ = ("disabled_ability", "original_abilities")
+    
+    def __init__(self, ability: Ability, duration: int, icon: pygame.Surface):
+        super().__init__("custom", duration, duration, icon)
+        self.name = "Disabled Ability"
+        self.description = f"{ability.name} is disabled"
+        self.disabled_ability = ability
+        
+        # Store original ability use functions and draw methods
+        self.original_abilities = []
+        original_draw = ability.draw if hasattr(ability, 'draw') else None
+        original_use = ability.use
+        original_icon = ability.icon.copy()  # Store original icon
+        self.original_abilities.append((ability, original_use, original_draw, original_icon))
+        
+        # Override use function to disable ability
+        ability.use = lambda *args, **kwargs: False
+        
+        # Create draw method with X overlay
+        def draw_with_x(self_ability, screen):
+            # Create a new surface for the X overlay
+            x_size = self_ability.icon.get_width()
+            x_surface = pygame.Surface((x_size, x_size), pygame.SRCALPHA)
+            x_color = (255, 0, 0, 180)  # Semi-transparent red
+            x_thickness = 3  # Define thickness for the X
+            
+            # Draw the X with a black outline for better visibility
+            # Draw black outline
+            outline_color = (0, 0, 0, 180)
+            outline_thickness = x_thickness + 2
+            pygame.draw.line(x_surface, outline_color, (0, 0), (x_size, x_size), outline_thickness)
+            pygame.draw.line(x_surface, outline_color, (0, x_size), (x_size, 0), outline_thickness)
+            
+            # Draw red X
+            pygame.draw.line(x_surface, x_color, (0, 0), (x_size, x_size), x_thickness)
+            pygame.draw.line(x_surface, x_color, (0, x_size), (x_size, 0), x_thickness)
+            
+            # Create a new icon with the X overlay
+            new_icon = self_ability.icon.copy()
+            new_icon.blit(x_surface, (0, 0))
+            self_ability.icon = new_icon
+        
+        # Apply the X overlay to the icon immediately
+        draw_with_x(ability, None)
+        
+        # Create a new method that includes both the original functionality and our X overlay
+        def combined_draw(self_ability, screen):
+            # First call the original Ability.draw to handle normal ability drawing
+            Ability.draw(self_ability, screen)
+            # Then add our X overlay
+            draw_with_x(self_ability, screen)
+        
+        # Bind the combined draw method to the ability
+        ability.draw = types.MethodType(combined_draw, ability)
+    
+    def update(self) -> bool:
+        """Update the debuff"""
+        self.duration -= 1
+        self.description = f"{self.disabled_ability.name} is disabled\n{self.duration} turns remaining"
+        
+        if self.duration <= 0:
+            # Restore original ability functionality
+            for ability, original_use, original_draw, original_icon in self.original_abilities:
+                ability.use = original_use
+                if original_draw:
+                    ability.draw = original_draw
+                ability.icon = original_icon  # Restore original icon
+            return False
+        return True
+    
+    def get_tooltip_title(self) -> str:
+        return f"Disabled: {self.disabled_ability.name}"
+    
+    def get_tooltip_text(self) -> str:
+        return f"This ability has been disabled by Monstrous Scream\n{self.duration} turns remaining"
+
+class AbyssalRegenerationBuff(StatusEffect):
+    __slots__ = ("heal_per_turn", "is_removable")
+    
+    def __init__(self, icon: pygame.Surface):
+        super().__init__("custom", 88, -1, icon)  # -1 duration means permanent
+        self.name = "Abyssal Regeneration"
+        self.description = "Regenerates 88 HP at the end of each turn"
+        self.heal_per_turn = 88  # This will trigger automatic healing in end_turn()
+        self.is_removable = False  # Make buff immune to removal
+    
+    def update(self) -> bool:
+        """Keep the buff active permanently"""
+        return True  # Always keep the buff active
+    
+    def get_tooltip_title(self) -> str:
+        return "Abyssal Regeneration"
+    
+    def get_tooltip_text(self) -> str:
+        return "Passive: Regenerates 88 HP at the end of each turn\nCannot be removed"
+    
+    def on_remove(self, target: Character):
+        """If somehow removed, reapply immediately"""
+        if target and target.is_alive():
+            target.add_buff(AbyssalRegenerationBuff(self.icon))
+            # Log the reapplication
+            from engine.game_engine import GameEngine
+            if GameEngine.instance:
+                GameEngine.instance.battle_log.add_message(
+                    f"{target.name}'s Abyssal Regeneration reactivates!",
+                    GameEngine.instance.battle_log.BUFF_COLOR
+                )
+
 def create_dark_leviathan():
     """Create Dark Leviathan - A powerful underwater creature boss"""
     stats = Stats(
@@ -54,36 +195,6 @@ def create_dark_leviathan():
     )
 
     # Create Wave Crush ability
-    class WaveCrushDebuff(StatusEffect):
-        def __init__(self, value: float, duration: int, icon: pygame.Surface):
-            super().__init__("damage_taken_increase", value, duration, icon)
-            self.name = "Wave Crush"
-            self.description = f"Taking {int(value * 100)}% increased damage"
-            self.stacks = 1  # Track number of stacks
-        
-        def update(self) -> bool:
-            """Update the debuff"""
-            self.duration -= 1
-            self.description = f"Taking {int(self.value * 100)}% increased damage ({self.stacks} stacks)\n{self.duration} turns remaining"
-            return self.duration > 0
-        
-        def get_tooltip_title(self) -> str:
-            return f"Wave Crush ({self.stacks} stacks)"
-        
-        def get_tooltip_text(self) -> str:
-            return f"Taking {int(self.value * 100)}% increased damage from all sources\n{self.duration} turns remaining"
-        
-        def on_damage_taken(self, damage: int) -> int:
-            """Increase damage taken by the debuff percentage"""
-            return int(damage * (1 + self.value))
-        
-        def stack(self, new_debuff):
-            """Stack with another Wave Crush debuff"""
-            self.value += new_debuff.value  # Add the values together
-            self.duration = max(self.duration, new_debuff.duration)  # Take the longer duration
-            self.stacks += 1  # Increment stack count
-            self.description = f"Taking {int(self.value * 100)}% increased damage ({self.stacks} stacks)\n{self.duration} turns remaining"
-
     wave_crush = Ability(
         name="Wave Crush",
         description="A massive wave that deals 900 damage to all enemies and increases their damage taken by 10% for 10 turns. This effect can stack!",
@@ -96,81 +207,6 @@ def create_dark_leviathan():
     )
 
     # Create Monstrous Scream ability
-    class DisabledAbilityDebuff(StatusEffect):
-        def __init__(self, ability: Ability, duration: int, icon: pygame.Surface):
-            super().__init__("custom", duration, duration, icon)
-            self.name = "Disabled Ability"
-            self.description = f"{ability.name} is disabled"
-            self.disabled_ability = ability
-            
-            # Store original ability use functions and draw methods
-            self.original_abilities = []
-            original_draw = ability.draw if hasattr(ability, 'draw') else None
-            original_use = ability.use
-            original_icon = ability.icon.copy()  # Store original icon
-            self.original_abilities.append((ability, original_use, original_draw, original_icon))
-            
-            # Override use function to disable ability
-            ability.use = lambda *args, **kwargs: False
-            
-            # Create draw method with X overlay
-            def draw_with_x(self_ability, screen):
-                # Create a new surface for the X overlay
-                x_size = self_ability.icon.get_width()
-                x_surface = pygame.Surface((x_size, x_size), pygame.SRCALPHA)
-                x_color = (255, 0, 0, 180)  # Semi-transparent red
-                x_thickness = 3  # Define thickness for the X
-                
-                # Draw the X with a black outline for better visibility
-                # Draw black outline
-                outline_color = (0, 0, 0, 180)
-                outline_thickness = x_thickness + 2
-                pygame.draw.line(x_surface, outline_color, (0, 0), (x_size, x_size), outline_thickness)
-                pygame.draw.line(x_surface, outline_color, (0, x_size), (x_size, 0), outline_thickness)
-                
-                # Draw red X
-                pygame.draw.line(x_surface, x_color, (0, 0), (x_size, x_size), x_thickness)
-                pygame.draw.line(x_surface, x_color, (0, x_size), (x_size, 0), x_thickness)
-                
-                # Create a new icon with the X overlay
-                new_icon = self_ability.icon.copy()
-                new_icon.blit(x_surface, (0, 0))
-                self_ability.icon = new_icon
-            
-            # Apply the X overlay to the icon immediately
-            draw_with_x(ability, None)
-            
-            # Create a new method that includes both the original functionality and our X overlay
-            def combined_draw(self_ability, screen):
-                # First call the original Ability.draw to handle normal ability drawing
-                Ability.draw(self_ability, screen)
-                # Then add our X overlay
-                draw_with_x(self_ability, screen)
-            
-            # Bind the combined draw method to the ability
-            ability.draw = types.MethodType(combined_draw, ability)
-        
-        def update(self) -> bool:
-            """Update the debuff"""
-            self.duration -= 1
-            self.description = f"{self.disabled_ability.name} is disabled\n{self.duration} turns remaining"
-            
-            if self.duration <= 0:
-                # Restore original ability functionality
-                for ability, original_use, original_draw, original_icon in self.original_abilities:
-                    ability.use = original_use
-                    if original_draw:
-                        ability.draw = original_draw
-                    ability.icon = original_icon  # Restore original icon
-                return False
-            return True
-        
-        def get_tooltip_title(self) -> str:
-            return f"Disabled: {self.disabled_ability.name}"
-        
-        def get_tooltip_text(self) -> str:
-            return f"This ability has been disabled by Monstrous Scream\n{self.duration} turns remaining"
-
     monstrous_scream = Ability(
         name="Monstrous Scream",
         description="A terrifying scream that deals 665 damage and disables a random ability for all enemies for 8 turns.",
@@ -183,36 +219,6 @@ def create_dark_leviathan():
     )
 
     # Create Abyssal Regeneration passive ability
-    class AbyssalRegenerationBuff(StatusEffect):
-        def __init__(self, icon: pygame.Surface):
-            super().__init__("custom", 88, -1, icon)  # -1 duration means permanent
-            self.name = "Abyssal Regeneration"
-            self.description = "Regenerates 88 HP at the end of each turn"
-            self.heal_per_turn = 88  # This will trigger automatic healing in end_turn()
-            self.is_removable = False  # Make buff immune to removal
-        
-        def update(self) -> bool:
-            """Keep the buff active permanently"""
-            return True  # Always keep the buff active
-        
-        def get_tooltip_title(self) -> str:
-            return "Abyssal Regeneration"
-        
-        def get_tooltip_text(self) -> str:
-            return "Passive: Regenerates 88 HP at the end of each turn\nCannot be removed"
-        
-        def on_remove(self, target: Character):
-            """If somehow removed, reapply immediately"""
-            if target and target.is_alive():
-                target.add_buff(AbyssalRegenerationBuff(self.icon))
-                # Log the reapplication
-                from engine.game_engine import GameEngine
-                if GameEngine.instance:
-                    GameEngine.instance.battle_log.add_message(
-                        f"{target.name}'s Abyssal Regeneration reactivates!",
-                        GameEngine.instance.battle_log.BUFF_COLOR
-                    )
-
     abyssal_regen = Ability(
         name="Abyssal Regeneration",
         description="Passive: At the end of each turn, regenerate 88 HP.",
@@ -681,11 +687,6 @@ class Stage4(BaseStage):
                     "  The wave restores 1500 HP to all characters!",
                     GameEngine.instance.battle_log.HEAL_COLOR
                 )
-        
-        # Apply modifier effects at turn end
-        from engine.game_engine import GameEngine
-        if GameEngine.instance and hasattr(GameEngine.instance, 'modifier_manager'):
-            GameEngine.instance.modifier_manager.apply_turn_end(GameEngine.instance)
     
     def handle_debug_command(self, command: str) -> bool:
         """Handle debug commands for the stage"""
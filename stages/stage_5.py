@@ -1,5 +1,6 @@
 from stages.base_stage import BaseStage
 from characters.base_character import Character, Stats
+from characters import image_filters
 from characters.atlantean_zasalamel import create_atlantean_zasalamel
 from characters.subzero import create_subzero
 from characters.atlantean_kotal_kahn import create_atlantean_kotal_kahn
@@ -10,10 +11,22 @@ from abilities.base_ability import Ability, AbilityEffect, StatusEffect
 from stages.stage_3 import (
     create_death_mark, create_venomous_blade, create_fan_of_knives, create_drain_life
 )
+from characters.prototypes import prototypes
+from engine.utility_ai import UtilityProfile, Always, HasUnmarkedTarget, TargetCountAtLeast, PreferUnmarked
 
+# Spawned assassins favor their special ability, more so with multiple targets
+SPAWNED_ASSASSIN_PROFILE = UtilityProfile({
+    name: [Always(1.5), TargetCountAtLeast(2, 2.0)]
+    for name in ["Fan of Knives", "Death Mark", "Venomous Blade", "Drain Life"]
+})
 
 class ShadowAssassin(Character):
     """Shadow Assassin minion class"""
+    ai_profile = UtilityProfile(
+        {"Death Mark": [HasUnmarkedTarget("Death Mark", 2.0)]},  # High priority to mark targets
+        target_preferences={"Death Mark": PreferUnmarked("Death Mark")}
+    )
+    
     def __init__(self):
         stats = Stats(
             max_hp=1500,  # Reduced from 2200
@@ -26,10 +39,6 @@ class ShadowAssassin(Character):
         )
         super().__init__("Shadow Assassin", stats, "assets/characters/shadow_assassin.png")
         
-        # Initialize ability usage tracking
-        self.ability_used_this_turn = False
-        self.last_turn_count = -1
-        
         # Create Shadow Strike ability
         shadow_strike = Ability(
             name="Assassin Strike",
@@ -41,86 +50,13 @@ class ShadowAssassin(Character):
             can_self_target=False
         )
         self.add_ability(shadow_strike)
-    
-    def update(self):
-        """Use abilities automatically"""
-        Character.update(self)  # Call Character's update method directly
-        
-        # Reset ability usage flag at the start of each turn
-        from engine.game_engine import GameEngine
-        if not GameEngine.instance:
-            return
-        stage = GameEngine.instance.stage_manager.current_stage
-        
-        # Don't use abilities until game has started
-        if not stage.game_started:
-            return
-            
-        # Don't use abilities if debug console is open
-        if GameEngine.instance.debug_console.visible:
-            return
-            
-        if stage.turn_count > self.last_turn_count:
-            self.ability_used_this_turn = False
-            self.last_turn_count = stage.turn_count
-        
-        # Don't use another ability if we've already used one this turn
-        if self.ability_used_this_turn:
-            return
-            
-        # Get all available abilities that can be used
-        available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-        if not available_abilities:
-            return
-            
-        # Get valid targets first
-        valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                        if char.is_alive() and char.is_targetable()]
-        if not valid_targets:
-            return
-            
-        # Prioritize abilities based on situation
-        weights = []
-        for ability in available_abilities:
-            weight = 1.0
-            
-            # High priority for Death Mark on targets without it
-            if ability.name == "Death Mark":
-                # Check if any target doesn't have Death Mark
-                has_unmarked_target = any(
-                    not any(buff.name == "Death Mark" for buff in target.buffs)
-                    for target in valid_targets
-                )
-                if has_unmarked_target:
-                    weight = 2.0  # High priority to mark targets
-            
-            weights.append(weight)
-            
-        # Choose ability based on weights
-        ability = random.choices(available_abilities, weights=weights, k=1)[0]
-        
-        if ability.auto_self_target:
-            if ability.use(self, [self]):
-                self.ability_used_this_turn = True
-        else:
-            if ability.name == "Death Mark":
-                # Prioritize targets that don't have Death Mark
-                unmarked_targets = [
-                    target for target in valid_targets
-                    if not any(buff.name == "Death Mark" for buff in target.buffs)
-                ]
-                if unmarked_targets:
-                    target = random.choice(unmarked_targets)
-                else:
-                    target = random.choice(valid_targets)
-            else:
-                target = random.choice(valid_targets)
-                
-            if ability.use(self, [target]):
-                self.ability_used_this_turn = True
 
 class EliteShadowAssassin(Character):
     """Elite Shadow Assassin minion class"""
+    ai_profile = UtilityProfile({
+        "Fan of Knives": [Always(1.5), TargetCountAtLeast(2, 2.0)],  # Better with multiple targets
+    })
+    
     def __init__(self):
         stats = Stats(
             max_hp=3500,
@@ -133,10 +69,6 @@ class EliteShadowAssassin(Character):
         )
         super().__init__("Elite Shadow Assassin", stats, "assets/characters/shadow_assassin_female.png")
         
-        # Initialize ability usage tracking
-        self.ability_used_this_turn = False
-        self.last_turn_count = -1
-        
         # Create Shadow Strike ability
         shadow_strike = Ability(
             name="Assassin Strike",
@@ -148,68 +80,6 @@ class EliteShadowAssassin(Character):
             can_self_target=False
         )
         self.add_ability(shadow_strike)
-    
-    def update(self):
-        """Use abilities automatically"""
-        Character.update(self)  # Call Character's update method directly
-        
-        # Reset ability usage flag at the start of each turn
-        from engine.game_engine import GameEngine
-        if not GameEngine.instance:
-            return
-        stage = GameEngine.instance.stage_manager.current_stage
-        
-        # Don't use abilities until game has started
-        if not stage.game_started:
-            return
-            
-        # Don't use abilities if debug console is open
-        if GameEngine.instance.debug_console.visible:
-            return
-            
-        if stage.turn_count > self.last_turn_count:
-            self.ability_used_this_turn = False
-            self.last_turn_count = stage.turn_count
-        
-        # Don't use another ability if we've already used one this turn
-        if self.ability_used_this_turn:
-            return
-            
-        # Get all available abilities that can be used
-        available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-        if not available_abilities:
-            return
-            
-        # Get valid targets first
-        valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                        if char.is_alive() and char.is_targetable()]
-        if not valid_targets:
-            return
-            
-        # Prioritize abilities based on situation
-        weights = []
-        for ability in available_abilities:
-            weight = 1.0
-            
-            # High priority for Fan of Knives when multiple targets are available
-            if ability.name == "Fan of Knives" and len(valid_targets) > 1:
-                weight = 2.0  # Higher priority with multiple targets
-            elif ability.name == "Fan of Knives":
-                weight = 1.5  # Still good priority with single target
-            
-            weights.append(weight)
-            
-        # Choose ability based on weights
-        ability = random.choices(available_abilities, weights=weights, k=1)[0]
-        
-        if ability.auto_self_target:
-            if ability.use(self, [self]):
-                self.ability_used_this_turn = True
-        else:
-            # Choose a random valid target
-            target = random.choice(valid_targets)
-            if ability.use(self, [target]):
-                self.ability_used_this_turn = True
 
 class IceWarrior(Character):
     """Ice Warrior minion class"""
@@ -323,19 +193,8 @@ class ShadowProtectionBuff:
         
     def on_apply(self, target):
         """Called when buff is applied"""
-        # Add visual effect - blue-white tint
-        if not hasattr(target, 'immune_image'):
-            target.immune_image = target.image.copy()
-            # Create blue-white tint (60% original, 40% blue-white)
-            blue_white = pygame.Surface(target.image.get_size()).convert_alpha()
-            blue_white.fill((200, 220, 255))  # Light blue-white color
-            target.immune_image.blit(blue_white, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-            # Blend with original to keep some detail
-            target.immune_image.set_alpha(102)  # 40% opacity
-            temp = target.original_image.copy()
-            temp.blit(target.immune_image, (0, 0))
-            target.immune_image = temp
-        target.image = target.immune_image
+        # Add visual effect - blue-white tint (60% original, 40% blue-white)
+        target.image = image_filters.apply(target.original_image, "tint", color=(200, 220, 255), strength=0.4)
         
     def on_remove(self, target):
         """Called when buff is removed"""
@@ -384,6 +243,8 @@ def update_zasalamel_immunity():
             )
 
 class Stage5(BaseStage):
+    summons = ["Frozen Atlantean"]
+    
     def __init__(self):
         super().__init__(
             stage_number=5,
@@ -482,7 +343,7 @@ class Stage5(BaseStage):
                 if GameEngine.instance and GameEngine.instance.stage_manager.current_stage:
                     # Add 2 ice warriors to player's team
                     for _ in range(2):
-                        warrior = create_ice_warrior()
+                        warrior = prototypes.spawn("Frozen Atlantean")
                         GameEngine.instance.stage_manager.player_characters.append(warrior)
                     
                     GameEngine.instance.battle_log.add_message(
@@ -558,10 +419,6 @@ class Stage5(BaseStage):
                 new_assassin = Character(name, stats, image_path)
                 new_assassin.__class__ = assassin_class
                 
-                # Initialize ability usage tracking
-                new_assassin.ability_used_this_turn = False
-                new_assassin.last_turn_count = -1
-                
                 # Create and add basic Assassin Strike with reduced damage
                 auto_attack = Ability(
                     name="Assassin Strike",
@@ -607,69 +464,8 @@ class Stage5(BaseStage):
                         effect.value = int(effect.value * 0.67)  # Reduce to 67% of original damage
                 new_assassin.add_ability(special_ability)
                 
-                # Add update method to use abilities
-                def update(self):
-                    """Use abilities automatically"""
-                    Character.update(self)  # Call Character's update method directly
-                    
-                    # Reset ability usage flag at the start of each turn
-                    from engine.game_engine import GameEngine
-                    if not GameEngine.instance:
-                        return
-                    stage = GameEngine.instance.stage_manager.current_stage
-                    
-                    # Don't use abilities until game has started
-                    if not stage.game_started:
-                        return
-                        
-                    if stage.turn_count > self.last_turn_count:
-                        self.ability_used_this_turn = False
-                        self.last_turn_count = stage.turn_count
-                    
-                    # Don't use another ability if we've already used one this turn
-                    if self.ability_used_this_turn:
-                        return
-                        
-                    # Get all available abilities that can be used
-                    available_abilities = [ability for ability in self.abilities if ability.can_use(self)]
-                    if not available_abilities:
-                        return
-                        
-                    # Get valid targets first
-                    valid_targets = [char for char in GameEngine.instance.stage_manager.player_characters 
-                                   if char.is_alive() and char.is_targetable()]
-                    if not valid_targets:
-                        return
-                        
-                    # Prioritize abilities based on situation
-                    weights = []
-                    for ability in available_abilities:
-                        weight = 1.0
-                        
-                        # High priority for special abilities
-                        if ability.name in ["Fan of Knives", "Death Mark", "Venomous Blade", "Drain Life"]:
-                            if len(valid_targets) > 1:
-                                weight = 2.0  # Higher priority with multiple targets
-                            else:
-                                weight = 1.5  # Still good priority with single target
-                        
-                        weights.append(weight)
-                        
-                    # Choose ability based on weights
-                    ability = random.choices(available_abilities, weights=weights, k=1)[0]
-                    
-                    if ability.auto_self_target:
-                        if ability.use(self, [self]):
-                            self.ability_used_this_turn = True
-                    else:
-                        # Choose a random valid target
-                        target = random.choice(valid_targets)
-                        if ability.use(self, [target]):
-                            self.ability_used_this_turn = True
-                
-                # Bind the update method to the assassin instance
-                import types
-                new_assassin.update = types.MethodType(update, new_assassin)
+                # Spawned assassins favor their special ability over their class profile
+                new_assassin.ai_profile = SPAWNED_ASSASSIN_PROFILE
                 
                 # Add to bosses list
                 self.bosses.append(new_assassin)
@@ -687,11 +483,6 @@ class Stage5(BaseStage):
                 
                 # Update Zasalamel's immunity after spawning
                 update_zasalamel_immunity()
-        
-        # Apply modifier effects at turn end
-        from engine.game_engine import GameEngine
-        if GameEngine.instance and hasattr(GameEngine.instance, 'modifier_manager'):
-            GameEngine.instance.modifier_manager.apply_turn_end(GameEngine.instance)
     
     def update_character_positions(self):
         """Update positions of all characters"""
@@ -755,8 +546,6 @@ class ReptilianAssassin(Character):
             speed=7
         )
         super().__init__("Reptilian Assassin", stats, "assets/characters/reptilian_assassin.png")
-        self.ability_used_this_turn = False
-        self.last_turn_count = -1
         
         shadow_strike = Ability(
             name="Assassin Strike",
@@ -782,8 +571,6 @@ class FemaleAssassin(Character):
             speed=7
         )
         super().__init__("Shadow Assassin Elite", stats, "assets/characters/shadow_assassin_female.png")
-        self.ability_used_this_turn = False
-        self.last_turn_count = -1
         
         shadow_strike = Ability(
             name="Assassin Strike",
@@ -809,8 +596,6 @@ class OctopusAssassin(Character):
             speed=7
         )
         super().__init__("Octopus Assassin", stats, "assets/characters/octopus_assassin.png")
-        self.ability_used_this_turn = False
-        self.last_turn_count = -1
         
         shadow_strike = Ability(
             name="Assassin Strike",
@@ -443,16 +443,6 @@ class Stage6(BaseStage):
         # Update character positions
         self.update_character_positions()
         
-        # Update modifiers
-        if GameEngine.instance and hasattr(GameEngine.instance, 'modifier_manager'):
-            GameEngine.instance.modifier_manager.apply_turn_end(GameEngine.instance)
-            
-        # Update boss abilities cooldowns
-        if self.boss:
-            for ability in self.boss.abilities:
-                if ability.current_cooldown > 0:
-                    ability.current_cooldown -= 1
-        
         # Handle Dark Bubble Prison mechanic
         player_characters = GameEngine.instance.stage_manager.player_characters
         
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from items.loot_table import LootTable
+
+# Statistics only use the class names, no items are created
+class Shard:
+    pass
+
+class Flask:
+    pass
+
+class Blade:
+    pass
+
+def make_table(min_total_drops: int, max_total_drops: int) -> LootTable:
+    table = LootTable(min_total_drops, max_total_drops)
+    table.add_entry(Shard, 70, 1, 3)
+    table.add_entry(Flask, 40, 1, 2)
+    table.add_entry(Blade, 5)
+    table.add_entry(Shard, 20, 2, 2)  # Second entry of the same item is merged
+    return table
+
+def assert_close(simulated: np.ndarray, exact: np.ndarray, tolerance: float):
+    size = max(len(simulated), len(exact))
+    simulated = np.pad(simulated, (0, size - len(simulated)))
+    exact = np.pad(exact, (0, size - len(exact)))
+    np.testing.assert_allclose(simulated, exact, atol=tolerance)
+
+@pytest.mark.parametrize("min_total_drops, max_total_drops", [(0, 10), (0, 2), (2, 3), (3, 3)])
+def test_simulate_matches_exact_stats(min_total_drops, max_total_drops):
+    table = make_table(min_total_drops, max_total_drops)
+    exact = table.exact_stats()
+    simulated = table.simulate(200_000, seed=7)
+
+    assert set(simulated.expected) == set(exact.expected) == {"Shard", "Flask", "Blade"}
+    for name, mean in exact.expected.items():
+        assert simulated.expected[name] == pytest.approx(mean, abs=0.02)
+        assert_close(simulated.distribution[name], exact.distribution[name], 0.005)
+    assert_close(simulated.total_distribution, exact.total_distribution, 0.005)
+
+def test_exact_distributions_sum_to_one():
+    stats = make_table(1, 2).exact_stats()
+    for dist in stats.distribution.values():
+        assert dist.sum() == pytest.approx(1.0)
+    assert stats.total_distribution.sum() == pytest.approx(1.0)
+    assert np.flatnonzero(stats.total_distribution).tolist() == [1, 2]
+
+def test_simulate_needs_a_kill():
+    with pytest.raises(ValueError):
+        make_table(0, 1).simulate(0)
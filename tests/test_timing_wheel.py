@@ -0,0 +1,80 @@
+import pytest
+from abilities import base_ability
+from abilities.base_ability import Ability
+from engine.timing_wheel import TimingWheel
+
+def advance_until_fired(wheel, fired, limit):
+    """Advance the wheel until something fired, return the turn it fired on."""
+    for _ in range(limit):
+        wheel.advance()
+        if fired:
+            return wheel.now
+    return None
+
+@pytest.mark.parametrize("delay", [1, 3, 4, 5, 15, 16, 17, 40, 63, 64, 65, 200])
+def test_fires_on_due_turn_across_levels(delay):
+    # 4 slots and 3 levels: level 0 covers 4 turns, level 1 16, level 2 64, overflow beyond
+    wheel = TimingWheel(slots=4, levels=3)
+    wheel.advance()  # Start off a bucket boundary
+    start = wheel.now
+    fired = []
+    wheel.schedule(delay, lambda: fired.append(wheel.now))
+    assert advance_until_fired(wheel, fired, delay + 70) == start + delay
+    assert fired == [start + delay]
+
+def test_matches_naive_schedule():
+    wheel = TimingWheel(slots=4, levels=2)
+    expected = {}
+    fired = {}
+    for turn in range(100):
+        for delay in (1, turn % 7 + 1, turn * 3 % 50 + 1, 90 - turn % 30):
+            key = (turn, delay)
+            expected[key] = wheel.now + delay
+            wheel.schedule(delay, lambda key=key: fired.__setitem__(key, wheel.now))
+        wheel.advance()
+    for _ in range(200):
+        wheel.advance()
+    assert fired == expected
+
+def test_remaining_counts_down_and_is_zero_after_cancel():
+    wheel = TimingWheel()
+    fired = []
+    timer = wheel.schedule(3, lambda: fired.append(True))
+    assert wheel.remaining(timer) == 3
+    wheel.advance()
+    assert wheel.remaining(timer) == 2
+    timer.cancel()
+    assert wheel.remaining(timer) == 0
+    for _ in range(5):
+        wheel.advance()
+    assert not fired
+    assert wheel.remaining(None) == 0
+
+def test_remaining_is_zero_after_firing():
+    wheel = TimingWheel()
+    timer = wheel.schedule(1)
+    wheel.advance()
+    assert wheel.remaining(timer) == 0
+
+def test_ability_cooldown_rearms_on_increment(monkeypatch):
+    wheel = TimingWheel()
+    monkeypatch.setattr(base_ability, "turn_wheel", wheel)
+    # Cooldowns only need the class, skip loading the icon
+    ability = Ability.__new__(Ability)
+    ready = []
+    ability.on_cooldown_ready = lambda: ready.append(wheel.now)
+
+    ability.current_cooldown = 2
+    wheel.advance()
+    assert ability.current_cooldown == 1
+    ability.current_cooldown += 2
+    assert ability.current_cooldown == 3
+    for _ in range(2):
+        wheel.advance()
+    assert ability.current_cooldown == 1 and not ready
+    wheel.advance()
+    assert ability.current_cooldown == 0
+    assert ready == [4]  # Only the re-armed timer fires
+
+    ability.current_cooldown = 0
+    assert ability._cooldown_timer is None
@@ -0,0 +1,50 @@
+import random
+from collections import Counter
+import pytest
+from engine.weighted_sampling import AliasTable, weighted_sample
+
+def test_alias_table_frequencies_follow_weights():
+    table = AliasTable(["a", "b", "c", "d"], [1, 2, 3, 0])
+    rng = random.Random(1)
+    draws = 60_000
+    counts = Counter(table.sample(rng) for _ in range(draws))
+    assert counts["d"] == 0
+    for item, weight in (("a", 1), ("b", 2), ("c", 3)):
+        assert counts[item] / draws == pytest.approx(weight / 6, abs=0.01)
+
+def test_alias_table_single_item():
+    table = AliasTable(["only"], [0.5])
+    assert len(table) == 1
+    assert table.sample(random.Random(0)) == "only"
+
+@pytest.mark.parametrize("items, weights", [
+    ([], []),
+    (["a"], [1, 2]),
+    (["a", "b"], [0, 0]),
+    (["a", "b"], [1, -1]),
+])
+def test_alias_table_rejects_bad_weights(items, weights):
+    with pytest.raises(ValueError):
+        AliasTable(items, weights)
+
+def test_weighted_sample_distinct_and_skips_zero_weights():
+    rng = random.Random(2)
+    for _ in range(200):
+        picked = weighted_sample(["a", "b", "c", "d"], [5, 1, 0, 2], 3, rng)
+        assert sorted(picked) == ["a", "b", "d"]
+    assert weighted_sample(["a", "b"], [1, 0], 2, rng) == ["a"]
+    assert weighted_sample(["a", "b"], [1, 1], 0, rng) == []
+
+def test_weighted_sample_first_pick_follows_weights():
+    rng = random.Random(3)
+    draws = 30_000
+    first = Counter(weighted_sample(["a", "b", "c"], [1, 3, 6], 2, rng)[0] for _ in range(draws))
+    for item, weight in (("a", 1), ("b", 3), ("c", 6)):
+        assert first[item] / draws == pytest.approx(weight / 10, abs=0.015)
+
+def test_weighted_sample_second_pick_renormalizes():
+    # After "c" (weight 6) is picked first, "b" follows with probability 3 / (1 + 3)
+    rng = random.Random(4)
+    pairs = Counter(tuple(weighted_sample(["a", "b", "c"], [1, 3, 6], 2, rng)) for _ in range(40_000))
+    after_c = pairs[("c", "a")] + pairs[("c", "b")]
+    assert pairs[("c", "b")] / after_c == pytest.approx(0.75, abs=0.015)
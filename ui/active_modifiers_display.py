@@ -1,6 +1,6 @@
 import pygame
 from typing import List
-from modifiers.modifier_base import Modifier
+from modifiers.modifier_base import Modifier, load_modifier_image
 
 class ActiveModifiersDisplay:
     def __init__(self, screen_width: int):
@@ -58,8 +58,7 @@ class ActiveModifiersDisplay:
             # Draw modifier icon or colored rectangle
             if modifier.image_path:
                 try:
-                    image = pygame.image.load(modifier.image_path)
-                    image = pygame.transform.scale(image, (self.ICON_SIZE, self.ICON_SIZE))
+                    image = load_modifier_image(modifier.image_path, (self.ICON_SIZE, self.ICON_SIZE))
                     background.blit(image, icon_pos)
                 except:
                     # Draw colored rectangle if image fails to load
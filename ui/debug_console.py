@@ -38,7 +38,10 @@ class DebugConsole:
             "piranha": self.handle_piranha_command,
             "item": self.handle_single_item_command,
             "turn": self.handle_turn_command,
-            "cooldown": self.handle_cooldown_command
+            "cooldown": self.handle_cooldown_command,
+            "checkpoint": self.handle_checkpoint_command,
+            "hardmode": self.handle_hardmode_command,
+            "profile": self.handle_profile_command
         }
         
         # Console output
@@ -100,6 +103,7 @@ class DebugConsole:
         
         from engine.game_engine import GameEngine
         from characters.shadowfin_boss import Piranha
+        from characters.prototypes import prototypes
         from items.loot_table import LootTable
         from items.consumables import MurkyWaterVial, PiranhaTooth
         from items.buffs import PiranhaScales
@@ -117,7 +121,7 @@ class DebugConsole:
             
             # Create and add piranhas
             for _ in range(num_piranhas):
-                piranha = Piranha()
+                piranha = prototypes.spawn("Piranha")
                 stage.bosses.append(piranha)
             
             self.add_output(f"Spawned {num_piranhas} piranhas")
@@ -215,6 +219,69 @@ class DebugConsole:
         
         return False
     
+    def handle_checkpoint_command(self, args: List[str]) -> bool:
+        """Handle turn checkpoint commands."""
+        if not args or args[0] not in ("undo", "resume", "list"):
+            self.add_output("Usage: checkpoint undo|resume|list")
+            return False
+        
+        from engine.game_engine import GameEngine
+        game_instance = GameEngine.instance
+        if not game_instance or not game_instance.stage_manager.current_stage:
+            return False
+        
+        if args[0] == "undo":
+            if game_instance.undo_last_turn():
+                self.add_output(f"Rewound to turn {game_instance.game_state.turn_count}")
+                return True
+            self.add_output("No checkpoint to undo to")
+            return False
+        
+        if args[0] == "resume":
+            warnings = game_instance.resume_from_checkpoint()
+            for warning in warnings:
+                self.add_output(warning)
+            self.add_output(f"Resumed at turn {game_instance.game_state.turn_count}")
+            return True
+        
+        turns = [str(snapshot.turn_count) for snapshot in game_instance.checkpoints]
+        self.add_output(f"Checkpoints for turns: {', '.join(turns) or 'none'}")
+        return True
+    
+    def handle_hardmode_command(self, args: List[str]) -> bool:
+        """Handle hard mode (lookahead boss planner) toggle."""
+        if not args or args[0] not in ("on", "off"):
+            self.add_output("Usage: hardmode on|off")
+            return False
+        
+        from engine.game_engine import GameEngine
+        if not GameEngine.instance:
+            return False
+        
+        GameEngine.instance.set_hard_mode(args[0] == "on")
+        self.add_output(f"Hard mode {args[0]}")
+        return True
+    
+    def handle_profile_command(self, args: List[str]) -> bool:
+        """Show or reset the time spent in each turn phase."""
+        if not args or args[0] not in ("turn", "reset"):
+            self.add_output("Usage: profile turn|reset")
+            return False
+        
+        from engine.game_engine import GameEngine
+        if not GameEngine.instance:
+            return False
+        
+        pipeline = GameEngine.instance.turn_pipeline
+        if args[0] == "reset":
+            pipeline.reset_timings()
+            self.add_output("Turn phase timings reset")
+            return True
+        
+        for line in pipeline.report():
+            self.add_output(line)
+        return True
+    
     def show_help(self, args: List[str]) -> None:
         """Show available commands and their usage."""
         self.add_output("Available commands:")
@@ -228,6 +295,11 @@ class DebugConsole:
         self.add_output("  item test shadowdagger - Add Shadow Dagger to inventory")
         self.add_output("  turn test <number> - Set turn counter to specified number")
         self.add_output("  cooldown test <number> - Set all ability cooldowns to specified number")
+        self.add_output("  checkpoint undo - Rewind the battle by one turn")
+        self.add_output("  checkpoint resume - Load the last checkpoint written to disk")
+        self.add_output("  checkpoint list - Show the turns kept for undo")
+        self.add_output("  hardmode on|off - Toggle lookahead boss planning")
+        self.add_output("  profile turn|reset - Show or reset time spent per turn phase")
         self.add_output("  help - Show this help message")
         self.add_output("  clear - Clear the console")
     
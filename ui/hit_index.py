@@ -0,0 +1,106 @@
+"""Spatial index of the clickable things on screen.
+
+Widgets register their screen rect under a key (the character or ability itself)
+with a z-order. Rects are bucketed into a uniform grid, so resolving a pointer
+position only tests the few rects sharing its cell instead of every character and
+ability. Rects are refreshed once per frame after drawing, and re-registering an
+unchanged rect is a dict lookup.
+
+The index also remembers the key under the pointer, so hover changes can be pushed
+only to the widget the pointer left and the one it entered.
+"""
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+Rect = Tuple[int, int, int, int]
+
+class HitIndex:
+    """Rects under keys, bucketed into square grid cells.
+
+    Args:
+        cell_size: Side of a grid cell in pixels, around the size of the larger widgets
+    """
+
+    def __init__(self, cell_size: int = 128):
+        self.cell_size = cell_size
+        self.hovered: Optional[Hashable] = None
+        self._rects: Dict[Hashable, Tuple[Rect, int, int]] = {}  # key -> (rect, z, order)
+        self._cells: Dict[Tuple[int, int], List[Hashable]] = {}
+        self._order = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rects
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def _cell_range(self, rect: Rect) -> Iterator[Tuple[int, int]]:
+        x, y, width, height = rect
+        size = self.cell_size
+        for cell_x in range(x // size, (x + max(width, 1) - 1) // size + 1):
+            for cell_y in range(y // size, (y + max(height, 1) - 1) // size + 1):
+                yield cell_x, cell_y
+
+    def update(self, key: Hashable, rect: Rect, z: int = 0):
+        """Register or move the rect of a key. Later keys win ties in z."""
+        rect = tuple(int(value) for value in rect)
+        entry = self._rects.get(key)
+        if entry is not None:
+            if entry[0] == rect and entry[1] == z:
+                return
+            self._unlink(key, entry[0])
+            order = entry[2]
+        else:
+            order = self._order
+            self._order += 1
+        self._rects[key] = (rect, z, order)
+        for cell in self._cell_range(rect):
+            self._cells.setdefault(cell, []).append(key)
+
+    def _unlink(self, key: Hashable, rect: Rect):
+        for cell in self._cell_range(rect):
+            keys = self._cells[cell]
+            keys.remove(key)
+            if not keys:
+                del self._cells[cell]
+
+    def remove(self, key: Hashable):
+        entry = self._rects.pop(key, None)
+        if entry is None:
+            return
+        self._unlink(key, entry[0])
+        if self.hovered is key:
+            self.hovered = None
+
+    def retain(self, keys: Iterable[Hashable]):
+        """Remove every key not in keys, e.g. characters that left the stage."""
+        keep = set(keys)
+        for key in [key for key in self._rects if key not in keep]:
+            self.remove(key)
+
+    def hits(self, pos: Tuple[int, int]) -> List[Hashable]:
+        """Keys whose rect contains pos, topmost first."""
+        px, py = int(pos[0]), int(pos[1])
+        found = []
+        for key in self._cells.get((px // self.cell_size, py // self.cell_size), ()):
+            (x, y, width, height), z, order = self._rects[key]
+            if x <= px < x + width and y <= py < y + height:
+                found.append((z, order, key))
+        found.sort(key=lambda hit: (hit[0], hit[1]), reverse=True)
+        return [key for _, _, key in found]
+
+    def hit(self, pos: Tuple[int, int]) -> Optional[Hashable]:
+        """Topmost key at pos, or None."""
+        hits = self.hits(pos)
+        return hits[0] if hits else None
+
+    def move_pointer(self, pos: Tuple[int, int]) -> Tuple[Optional[Hashable], Optional[Hashable]]:
+        """Move the pointer to pos.
+
+        Returns:
+            tuple: (left, entered) keys, both None if the hovered key didn't change
+        """
+        hovered = self.hit(pos)
+        if hovered is self.hovered:
+            return None, None
+        left, self.hovered = self.hovered, hovered
+        return left, hovered
@@ -1,8 +1,13 @@
 import pygame
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, TYPE_CHECKING
 from items.base_item import Item
+from items.item_registry import cooldown_overlay, item_registry, number_glyph
+from characters.prototypes import get_font
 from characters.base_character import Character
 
+if TYPE_CHECKING:
+    from items.raid_inventory import InventoryChange, RaidInventory
+
 class Inventory:
     # Colors
     BG_COLOR = (32, 36, 44, 240)  # Dark background with slight transparency
@@ -16,20 +21,14 @@ class Inventory:
     # Class-level cache for common surfaces
     _background_cache = {}
     _slot_cache = {}
-    _cooldown_font = None
     
     def __init__(self, x: int, y: int, width: int = 280, height: int = 180):  # Reduced height and width
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(None, 26)  # Slightly larger font
-        self.title_font = pygame.font.Font(None, 32)  # Larger title font
-        if not Inventory._cooldown_font:
-            Inventory._cooldown_font = pygame.font.Font(None, 24)
+        self.font = get_font(26)  # Slightly larger font
+        self.title_font = get_font(32)  # Larger title font
         self.is_dragging = False
         self.drag_offset = (0, 0)
         
-        # Create surfaces
-        self.inventory_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        
         # Get or create cached background
         bg_key = (width, height)
         if bg_key not in Inventory._background_cache:
@@ -49,6 +48,8 @@ class Inventory:
         self.slot_size = 60  # Reduced slot size
         self.slot_padding = 8  # Reduced padding
         self.slots: List[Optional[Item]] = [None] * 6  # Now stores actual Item objects
+        # Rendered slot per index with the (hovered, item, count, cooldown) it shows, see draw
+        self._slot_surfaces: List[Optional[tuple]] = [None] * 6
         
         # Calculate grid layout
         self.grid_start_x = (width - (3 * self.slot_size + 2 * self.slot_padding)) // 2
@@ -60,6 +61,9 @@ class Inventory:
         self.selected_item = None
         self.target_selection_mode = False
         
+        # RaidInventory this inventory mirrors, see bind()
+        self.raid_inventory: Optional["RaidInventory"] = None
+        
         # Get or create cached slot surfaces
         slot_key = self.slot_size
         if slot_key not in Inventory._slot_cache:
@@ -73,6 +77,38 @@ class Inventory:
             
             Inventory._slot_cache[slot_key] = (normal_slot, hover_slot)
     
+    def bind(self, raid_inventory: "RaidInventory"):
+        """Show the items of a RaidInventory and follow its changes slot by slot."""
+        if self.raid_inventory is raid_inventory:
+            return
+        if self.raid_inventory is not None:
+            self.raid_inventory.unsubscribe(self.on_inventory_change)
+        self.raid_inventory = raid_inventory
+        raid_inventory.populate_ui_inventory(self)
+        raid_inventory.subscribe(self.on_inventory_change)
+    
+    def find_item_slot(self, item_name: str) -> Optional[int]:
+        """Get the slot holding an item, None if it isn't in this inventory."""
+        for i, item in enumerate(self.slots):
+            if item is not None and item.name == item_name:
+                return i
+        return None
+    
+    def on_inventory_change(self, change: "InventoryChange"):
+        """Update the slot of an item changed in the bound RaidInventory."""
+        from items.raid_inventory import ITEM_REMOVED, COOLDOWN_CHANGED
+        slot_index = self.find_item_slot(change.item_name)
+        if change.kind == ITEM_REMOVED:
+            if slot_index is not None:
+                self.slots[slot_index] = None
+        elif change.kind == COOLDOWN_CHANGED:
+            if slot_index is not None:
+                self.slots[slot_index].current_cooldown = change.value
+        elif slot_index is not None:
+            self.slots[slot_index].stack_count = change.value
+        elif None in self.slots and change.item_name in item_registry:
+            self.slots[self.slots.index(None)] = item_registry.create(change.item_name, change.value)
+    
     def add_item(self, item: Item) -> bool:
         """Add an item to the inventory. Returns True if successful."""
         # First try to stack with existing items
@@ -239,24 +275,18 @@ class Inventory:
         if self.selected_item.use(user, target):
             print(f"[DEBUG] Item use successful, stack count: {self.selected_item.stack_count}")  # Debug print
             
-            # First remove from RaidInventory if it exists
+            # Remove from RaidInventory, which updates the slots of every bound inventory
             if hasattr(GameEngine.instance, 'raid_inventory'):
                 print(f"[DEBUG] Removing item from RaidInventory")  # Debug print
-                # Remove from RaidInventory and save
                 GameEngine.instance.raid_inventory.remove_item(self.selected_item.name)
-                GameEngine.instance.raid_inventory.save_inventory()
+                GameEngine.instance.raid_inventory.set_cooldown(self.selected_item.name, self.selected_item.current_cooldown)
                 print(f"[DEBUG] RaidInventory updated and saved")  # Debug print
             
-            # Then remove from UI inventory if stack is empty
-            if self.selected_item.stack_count <= 0:
+            # Items that aren't in the RaidInventory (debug console) are removed here
+            if self.selected_item.stack_count <= 0 and self.slots[self.selected_slot] is self.selected_item:
                 print(f"[DEBUG] Stack empty, removing item from slot {self.selected_slot}")  # Debug print
                 self.slots[self.selected_slot] = None
             
-            # Finally sync UI inventory with RaidInventory
-            if hasattr(GameEngine.instance, 'sync_inventory'):
-                GameEngine.instance.sync_inventory()
-                print(f"[DEBUG] UI inventory synced")  # Debug print
-            
             # Reset selection state
             self.selected_item = None
             self.selected_slot = None
@@ -276,10 +306,38 @@ class Inventory:
         if GameEngine.instance:
             GameEngine.instance.game_state.targeting_item = False
     
-    def draw(self, screen: pygame.Surface):
-        # Clear inventory surface
-        self.inventory_surface.fill((0, 0, 0, 0))
+    def _slot_surface(self, i: int) -> pygame.Surface:
+        """Get slot i with its item, count and cooldown drawn, re-rendered only when they change."""
+        item = self.slots[i]
+        key = (i == self.hovered_slot, item, item.stack_count, item.current_cooldown)
+        cached = self._slot_surfaces[i]
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        normal_slot, hover_slot = Inventory._slot_cache[self.slot_size]
+        surface = (hover_slot if key[0] else normal_slot).copy()
+        
+        # Draw item icon centered in the slot
+        icon_x = (self.slot_size - item.icon.get_width()) // 2
+        icon_y = (self.slot_size - item.icon.get_height()) // 2
+        surface.blit(item.icon, (icon_x, icon_y))
         
+        # Draw stack count if greater than 1
+        if item.stack_count > 1:
+            stack_text = number_glyph(item.stack_count)
+            surface.blit(stack_text, stack_text.get_rect(bottomright=(self.slot_size - 3, self.slot_size - 3)))
+        
+        # Draw cooldown overlay and number if item is on cooldown
+        if item.current_cooldown > 0:
+            overlay_size = self.slot_size - 16
+            surface.blit(cooldown_overlay((overlay_size, overlay_size)), (icon_x, icon_y))
+            cooldown_text = number_glyph(item.current_cooldown)
+            surface.blit(cooldown_text, cooldown_text.get_rect(center=(icon_x + overlay_size // 2, icon_y + overlay_size // 2)))
+        
+        self._slot_surfaces[i] = (key, surface)
+        return surface
+    
+    def draw(self, screen: pygame.Surface):
         # Draw background
         screen.blit(self.background, self.rect)
         
@@ -290,7 +348,7 @@ class Inventory:
         # Get cached slot surfaces
         normal_slot, hover_slot = Inventory._slot_cache[self.slot_size]
         
-        # Draw inventory slots
+        # Draw inventory slots, one blit each
         for i in range(6):
             row = i // 3
             col = i % 3
@@ -298,58 +356,20 @@ class Inventory:
             slot_x = self.rect.x + self.grid_start_x + col * (self.slot_size + self.slot_padding)
             slot_y = self.rect.y + self.grid_start_y + row * (self.slot_size + self.slot_padding)
             
-            # Draw slot background
-            if i == self.hovered_slot:
-                screen.blit(hover_slot, (slot_x, slot_y))
-            else:
-                screen.blit(normal_slot, (slot_x, slot_y))
+            item = self.slots[i]
+            if item is None:
+                self._slot_surfaces[i] = None
+                screen.blit(hover_slot if i == self.hovered_slot else normal_slot, (slot_x, slot_y))
+                continue
             
-            # Draw item icon if slot is not empty
-            if self.slots[i]:
-                # Calculate icon position (centered in slot)
-                icon_x = slot_x + (self.slot_size - self.slots[i].icon.get_width()) // 2
-                icon_y = slot_y + (self.slot_size - self.slots[i].icon.get_height()) // 2
-                
-                # Update item position for tooltip
-                self.slots[i].position = (icon_x, icon_y)
-                
-                # Draw item icon
-                screen.blit(self.slots[i].icon, (icon_x, icon_y))
-                
-                # Draw stack count if greater than 1
-                if self.slots[i].stack_count > 1:
-                    # Create stack count text with shadow
-                    stack_text = str(self.slots[i].stack_count)
-                    # Draw shadow
-                    stack_shadow = Inventory._cooldown_font.render(stack_text, True, (0, 0, 0))
-                    shadow_rect = stack_shadow.get_rect(bottomright=(slot_x + self.slot_size - 3, slot_y + self.slot_size - 3))
-                    screen.blit(stack_shadow, shadow_rect)
-                    # Draw text
-                    stack_surface = Inventory._cooldown_font.render(stack_text, True, (255, 255, 255))
-                    text_rect = stack_surface.get_rect(bottomright=(slot_x + self.slot_size - 4, slot_y + self.slot_size - 4))
-                    screen.blit(stack_surface, text_rect)
-                
-                # Draw cooldown overlay if item is on cooldown
-                if self.slots[i].current_cooldown > 0:
-                    # Create semi-transparent black overlay
-                    cooldown_surface = pygame.Surface((self.slot_size - 16, self.slot_size - 16), pygame.SRCALPHA)
-                    cooldown_surface.fill((0, 0, 0, 128))  # Semi-transparent black
-                    screen.blit(cooldown_surface, (icon_x, icon_y))
-                    
-                    # Draw cooldown number
-                    cooldown_text = str(self.slots[i].current_cooldown)
-                    # Draw shadow
-                    cooldown_shadow = Inventory._cooldown_font.render(cooldown_text, True, (0, 0, 0))
-                    shadow_rect = cooldown_shadow.get_rect(center=(icon_x + (self.slot_size - 16) // 2 + 1, icon_y + (self.slot_size - 16) // 2 + 1))
-                    screen.blit(cooldown_shadow, shadow_rect)
-                    # Draw text
-                    cooldown_surface = Inventory._cooldown_font.render(cooldown_text, True, (255, 255, 255))
-                    text_rect = cooldown_surface.get_rect(center=(icon_x + (self.slot_size - 16) // 2, icon_y + (self.slot_size - 16) // 2))
-                    screen.blit(cooldown_surface, text_rect)
-                
-                # Draw tooltip if item is hovered
-                if i == self.hovered_slot:
-                    self.slots[i].is_hovered = True
-                    self.slots[i].draw_tooltip(screen)
-                else:
-                    self.slots[i].is_hovered = False 
\ No newline at end of file
+            screen.blit(self._slot_surface(i), (slot_x, slot_y))
+            
+            # Update item position for tooltip
+            item.position = (slot_x + (self.slot_size - item.icon.get_width()) // 2,
+                             slot_y + (self.slot_size - item.icon.get_height()) // 2)
+            item.is_hovered = i == self.hovered_slot
+        
+        # Draw tooltip of the hovered item above all slots
+        if self.hovered_slot is not None and self.slots[self.hovered_slot]:
+            self.slots[self.hovered_slot].draw_tooltip(screen)
+ 
\ No newline at end of file
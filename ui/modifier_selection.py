@@ -1,6 +1,6 @@
 import pygame
 from typing import List, Optional, Callable
-from modifiers.modifier_base import Modifier
+from modifiers.modifier_base import Modifier, load_modifier_image
 from ui.button import Button
 
 class ModifierSelectionWindow:
@@ -257,8 +257,7 @@ class ModifierSelectionWindow:
                     image_y = y + 120  # Move image up a bit
                     if modifier.image_path:
                         try:
-                            image = pygame.image.load(modifier.image_path)
-                            image = pygame.transform.scale(image, (200, 200))  # Larger image
+                            image = load_modifier_image(modifier.image_path, (200, 200))  # Larger image
                             image_rect = image.get_rect(centerx=x + self.card_width//2, y=image_y)
                             window_surface.blit(image, image_rect)
                         except:
@@ -0,0 +1,60 @@
+"""Measure DatabaseService save/load throughput against the in-memory backend.
+
+Usage:
+    python utils/benchmark_persistence.py [--ops 1000] [--latency 0.0] [--failure-rate 0.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database_service import DatabaseService
+from services.storage_backend import InMemoryBackend, BackendUnavailableError
+
+def sample_inventory(i: int) -> dict:
+    """Build a RaidInventory document shaped like the real one."""
+    return {
+        "RaidInventory": {
+            "items": {"Murky Water Vial": i % 7 + 1, "Piranha Scales": 2, "Ice Shard": 1},
+            "currencies": {"cm": 1000 + i, "fm": 200},
+            "active_modifiers": {"atlantean_raid_stage1": ["HealingWave", "VialCarrier"]}
+        }
+    }
+
+def run(label: str, func, ops: int):
+    failures = 0
+    start = time.perf_counter()
+    for i in range(ops):
+        try:
+            func(i)
+        except BackendUnavailableError:
+            failures += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<18} {ops / elapsed:>12.0f} ops/s  ({elapsed * 1000:.1f} ms, {failures} failures)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated round trip in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    backend = InMemoryBackend(
+        data={"users": {"bench_user": {"username": "bench"}}},
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        seed=0
+    )
+    service = DatabaseService(backend=backend, user_id="bench_user")
+
+    run("save_player_data", lambda i: service.save_player_data("bench", sample_inventory(i)), args.ops)
+    run("get_player_data", lambda i: service.get_player_data("bench"), args.ops)
+    run("save_game_state", lambda i: service.save_game_state("bench", {"turn": i}), args.ops)
+    run("update_high_scores", lambda i: service.update_high_scores("bench", i), args.ops)
+    run("get_high_scores", lambda i: service.get_high_scores(), args.ops)
+    print(f"Backend operations: {backend.operation_counts}")
+
+if __name__ == "__main__":
+    main()